@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark JSON codecs on large /api/executions responses
+
+Encodes and decodes an HttpExecutionsResponse payload with every codec
+that is installed (stdlib json, orjson, msgspec), and also times the full
+decode + HttpExecutionsResponse.from_dict path used by iter_executions and
+ConditionalCache (see src/clients/generated_calls.py).
+
+Usage:
+    python benchmarks/bench_codec.py [--executions 5000] [--repeat 20]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.clients.codec import CODECS, select_codec
+from src.clients.generated._client.models import HttpExecutionsResponse
+
+
+def make_payload(executions: int) -> Dict[str, Any]:
+    """An /api/executions response with ``executions`` realistic items"""
+    return {
+        "success": True,
+        "data": {
+            "page": 1,
+            "limit": executions,
+            "total_count": executions,
+            "executions": [
+                {
+                    "execution_id": f"exec-{i:06d}",
+                    "task_id": f"task-{i % 97:04d}",
+                    "status": ("running", "completed", "failed")[i % 3],
+                    "session_id": f"session-{i:08x}",
+                    "trigger_type": "comment",
+                    "sandbox_type": "docker",
+                    "worktree_path": f"/workspace/worktrees/task-{i % 97:04d}/exec-{i:06d}",
+                    "commit_sha": f"{i:040x}",
+                    "comment_id": 100000 + i,
+                    "confidence_level": i % 5,
+                    "confidence_reason": "Tests pass and the change is limited to one module",
+                    "cost_usd": round(i * 0.0137, 4),
+                    "raw_output": "Step output line\n" * 8,
+                    "started_at": "2024-05-01T12:00:00Z",
+                    "completed_at": "2024-05-01T12:30:00Z"
+                }
+                for i in range(executions)
+            ]
+        }
+    }
+
+
+def timed(fn: Callable[[], Any], repeat: int) -> List[float]:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--executions", type=int, default=5000, help="Executions in the payload")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per measurement")
+    args = parser.parse_args()
+    
+    payload = make_payload(args.executions)
+    body = select_codec("json").dumps(payload)
+    print(f"Payload: {args.executions} executions, {len(body) / 1024 / 1024:.1f} MiB, {args.repeat} runs (median ms)\n")
+    print(f"{'codec':<10}{'encode':>10}{'decode':>10}{'decode+model':>14}")
+    
+    def measure(name: str):
+        codec = select_codec(name)
+        return (
+            statistics.median(timed(lambda: codec.dumps(payload), args.repeat)),
+            statistics.median(timed(lambda: codec.loads(body), args.repeat)),
+            statistics.median(timed(lambda: HttpExecutionsResponse.from_dict(codec.loads(body)), args.repeat))
+        )
+    
+    baseline = measure("json")
+    for name in CODECS:
+        try:
+            encode, decode, parse = baseline if name == "json" else measure(name)
+        except ImportError:
+            print(f"{name:<10}{'not installed':>34}")
+            continue
+        line = f"{name:<10}{encode:>10.2f}{decode:>10.2f}{parse:>14.2f}"
+        if name != "json":
+            line += f"   ({baseline[0] / encode:.1f}x / {baseline[1] / decode:.1f}x / {baseline[2] / parse:.1f}x vs json)"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Benchmark MCP server cold start: time to first tool response
+
+Each iteration launches task_manager_mcp.py over stdio against the mock
+client (USE_MOCK_CLIENT=true), performs the MCP initialize handshake and
+calls create_step, recording wall time for each phase:
+
+- interpreter: process spawn until the interpreter runs the first line
+- imports: `import server` (fastmcp, tool definitions)
+- fastmcp_setup: server start-up until the initialize response arrives
+- first_tool: notifications/initialized + create_step until its response
+- total: process spawn until the create_step response
+
+Usage:
+    python benchmarks/bench_cold_start.py [--iterations 20] [--output cold_start.json]
+"""
+
+import argparse
+import json
+import math
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+project_root = Path(__file__).parent.parent
+server_script = project_root / "task_manager_mcp.py"
+
+PHASES = ("interpreter", "imports", "fastmcp_setup", "first_tool", "total")
+
+# Runs task_manager_mcp.py as __main__, reporting when the interpreter started
+# and when `import server` finished on stderr
+BOOTSTRAP = """
+import json, sys, time
+started = time.time()
+sys.path.insert(0, {src!r})
+sys.path.insert(0, {root!r})
+import server
+imported = time.time()
+sys.stderr.write("BENCH " + json.dumps({{"started": started, "imported": imported}}) + "\\n")
+sys.stderr.flush()
+import runpy
+sys.argv = [{script!r}]
+runpy.run_path({script!r}, run_name="__main__")
+"""
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile"""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+class ServerProcess:
+    """A task_manager_mcp.py subprocess spoken to with newline-delimited JSON-RPC"""
+    
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        self.bench: Optional[Dict[str, float]] = None
+        self.bench_ready = threading.Event()
+        env = {**os.environ, "USE_MOCK_CLIENT": "true", "PYTHONUNBUFFERED": "1"}
+        self.spawned = time.time()
+        bootstrap = BOOTSTRAP.format(src=str(project_root / "src"), root=str(project_root), script=str(server_script))
+        self.proc = subprocess.Popen(
+            [sys.executable, "-c", bootstrap],
+            cwd=project_root,
+            env=env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1
+        )
+        threading.Thread(target=self._read_stderr, daemon=True).start()
+    
+    def _read_stderr(self) -> None:
+        for line in self.proc.stderr:
+            if line.startswith("BENCH "):
+                self.bench = json.loads(line[len("BENCH "):])
+                self.bench_ready.set()
+        self.bench_ready.set()
+    
+    def send(self, message: Dict[str, Any]) -> None:
+        self.proc.stdin.write(json.dumps(message) + "\n")
+        self.proc.stdin.flush()
+    
+    def receive(self, request_id: int) -> Dict[str, Any]:
+        """Read messages until the response to ``request_id``"""
+        deadline = time.monotonic() + self.timeout
+        while time.monotonic() < deadline:
+            line = self.proc.stdout.readline()
+            if not line:
+                raise RuntimeError(f"Server exited with code {self.proc.wait()}")
+            message = json.loads(line)
+            if message.get("id") == request_id:
+                if "error" in message:
+                    raise RuntimeError(f"Request {request_id} failed: {message['error']}")
+                return message
+        raise TimeoutError(f"No response to request {request_id} within {self.timeout}s")
+    
+    def close(self) -> None:
+        try:
+            self.proc.stdin.close()
+            self.proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+            self.proc.wait()
+
+
+def run_once(timeout: float) -> Dict[str, float]:
+    """Launch the server once and return the seconds spent in each phase"""
+    server = ServerProcess(timeout)
+    try:
+        server.send({
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "initialize",
+            "params": {
+                "protocolVersion": "2025-06-18",
+                "capabilities": {},
+                "clientInfo": {"name": "bench_cold_start", "version": "1.0"}
+            }
+        })
+        server.receive(1)
+        initialized = time.time()
+        
+        server.send({"jsonrpc": "2.0", "method": "notifications/initialized"})
+        server.send({
+            "jsonrpc": "2.0",
+            "id": 2,
+            "method": "tools/call",
+            "params": {"name": "create_step", "arguments": {"execution_id": "bench", "step_name": "cold-start"}}
+        })
+        response = server.receive(2)
+        finished = time.time()
+        if response["result"].get("isError"):
+            raise RuntimeError(f"create_step failed: {response['result']}")
+        
+        server.bench_ready.wait(timeout)
+        if server.bench is None:
+            raise RuntimeError("The server did not report its start-up timestamps")
+        return {
+            "interpreter": server.bench["started"] - server.spawned,
+            "imports": server.bench["imported"] - server.bench["started"],
+            "fastmcp_setup": initialized - server.bench["imported"],
+            "first_tool": finished - initialized,
+            "total": finished - server.spawned
+        }
+    finally:
+        server.close()
+
+
+def summarize(runs: List[Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    """Percentiles (milliseconds) of each phase across runs"""
+    summary = {}
+    for phase in PHASES:
+        values = [run[phase] * 1000 for run in runs]
+        summary[phase] = {
+            "min": round(min(values), 2),
+            "p50": round(percentile(values, 0.5), 2),
+            "p90": round(percentile(values, 0.9), 2),
+            "p99": round(percentile(values, 0.99), 2),
+            "max": round(max(values), 2),
+            "mean": round(statistics.mean(values), 2)
+        }
+    return summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20, help="Server launches to time")
+    parser.add_argument("--timeout", type=float, default=60, help="Seconds to wait for each response")
+    parser.add_argument("--output", default="cold_start.json", help="Where to write the JSON results")
+    args = parser.parse_args()
+    
+    runs = []
+    for i in range(args.iterations):
+        runs.append(run_once(args.timeout))
+        print(f"\r{i + 1}/{args.iterations} launches", end="", file=sys.stderr, flush=True)
+    print(file=sys.stderr)
+    
+    summary = summarize(runs)
+    print(f"{'phase':<15}" + "".join(f"{k:>10}" for k in ("min", "p50", "p90", "p99", "max")) + "   (ms)")
+    for phase in PHASES:
+        print(f"{phase:<15}" + "".join(f"{summary[phase][k]:>10.1f}" for k in ("min", "p50", "p90", "p99", "max")))
+    
+    results = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "iterations": args.iterations,
+        "summary_ms": summary,
+        "runs_seconds": runs
+    }
+    Path(args.output).write_text(json.dumps(results, indent=2))
+    print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
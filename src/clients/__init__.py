@@ -1,11 +1,54 @@
-from .base_client import TaskManagerClientBase
-from .mock_client import MockTaskManagerClient
-from .http_client import HttpTaskManagerClient
-from .client_factory import create_task_manager_client
-
-__all__ = [
-    'TaskManagerClientBase',
-    'HttpTaskManagerClient', 
-    'MockTaskManagerClient',
-    'create_task_manager_client'
-]
\ No newline at end of file
+"""
+Task Manager clients
+
+Names are imported from their modules on first access, so importing this
+package (or one light module in it) does not load httpx, the generated
+client or client implementations that are never used.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .base_client import TaskManagerClientBase, AsyncTaskManagerClientBase
+    from .mock_client import MockTaskManagerClient, AsyncMockTaskManagerClient
+    from .http_client import HttpTaskManagerClient
+    from .async_http_client import AsyncHttpTaskManagerClient
+    from .write_behind import WriteBehindTaskManagerClient
+    from .spool import SpoolFile, SpoolingTaskManagerClient
+    from .dashboard import DashboardSampler
+    from .pagination import iter_executions, aiter_executions
+    from .client_factory import create_task_manager_client, create_async_task_manager_client, create_api_client
+
+_EXPORTS = {
+    'TaskManagerClientBase': '.base_client',
+    'AsyncTaskManagerClientBase': '.base_client',
+    'HttpTaskManagerClient': '.http_client',
+    'AsyncHttpTaskManagerClient': '.async_http_client',
+    'MockTaskManagerClient': '.mock_client',
+    'AsyncMockTaskManagerClient': '.mock_client',
+    'WriteBehindTaskManagerClient': '.write_behind',
+    'SpoolFile': '.spool',
+    'SpoolingTaskManagerClient': '.spool',
+    'DashboardSampler': '.dashboard',
+    'create_task_manager_client': '.client_factory',
+    'create_async_task_manager_client': '.client_factory',
+    'create_api_client': '.client_factory',
+    'iter_executions': '.pagination',
+    'aiter_executions': '.pagination'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Cache of active-execution lookups per task, including negative results
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple, Union
+
+from src.clients.generated._client.models import HttpExecutionInfo
+from src.clients.generated._client.types import Unset
+
+
+class _Missing:
+    """Marker for a task with no usable cache entry"""
+    
+    def __repr__(self) -> str:
+        return "MISSING"
+
+
+MISSING = _Missing()
+
+
+class ActiveExecutionCache:
+    """LRU cache of /api/tasks/{task_id}/active-execution results
+    
+    A task's active execution is kept for ``ttl`` seconds; the answer
+    "no active execution" is kept for ``negative_ttl`` seconds, so tasks
+    that are polled until work starts do not hit the backend every time.
+    Local writes invalidate entries through ``invalidate_execution``.
+    """
+    
+    def __init__(self, max_entries: int = 256, ttl: float = 5.0, negative_ttl: float = 2.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[Optional[HttpExecutionInfo], float]]" = OrderedDict()
+        self._tasks_by_execution: Dict[str, str] = {}
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    @staticmethod
+    def _execution_id(execution: Optional[HttpExecutionInfo]) -> Optional[str]:
+        if execution is None or isinstance(execution.execution_id, Unset):
+            return None
+        return execution.execution_id
+    
+    def _drop(self, task_id: str) -> None:
+        execution, _ = self._entries.pop(task_id)
+        execution_id = self._execution_id(execution)
+        if execution_id is not None and self._tasks_by_execution.get(execution_id) == task_id:
+            del self._tasks_by_execution[execution_id]
+    
+    def get(self, task_id: str) -> Union[Optional[HttpExecutionInfo], _Missing]:
+        """Cached active execution, None if cached as absent, or MISSING"""
+        with self._lock:
+            entry = self._entries.get(task_id)
+            if entry is None or time.monotonic() >= entry[1]:
+                if entry is not None:
+                    self._drop(task_id)
+                self.misses += 1
+                return MISSING
+            self._entries.move_to_end(task_id)
+            self.hits += 1
+            return entry[0]
+    
+    def put(self, task_id: str, execution: Optional[HttpExecutionInfo]) -> None:
+        """Cache a task's active execution, or None when it has none"""
+        ttl = self.ttl if execution is not None else self.negative_ttl
+        if ttl <= 0:
+            return
+        with self._lock:
+            if task_id in self._entries:
+                self._drop(task_id)
+            self._entries[task_id] = (execution, time.monotonic() + ttl)
+            execution_id = self._execution_id(execution)
+            if execution_id is not None:
+                self._tasks_by_execution[execution_id] = task_id
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+    
+    def invalidate_task(self, task_id: str) -> None:
+        """Forget the lookup for one task"""
+        with self._lock:
+            if task_id in self._entries:
+                self._drop(task_id)
+    
+    def invalidate_execution(self, execution_id: str) -> None:
+        """Forget entries a write to this execution may have made stale
+        
+        The task cached with this execution is dropped. A write to an
+        execution the cache does not know may belong to a task cached as
+        having no active execution, so negative entries are dropped too.
+        """
+        with self._lock:
+            task_id = self._tasks_by_execution.get(execution_id)
+            if task_id is not None:
+                self._drop(task_id)
+                return
+            for task_id in [t for t, (execution, _) in self._entries.items() if execution is None]:
+                self._drop(task_id)
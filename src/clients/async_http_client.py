@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+Async HTTP client implementation for Task Manager API
+"""
+
+import asyncio
+import socket
+import time
+from typing import Dict, Any, Optional, List
+import httpx
+
+from src.clients.base_client import AsyncTaskManagerClientBase
+from src.clients.http_common import HttpClientMixin, DASHBOARD_HEALTH_PATH, HEALTH_PATH, IDEMPOTENCY_HEADER, new_idempotency_key
+from src.clients.singleflight import AsyncSingleFlight
+
+
+class AsyncHttpTaskManagerClient(HttpClientMixin, AsyncTaskManagerClientBase):
+    """Async HTTP implementation for Task Manager API built on httpx.AsyncClient
+    
+    Requests never block the event loop, so concurrent tool calls overlap
+    while sharing one pooled connection set.
+    """
+    
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self._load_config()
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._flight = AsyncSingleFlight()
+        self._client_lock = asyncio.Lock()
+        self._health_refresh_task: Optional[asyncio.Task] = None
+    
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared pooled client, creating it on first use"""
+        if self._client is None:
+            async with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.AsyncClient(
+                        base_url=self.base_url,
+                        timeout=self.timeout,
+                        limits=self._limits(),
+                        transport=self._transport
+                    )
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close pooled connections. The client reconnects if used again."""
+        if self._health_refresh_task is not None:
+            self._health_refresh_task.cancel()
+            try:
+                await self._health_refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._health_refresh_task = None
+        async with self._client_lock:
+            if self._client is not None:
+                await self._client.aclose()
+                self._client = None
+    
+    async def warm_up(self) -> Dict[str, Any]:
+        """Resolve the host and open pooled keep-alive connections ahead of the first call
+        
+        Sends TASK_MANAGER_WARMUP_CONNECTIONS concurrent /api/health probes
+        (at most the keep-alive limit) so each opens its own connection,
+        which then stays in the pool. A healthy answer also seeds the
+        health_check cache and the endpoint's latency history.
+        """
+        started = time.monotonic()
+        try:
+            await asyncio.get_running_loop().getaddrinfo(self.host, self.port, type=socket.SOCK_STREAM)
+        except OSError as e:
+            return {
+                "success": False,
+                "error": f"Cannot resolve Task Manager host {self.host}: {e}",
+                "error_type": "connection"
+            }
+        client = await self._get_client()
+        endpoint = f"GET {HEALTH_PATH}"
+        timeout = self._request_timeout(endpoint)
+        
+        async def probe() -> Optional[httpx.Response]:
+            probe_started = time.monotonic()
+            try:
+                response = await client.get(HEALTH_PATH, timeout=timeout)
+            except Exception as e:
+                self._record_outcome(HEALTH_PATH, endpoint, time.monotonic() - probe_started, exc=e)
+                return None
+            self._record_outcome(HEALTH_PATH, endpoint, time.monotonic() - probe_started, status_code=response.status_code)
+            return response
+        
+        count = max(1, min(self.warmup_connections, self.max_keepalive_connections))
+        responses = [r for r in await asyncio.gather(*(probe() for _ in range(count))) if r is not None]
+        healthy = [r for r in responses if r.status_code < 400]
+        if healthy:
+            self._store_health(self._handle_response("GET", HEALTH_PATH, healthy[0]))
+        return {
+            "success": bool(healthy),
+            "connections": len(responses),
+            "seconds": round(time.monotonic() - started, 3)
+        }
+    
+    async def __aenter__(self) -> "AsyncHttpTaskManagerClient":
+        return self
+    
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+    
+    async def _make_request(
+        self,
+        method: str,
+        path: str,
+        json_data: Optional[Dict] = None,
+        headers: Optional[Dict[str, str]] = None,
+        idempotent: Optional[bool] = None,
+        endpoint: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Make HTTP request and handle response
+        
+        ``endpoint`` names the route template (e.g. "PATCH
+        /api/executions/{execution_id}") whose observed latency sets the
+        timeout; it defaults to the method and literal path.
+        
+        Concurrent identical GETs (same path and params) share a single
+        in-flight request and its result.
+        """
+        endpoint = endpoint or f"{method} {path}"
+        if self.singleflight and method.upper() == "GET":
+            key = self._flight_key(method, path, params)
+            return self._copy_result(await self._flight.do(
+                key,
+                lambda: self._request_with_retries(method, path, json_data, headers, idempotent, endpoint, params)
+            ))
+        return await self._request_with_retries(method, path, json_data, headers, idempotent, endpoint, params)
+    
+    async def _request_with_retries(
+        self,
+        method: str,
+        path: str,
+        json_data: Optional[Dict],
+        headers: Optional[Dict[str, str]],
+        idempotent: Optional[bool],
+        endpoint: str,
+        params: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Send a request with retries and circuit breaking
+        
+        Idempotent requests (by method, Idempotency-Key header or the
+        idempotent flag) are retried on transient failures with
+        exponential backoff and full jitter. While the circuit breaker is
+        open, calls other than health checks fail fast.
+        """
+        retryable = self._is_retryable_request(method, headers, idempotent)
+        self.retry_budget.record_request()
+        attempt = 0
+        while True:
+            attempt += 1
+            if path != HEALTH_PATH and not await self._breaker_allows():
+                return self._with_attempts(self._circuit_open_result(), attempt - 1)
+            timeout = self._request_timeout(endpoint)
+            started = time.monotonic()
+            try:
+                response = await self._send(method, path, json_data, headers, timeout, endpoint, params)
+            except Exception as e:
+                self._record_outcome(path, endpoint, time.monotonic() - started, exc=e)
+                delay = self._retry_delay(attempt, exc=e) if retryable else None
+                if delay is None:
+                    return self._with_attempts(self._handle_exception(e, timeout), attempt)
+            else:
+                self._record_outcome(path, endpoint, time.monotonic() - started, status_code=response.status_code)
+                delay = self._retry_delay(attempt, status_code=response.status_code) if retryable else None
+                if delay is None:
+                    # Decoding errors are reported but not recorded as a second outcome
+                    try:
+                        result = self._handle_response(method, path, response)
+                    except Exception as e:
+                        result = self._handle_exception(e, timeout)
+                    return self._with_attempts(result, attempt)
+            await asyncio.sleep(delay)
+    
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        json_data: Optional[Dict],
+        headers: Optional[Dict[str, str]],
+        timeout: httpx.Timeout,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> httpx.Response:
+        """Send one attempt, hedging slow reads with a second request
+        
+        If a hedgeable read has not answered by its endpoint's p95 latency,
+        a second identical request is sent (budget permitting) and the first
+        successful response wins; the other request is cancelled.
+        """
+        client = await self._get_client()
+        content, headers = self._encode_body(json_data, headers)
+        hedge_delay = self._hedge_delay(method, endpoint)
+        if hedge_delay is None:
+            return await client.request(
+                method=method, url=path, content=content, headers=headers, params=params, timeout=timeout
+            )
+        
+        def submit() -> asyncio.Future:
+            return asyncio.ensure_future(
+                client.request(method=method, url=path, content=content, headers=headers, params=params, timeout=timeout)
+            )
+        
+        tasks: List[asyncio.Future] = [submit()]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=hedge_delay)
+            if not done and self.hedge_budget.try_acquire():
+                tasks.append(submit())
+            error: Optional[BaseException] = None
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    return await next_done
+                except Exception as e:
+                    error = e
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    async def _breaker_allows(self) -> bool:
+        """Whether the breaker lets a call through, probing health when half-open"""
+        if self.breaker.allow_request():
+            return True
+        if self.breaker.try_start_probe():
+            # A single attempt: no singleflight, retries or retry budget
+            endpoint = f"GET {HEALTH_PATH}"
+            started = time.monotonic()
+            try:
+                response = await self._send("GET", HEALTH_PATH, None, None, self._request_timeout(endpoint), endpoint)
+            except Exception as e:
+                self._record_outcome(HEALTH_PATH, endpoint, time.monotonic() - started, exc=e)
+            else:
+                self._record_outcome(HEALTH_PATH, endpoint, time.monotonic() - started, status_code=response.status_code)
+            finally:
+                self.breaker.end_probe()
+        return self.breaker.allow_request()
+    
+    async def patch_execution(
+        self,
+        execution_id: str,
+        session_id: str
+    ) -> Dict[str, Any]:
+        """Update execution's session_id (skipped when it is already set)"""
+        body = {"session_id": session_id}
+        skipped = self._skipped_execution_patch(execution_id, body)
+        if skipped is not None:
+            return skipped
+        result = await self._make_request(
+            "PATCH",
+            f"/api/executions/{execution_id}",
+            json_data=body,
+            idempotent=True,
+            endpoint="PATCH /api/executions/{execution_id}"
+        )
+        return self._after_execution_patch(execution_id, body, result)
+    
+    async def create_step(
+        self,
+        execution_id: str,
+        step_name: str,
+        message: Optional[str] = None,
+        status: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+        step_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Create a new step for an execution
+        
+        The idempotency key is sent as a header so the backend can
+        deduplicate retries of the same logical step. A client-allocated
+        step_id doubles as the key when none is given.
+        """
+        body = self._create_step_body(step_name, message, status, step_id)
+        result = await self._make_request(
+            "POST",
+            f"/api/executions/{execution_id}/steps",
+            json_data=body,
+            headers={IDEMPOTENCY_HEADER: idempotency_key or step_id or new_idempotency_key()},
+            endpoint="POST /api/executions/{execution_id}/steps"
+        )
+        return self._after_step_write(execution_id, step_id, body, result)
+    
+    async def patch_step(
+        self,
+        execution_id: str,
+        step_id: str,
+        status: Optional[str] = None,
+        message: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Partially update a step
+        
+        Nothing is sent when the step already has the requested status and
+        message as last acknowledged; the result then has "skipped".
+        """
+        body = self._patch_step_body(status, message)
+        if not body:
+            return {"success": False, "error": "No fields to update"}
+        skipped = self._skipped_step_patch(execution_id, step_id, body)
+        if skipped is not None:
+            return skipped
+        
+        result = await self._make_request(
+            "PATCH",
+            f"/api/executions/{execution_id}/steps/{step_id}",
+            json_data=body,
+            # Patches assign absolute field values, so repeating one is harmless
+            idempotent=True,
+            endpoint="PATCH /api/executions/{execution_id}/steps/{step_id}"
+        )
+        return self._after_step_write(execution_id, step_id, body, result)
+    
+    async def get_task(self, task_id: str, use_cache: bool = True) -> Dict[str, Any]:
+        """Get task information, served from the task cache when fresh"""
+        cached = self._cached_task(task_id, use_cache)
+        if cached is not None:
+            return cached
+        result = await self._make_request(
+            "GET",
+            f"/api/tasks/{task_id}",
+            endpoint="GET /api/tasks/{task_id}"
+        )
+        return self._task_result(task_id, result)
+    
+    async def get_active_execution(self, task_id: str, use_cache: bool = True) -> Dict[str, Any]:
+        """Get a task's running execution, served from the lookup cache when fresh"""
+        cached = self._cached_active_execution(task_id, use_cache)
+        if cached is not None:
+            return cached
+        result = await self._make_request(
+            "GET",
+            f"/api/tasks/{task_id}/active-execution",
+            endpoint="GET /api/tasks/{task_id}/active-execution"
+        )
+        return self._active_execution_result(task_id, result)
+    
+    async def tail_logs(self, cursor: Optional[str] = None, max_lines: int = 100) -> Dict[str, Any]:
+        """Service log lines added since the cursor (the last returned one by default)"""
+        try:
+            cursor, params = self._log_params(cursor, max_lines)
+        except ValueError as e:
+            return {"success": False, "error": str(e)}
+        result = await self._make_request("GET", "/api/logs", endpoint="GET /api/logs", params=params)
+        return self._tail_result(cursor, result)
+    
+    async def dashboard_health(self) -> Dict[str, Any]:
+        """Get a point sample of service CPU, memory and API latency"""
+        return self._dashboard_result(await self._make_request("GET", DASHBOARD_HEALTH_PATH))
+    
+    async def health_check(self) -> Dict[str, Any]:
+        """Health check
+        
+        Results are cached for TASK_MANAGER_HEALTH_CACHE_TTL seconds. An
+        expired result is still returned immediately while a background
+        task refreshes it.
+        """
+        state = self._health_cache_state()
+        if state == "miss":
+            self._store_health(await self._make_request("GET", HEALTH_PATH))
+        elif state == "stale" and self._claim_health_refresh():
+            self._health_refresh_task = asyncio.get_running_loop().create_task(self._refresh_health())
+        return self._cached_health()
+    
+    async def _refresh_health(self) -> None:
+        result = None
+        try:
+            result = await self._make_request("GET", HEALTH_PATH)
+        finally:
+            self._finish_health_refresh(result)
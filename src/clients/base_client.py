@@ -4,7 +4,7 @@ Base client interface for Task Manager clients
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 
 
 class TaskManagerClientBase(ABC):
@@ -33,7 +33,9 @@ class TaskManagerClientBase(ABC):
         execution_id: str, 
         step_name: str,
         message: Optional[str] = None,
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+        step_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """Create a new step for an execution
         
@@ -42,6 +44,9 @@ class TaskManagerClientBase(ABC):
             step_name: Name of the step
             message: Optional message for the step
             status: Optional initial status (default: "running")
+            idempotency_key: Key identifying this logical step creation; retries
+                with the same key return the original step (generated if omitted)
+            step_id: Optional client-allocated step ID (see step_ids.new_step_id)
             
         Returns:
             Dict with 'success' bool and step data or 'error'
@@ -69,6 +74,58 @@ class TaskManagerClientBase(ABC):
         """
         pass
     
+    @abstractmethod
+    def get_task(self, task_id: str, use_cache: bool = True) -> Dict[str, Any]:
+        """Get task information
+        
+        Args:
+            task_id: Task identifier
+            use_cache: Serve a recently fetched copy when one is cached
+            
+        Returns:
+            Dict with 'success' bool and task data or 'error'
+        """
+        pass
+    
+    @abstractmethod
+    def get_active_execution(self, task_id: str, use_cache: bool = True) -> Dict[str, Any]:
+        """Get the currently running execution of a task
+        
+        Args:
+            task_id: Task identifier
+            use_cache: Serve a recent lookup (including "none active") when cached
+        
+        Returns:
+            Dict with 'success' bool, 'active' bool and execution 'data'
+            (None when the task has no active execution), or 'error'
+        """
+        pass
+    
+    @abstractmethod
+    def tail_logs(self, cursor: Optional[str] = None, max_lines: int = 100) -> Dict[str, Any]:
+        """Get service log lines that were not returned before
+        
+        Args:
+            cursor: Cursor returned by a previous call (default: the last
+                one this client returned; the current tail on first use)
+            max_lines: Maximum number of lines to fetch
+        
+        Returns:
+            Dict with 'success' bool and 'data' holding the new 'lines',
+            the next 'cursor', 'truncated' and 'more' flags, or 'error'
+        """
+        pass
+    
+    @abstractmethod
+    def dashboard_health(self) -> Dict[str, Any]:
+        """Get a point sample of service CPU, memory and API latency
+        
+        Returns:
+            Dict with 'success' bool and 'data' holding cpu_percent,
+            memory_percent, memory_used_mb and avg_latency_ms, or 'error'
+        """
+        pass
+    
     @abstractmethod
     def health_check(self) -> Dict[str, Any]:
         """Check service health
@@ -77,3 +134,85 @@ class TaskManagerClientBase(ABC):
             Dict with 'success' bool and health information
         """
         pass
+    
+    def close(self) -> None:
+        """Release any resources held by the client (no-op by default)"""
+        pass
+
+
+class AsyncTaskManagerClientBase(ABC):
+    """Abstract base class defining the async Task Manager client interface
+    
+    Mirrors TaskManagerClientBase with coroutine methods so MCP tools can
+    await the backend without blocking the event loop.
+    """
+    
+    @abstractmethod
+    async def patch_execution(
+        self, 
+        execution_id: str, 
+        session_id: str
+    ) -> Dict[str, Any]:
+        """Update execution's session_id (see TaskManagerClientBase)"""
+        pass
+    
+    @abstractmethod
+    async def create_step(
+        self, 
+        execution_id: str, 
+        step_name: str,
+        message: Optional[str] = None,
+        status: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+        step_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Create a new step for an execution (see TaskManagerClientBase)"""
+        pass
+    
+    @abstractmethod
+    async def patch_step(
+        self, 
+        execution_id: str, 
+        step_id: str,
+        status: Optional[str] = None,
+        message: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Partially update a step (see TaskManagerClientBase)"""
+        pass
+    
+    @abstractmethod
+    async def get_task(self, task_id: str, use_cache: bool = True) -> Dict[str, Any]:
+        """Get task information (see TaskManagerClientBase)"""
+        pass
+    
+    @abstractmethod
+    async def get_active_execution(self, task_id: str, use_cache: bool = True) -> Dict[str, Any]:
+        """Get the currently running execution of a task (see TaskManagerClientBase)"""
+        pass
+    
+    @abstractmethod
+    async def tail_logs(self, cursor: Optional[str] = None, max_lines: int = 100) -> Dict[str, Any]:
+        """Get service log lines that were not returned before (see TaskManagerClientBase)"""
+        pass
+    
+    @abstractmethod
+    async def dashboard_health(self) -> Dict[str, Any]:
+        """Get a point sample of service metrics (see TaskManagerClientBase)"""
+        pass
+    
+    @abstractmethod
+    async def health_check(self) -> Dict[str, Any]:
+        """Check service health (see TaskManagerClientBase)"""
+        pass
+    
+    def drain_delivery_failures(self) -> List[Dict[str, Any]]:
+        """Return and clear background delivery failures (none by default)"""
+        return []
+    
+    async def warm_up(self) -> Dict[str, Any]:
+        """Prepare connections ahead of the first call (nothing to do by default)"""
+        return {"success": True, "connections": 0}
+    
+    async def aclose(self) -> None:
+        """Release any resources held by the client (no-op by default)"""
+        pass
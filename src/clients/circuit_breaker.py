@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Circuit breaker guarding calls to the Task Manager backend
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Dict, Any
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker driven by error rate and latency
+    
+    The outcomes of the last ``window_size`` calls are kept. Once at least
+    ``minimum_calls`` are recorded, the breaker opens when the failure rate
+    reaches ``failure_rate_threshold`` or the share of calls slower than
+    ``slow_call_seconds`` reaches ``slow_call_rate_threshold``. After
+    ``open_seconds`` it turns half-open; a single health probe is then
+    allowed, which closes the breaker on success or re-opens it on failure.
+    Any healthy /api/health response (e.g. from the spool replayer or the
+    health_check tool) closes the breaker early.
+    
+    Args:
+        failure_rate_threshold: Failure ratio (0-1) that opens the breaker
+        slow_call_seconds: Calls slower than this count as slow
+        slow_call_rate_threshold: Slow-call ratio (0-1) that opens the breaker
+        window_size: Number of recent calls considered
+        minimum_calls: Calls required before the rates are evaluated
+        open_seconds: How long to fail fast before probing again
+    """
+    
+    def __init__(
+        self,
+        failure_rate_threshold: float = 0.5,
+        slow_call_seconds: float = 5.0,
+        slow_call_rate_threshold: float = 0.8,
+        window_size: int = 20,
+        minimum_calls: int = 5,
+        open_seconds: float = 30.0
+    ):
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.open_seconds = open_seconds
+        self._outcomes: deque = deque(maxlen=window_size)
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+    
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+    
+    def _current_state(self) -> str:
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+            self._state = HALF_OPEN
+        return self._state
+    
+    def allow_request(self) -> bool:
+        """Whether a regular call may go to the backend"""
+        with self._lock:
+            return self._current_state() == CLOSED
+    
+    def try_start_probe(self) -> bool:
+        """Claim the single half-open health probe; False if not due or taken"""
+        with self._lock:
+            if self._current_state() != HALF_OPEN or self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+    
+    def end_probe(self) -> None:
+        """Release the probe claimed by try_start_probe()"""
+        with self._lock:
+            self._probe_in_flight = False
+    
+    def record_probe(self, success: bool) -> None:
+        """Feed a /api/health result into the breaker
+        
+        A healthy probe closes an open or half-open breaker. A failed probe
+        re-opens a half-open breaker; failures seen while still open are
+        ignored so frequent health checks cannot extend the open period.
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return
+            if success:
+                self._state = CLOSED
+                self._outcomes.clear()
+            elif state == HALF_OPEN:
+                self._trip()
+    
+    def record(self, success: bool, duration: float) -> None:
+        """Record the outcome of a regular call"""
+        with self._lock:
+            if self._state != CLOSED:
+                return
+            slow = duration >= self.slow_call_seconds
+            self._outcomes.append((success, slow))
+            # Only a failed or slow call can open the breaker
+            if (success and not slow) or len(self._outcomes) < self.minimum_calls:
+                return
+            failures = sum(1 for ok, _ in self._outcomes if not ok)
+            slow_calls = sum(1 for _, is_slow in self._outcomes if is_slow)
+            total = len(self._outcomes)
+            if failures / total >= self.failure_rate_threshold or slow_calls / total >= self.slow_call_rate_threshold:
+                self._trip()
+    
+    def _trip(self) -> None:
+        self._state = OPEN
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Breaker state for health reporting"""
+        with self._lock:
+            state = self._current_state()
+            total = len(self._outcomes)
+            failures = sum(1 for ok, _ in self._outcomes if not ok)
+            snapshot = {
+                "state": state,
+                "recent_calls": total,
+                "failure_rate": round(failures / total, 3) if total else 0.0
+            }
+            if state == OPEN:
+                snapshot["retry_in_seconds"] = round(
+                    max(0.0, self.open_seconds - (time.monotonic() - self._opened_at)), 1
+                )
+            return snapshot
@@ -4,10 +4,15 @@ Factory for creating Task Manager clients
 """
 
 import os
+from typing import TYPE_CHECKING
 
-from src.clients.base_client import TaskManagerClientBase
-from src.clients.mock_client import MockTaskManagerClient
-from src.clients.http_client import HttpTaskManagerClient
+from src.clients.base_client import TaskManagerClientBase, AsyncTaskManagerClientBase
+
+if TYPE_CHECKING:
+    from src.clients.generated._client import Client
+
+# Client implementations (and httpx) are imported inside the factories so that
+# only the selected client's dependencies are loaded
 
 
 def create_task_manager_client() -> TaskManagerClientBase:
@@ -18,7 +23,61 @@ def create_task_manager_client() -> TaskManagerClientBase:
     """
     # Use mock client if in test mode
     if os.getenv('USE_MOCK_CLIENT', 'false').lower() == 'true':
+        from src.clients.mock_client import MockTaskManagerClient
         return MockTaskManagerClient()
     
     # Default to HTTP client
-    return HttpTaskManagerClient()
\ No newline at end of file
+    from src.clients.http_client import HttpTaskManagerClient
+    return HttpTaskManagerClient()
+
+
+def create_async_task_manager_client() -> AsyncTaskManagerClientBase:
+    """Factory method to create an async Task Manager client
+    
+    Returns:
+        AsyncTaskManagerClientBase: A client instance implementing the AsyncTaskManagerClientBase interface
+    """
+    # Use mock client if in test mode
+    if os.getenv('USE_MOCK_CLIENT', 'false').lower() == 'true':
+        from src.clients.mock_client import AsyncMockTaskManagerClient
+        client = AsyncMockTaskManagerClient()
+    else:
+        # Default to HTTP client
+        from src.clients.async_http_client import AsyncHttpTaskManagerClient
+        client = AsyncHttpTaskManagerClient()
+    
+    # Optionally record undeliverable writes in an on-disk spool
+    spool_path = os.getenv('TASK_MANAGER_SPOOL_PATH')
+    if spool_path:
+        from src.clients.spool import SpoolFile, SpoolingTaskManagerClient
+        spool = SpoolFile(
+            spool_path,
+            fsync_policy=os.getenv('TASK_MANAGER_SPOOL_FSYNC', 'always'),
+            max_bytes=int(os.getenv('TASK_MANAGER_SPOOL_MAX_BYTES', str(10 * 1024 * 1024)))
+        )
+        client = SpoolingTaskManagerClient(client, spool)
+    
+    # Optionally deliver step updates in the background
+    if os.getenv('TASK_MANAGER_WRITE_BEHIND', 'false').lower() == 'true':
+        from src.clients.write_behind import WriteBehindTaskManagerClient
+        client = WriteBehindTaskManagerClient(client)
+    
+    return client
+
+
+def create_api_client() -> "Client":
+    """Factory method to create a generated API client
+    
+    Returns:
+        Client: A generated client for the configured Task Manager service,
+            for use with the generated endpoint functions and iter_executions
+    """
+    import httpx
+    from src.clients.generated._client import Client
+    
+    host = os.getenv('TASK_MANAGER_HOST', 'localhost')
+    port = os.getenv('TASK_MANAGER_PORT', '8080')
+    return Client(
+        base_url=f"http://{host}:{port}",
+        timeout=httpx.Timeout(float(os.getenv('TASK_MANAGER_TIMEOUT', '30')))
+    )
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Coalescing queue for step patches
+"""
+
+import asyncio
+from collections import OrderedDict
+from typing import Dict, Any, Tuple
+
+
+class CoalescingPatchQueue:
+    """Bounded asyncio queue of step patches that merges patches per step
+    
+    A patch for a step that is still pending is merged into the pending
+    entry (last write wins per field) instead of taking a new slot. Each
+    entry is held for ``window`` seconds after it was first queued so that
+    follow-up patches can join it; get() then hands out the merged patch.
+    Entries leave in the order their steps were first queued, and a step
+    that is being delivered starts a fresh entry behind the others, so
+    patches for one step are never reordered. Entries may carry an
+    "operation" marker; a patch merged into a pending create keeps the
+    create's marker so the create goes out with the latest fields.
+    """
+    
+    def __init__(self, maxsize: int, window: float = 0.0):
+        self.maxsize = maxsize
+        self.window = window
+        self.coalesced = 0
+        self._pending: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        self._deadlines: Dict[Tuple[str, str], float] = {}
+        self._unfinished = 0
+        self._rush = False
+        self._cond = asyncio.Condition()
+        self._finished = asyncio.Event()
+        self._finished.set()
+    
+    def qsize(self) -> int:
+        """Number of merged patches waiting to be handed out"""
+        return len(self._pending)
+    
+    def _merge(self, key: Tuple[str, str], patch: Dict[str, Any]) -> bool:
+        if key not in self._pending:
+            return False
+        self._pending[key].update({k: v for k, v in patch.items() if k != "operation"})
+        self.coalesced += 1
+        return True
+    
+    async def put(self, patch: Dict[str, Any]) -> None:
+        """Queue a patch, merging it into a pending patch for the same step"""
+        key = (patch["execution_id"], patch["step_id"])
+        async with self._cond:
+            if self._merge(key, patch):
+                return
+            await self._cond.wait_for(lambda: len(self._pending) < self.maxsize or key in self._pending)
+            if self._merge(key, patch):
+                return
+            self._pending[key] = dict(patch)
+            self._deadlines[key] = asyncio.get_running_loop().time() + self.window
+            self._unfinished += 1
+            self._finished.clear()
+            self._cond.notify_all()
+    
+    async def get(self) -> Dict[str, Any]:
+        """Wait for the oldest pending patch to leave its window and return it"""
+        loop = asyncio.get_running_loop()
+        async with self._cond:
+            while True:
+                await self._cond.wait_for(lambda: bool(self._pending))
+                key = next(iter(self._pending))
+                delay = self._deadlines[key] - loop.time()
+                if delay <= 0 or self._rush:
+                    break
+                try:
+                    await asyncio.wait_for(self._cond.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+            patch = self._pending.pop(key)
+            del self._deadlines[key]
+            self._cond.notify_all()
+            return patch
+    
+    def task_done(self) -> None:
+        """Mark a patch returned by get() as processed"""
+        self._unfinished -= 1
+        if self._unfinished <= 0:
+            self._unfinished = 0
+            self._finished.set()
+    
+    async def join(self) -> None:
+        """Hand out pending patches without waiting for their windows and
+        block until all of them are processed"""
+        async with self._cond:
+            self._rush = True
+            self._cond.notify_all()
+        try:
+            await self._finished.wait()
+        finally:
+            self._rush = False
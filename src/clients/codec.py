@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+JSON codecs for request and response bodies
+
+orjson or msgspec are used when installed, with the stdlib json module
+as the fallback. TASK_MANAGER_JSON_CODEC selects one explicitly.
+"""
+
+import json
+import os
+from typing import Any, Callable, Optional, Union
+
+
+class JsonCodec:
+    """A named pair of JSON encode (to bytes) and decode functions"""
+    
+    def __init__(self, name: str, dumps: Callable[[Any], bytes], loads: Callable[[Union[bytes, str]], Any]):
+        self.name = name
+        self.dumps = dumps
+        self.loads = loads
+    
+    def __repr__(self) -> str:
+        return f"JsonCodec({self.name!r})"
+
+
+def _stdlib_codec() -> JsonCodec:
+    # Same output as httpx's json= encoding
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+    return JsonCodec("json", dumps, json.loads)
+
+
+def _orjson_codec() -> JsonCodec:
+    import orjson
+    return JsonCodec("orjson", orjson.dumps, orjson.loads)
+
+
+def _msgspec_codec() -> JsonCodec:
+    import msgspec
+    encoder = msgspec.json.Encoder()
+    decoder = msgspec.json.Decoder()
+    return JsonCodec("msgspec", encoder.encode, decoder.decode)
+
+
+CODECS = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "json": _stdlib_codec
+}
+
+_default: Optional[JsonCodec] = None
+
+
+def select_codec(name: str = "auto") -> JsonCodec:
+    """Build the named codec; "auto" picks the fastest one installed
+    
+    Raises:
+        ValueError: If the name is unknown
+        ImportError: If the named codec's library is not installed
+    """
+    if name == "auto":
+        for factory in CODECS.values():
+            try:
+                return factory()
+            except ImportError:
+                continue
+    if name not in CODECS:
+        raise ValueError(f"Unknown JSON codec '{name}'. Must be one of: auto, {', '.join(CODECS)}")
+    return CODECS[name]()
+
+
+def get_codec() -> JsonCodec:
+    """Process-wide codec chosen by TASK_MANAGER_JSON_CODEC (default: auto)"""
+    global _default
+    if _default is None:
+        _default = select_codec(os.getenv('TASK_MANAGER_JSON_CODEC', 'auto').lower())
+    return _default
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Conditional GET support (ETag / Last-Modified) for the generated API client
+"""
+
+import threading
+from collections import OrderedDict
+from types import ModuleType
+from typing import Any, Dict, Hashable, Optional, Tuple, Union
+
+from src.clients import generated_calls
+from src.clients.generated._client.client import AuthenticatedClient, Client
+from src.clients.generated._client.types import UNSET, Response
+
+
+class _Validators:
+    """Validators and parsed model of the last 200 response for one request"""
+    
+    __slots__ = ("etag", "last_modified", "parsed")
+    
+    def __init__(self, etag: Optional[str], last_modified: Optional[str], parsed: Any):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.parsed = parsed
+
+
+class ConditionalCache:
+    """Opt-in validator cache for GET endpoints of the generated client
+    
+    Wraps calls to generated endpoint modules that accept ``if_none_match``
+    and ``if_modified_since`` (see docs/swagger.yaml). The ETag and
+    Last-Modified of each 200 response are stored per endpoint and
+    arguments together with the parsed model; the next call sends them
+    back, and on 304 Not Modified the cached model is returned without
+    transferring or parsing the payload again. 200 bodies are decoded with
+    the configured JSON codec (see generated_calls). The generated code
+    itself is left untouched.
+    
+    Example:
+        cache = ConditionalCache()
+        client = Client(base_url="http://localhost:8080")
+        page = cache.sync(get_api_executions, client=client, task_id="task-1")
+    
+    Args:
+        max_entries: Number of requests whose validators are kept (LRU)
+    """
+    
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self.not_modified = 0
+        self._entries: "OrderedDict[Hashable, _Validators]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    @staticmethod
+    def _key(endpoint: ModuleType, kwargs: Dict[str, Any]) -> Tuple:
+        return (endpoint.__name__, tuple(sorted((k, repr(v)) for k, v in kwargs.items())))
+    
+    def _conditional_kwargs(
+        self,
+        key: Hashable,
+        kwargs: Dict[str, Any]
+    ) -> Tuple[Optional[_Validators], Dict[str, Any]]:
+        """Add the stored validators for a request to its arguments"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is None:
+            return None, kwargs
+        return entry, {
+            **kwargs,
+            "if_none_match": entry.etag or UNSET,
+            "if_modified_since": entry.last_modified or UNSET
+        }
+    
+    def _resolve(self, key: Hashable, entry: Optional[_Validators], response: Response) -> Any:
+        """Serve the cached model on 304; remember validators from a 200"""
+        if response.status_code == 304 and entry is not None:
+            with self._lock:
+                self.not_modified += 1
+            return entry.parsed
+        if response.status_code == 200:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            with self._lock:
+                if etag or last_modified:
+                    self._entries[key] = _Validators(etag, last_modified, response.parsed)
+                    self._entries.move_to_end(key)
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+                else:
+                    self._entries.pop(key, None)
+        return response.parsed
+    
+    def sync(
+        self,
+        endpoint: ModuleType,
+        *,
+        client: Union[AuthenticatedClient, Client],
+        **kwargs: Any
+    ) -> Any:
+        """Call ``endpoint.sync_detailed`` conditionally and return the parsed model"""
+        key = self._key(endpoint, kwargs)
+        entry, call_kwargs = self._conditional_kwargs(key, kwargs)
+        return self._resolve(key, entry, generated_calls.sync_detailed(endpoint, client=client, **call_kwargs))
+    
+    async def asyncio(
+        self,
+        endpoint: ModuleType,
+        *,
+        client: Union[AuthenticatedClient, Client],
+        **kwargs: Any
+    ) -> Any:
+        """Call ``endpoint.asyncio_detailed`` conditionally and return the parsed model"""
+        key = self._key(endpoint, kwargs)
+        entry, call_kwargs = self._conditional_kwargs(key, kwargs)
+        return self._resolve(key, entry, await generated_calls.asyncio_detailed(endpoint, client=client, **call_kwargs))
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Background sampling of /api/dashboard/health into fixed-size ring buffers
+"""
+
+import asyncio
+import math
+import os
+import time
+from array import array
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, List, Tuple
+
+from src.clients.base_client import AsyncTaskManagerClientBase
+
+
+# Numeric point samples reported by /api/dashboard/health
+DASHBOARD_METRICS = ("cpu_percent", "memory_percent", "memory_used_mb", "avg_latency_ms")
+
+# Windows reported by DashboardSampler.stats, in seconds
+STATS_WINDOWS = (("1m", 60), ("5m", 300), ("1h", 3600))
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+class SampleRing:
+    """Fixed-capacity ring of timestamped samples stored in ``array('d')``
+    
+    Each metric has its own preallocated array of ``capacity`` doubles, so
+    memory use is constant however long the sampler runs. Missing values
+    are stored as NaN and ignored by the statistics.
+    """
+    
+    def __init__(self, capacity: int, metrics: Tuple[str, ...] = DASHBOARD_METRICS):
+        self.capacity = max(1, capacity)
+        self.metrics = metrics
+        self._times = array("d", bytes(8 * self.capacity))
+        self._values = {name: array("d", bytes(8 * self.capacity)) for name in metrics}
+        self._next = 0
+        self._count = 0
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def append(self, timestamp: float, sample: Dict[str, Any]) -> None:
+        """Store one sample, overwriting the oldest when full"""
+        self._times[self._next] = timestamp
+        for name in self.metrics:
+            value = sample.get(name)
+            self._values[name][self._next] = float(value) if isinstance(value, (int, float)) else math.nan
+        self._next = (self._next + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+    
+    def window(self, seconds: float, now: float) -> Dict[str, List[float]]:
+        """Values per metric of the samples taken in the last ``seconds``"""
+        values: Dict[str, List[float]] = {name: [] for name in self.metrics}
+        for i in range(self._count):
+            slot = (self._next - 1 - i) % self.capacity
+            if now - self._times[slot] > seconds:
+                break
+            for name in self.metrics:
+                value = self._values[name][slot]
+                if not math.isnan(value):
+                    values[name].append(value)
+        return values
+
+
+class DashboardSampler:
+    """Polls /api/dashboard/health in the background and summarises the samples
+    
+    The first call to ``ensure_started`` takes a sample right away and
+    starts the polling task; ``stats`` only reads the ring buffer, so
+    asking for statistics never issues a request. The buffer holds enough
+    samples to cover the longest stats window.
+    
+    Args:
+        client: Client used for the dashboard_health requests
+        interval: Seconds between samples (default: TASK_MANAGER_DASHBOARD_INTERVAL or 10)
+    """
+    
+    def __init__(self, client: AsyncTaskManagerClientBase, interval: Optional[float] = None):
+        self._client = client
+        self.interval = interval or float(os.getenv('TASK_MANAGER_DASHBOARD_INTERVAL', '10'))
+        longest = max(seconds for _, seconds in STATS_WINDOWS)
+        self.ring = SampleRing(math.ceil(longest / self.interval) + 1)
+        self.last_error: Optional[str] = None
+        self.last_sample_at: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+        self._start_lock = asyncio.Lock()
+    
+    async def sample(self) -> None:
+        """Take one sample; failures are remembered in last_error"""
+        try:
+            result = await self._client.dashboard_health()
+        except Exception as e:
+            result = {"success": False, "error": str(e)}
+        if not result.get("success"):
+            self.last_error = result.get("error", "Unknown error")
+            return
+        self.ring.append(time.monotonic(), result.get("data") or {})
+        self.last_error = None
+        self.last_sample_at = datetime.now(timezone.utc).isoformat()
+    
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.sample()
+    
+    async def ensure_started(self) -> None:
+        """Start polling (once per event loop), sampling immediately if empty"""
+        async with self._start_lock:
+            if self._task is not None and not self._task.done():
+                return
+            if not len(self.ring):
+                await self.sample()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+    
+    async def stop(self) -> None:
+        """Stop polling"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    def stats(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """min/mean/p50/p95/max per metric for each window (no request is made)"""
+        now = time.monotonic() if now is None else now
+        windows: Dict[str, Any] = {}
+        for label, seconds in STATS_WINDOWS:
+            summary: Dict[str, Any] = {}
+            for name, values in self.ring.window(seconds, now).items():
+                if not values:
+                    summary[name] = {"count": 0}
+                    continue
+                ordered = sorted(values)
+                summary[name] = {
+                    "count": len(ordered),
+                    "min": ordered[0],
+                    "mean": round(sum(ordered) / len(ordered), 3),
+                    "p50": _percentile(ordered, 0.5),
+                    "p95": _percentile(ordered, 0.95),
+                    "max": ordered[-1]
+                }
+            windows[label] = summary
+        return {
+            "interval_seconds": self.interval,
+            "samples": len(self.ring),
+            "last_sample_at": self.last_sample_at,
+            "last_error": self.last_error,
+            "windows": windows
+        }
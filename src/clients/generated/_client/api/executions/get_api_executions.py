@@ -1,5 +1,5 @@
 from http import HTTPStatus
-from typing import Any
+from typing import Any, cast
 
 import httpx
 
@@ -17,7 +17,16 @@ def _get_kwargs(
     status: GetApiExecutionsStatus | Unset = UNSET,
     page: int | Unset = 1,
     limit: int | Unset = 20,
+    if_none_match: str | Unset = UNSET,
+    if_modified_since: str | Unset = UNSET,
 ) -> dict[str, Any]:
+    headers: dict[str, Any] = {}
+    if not isinstance(if_none_match, Unset):
+        headers["If-None-Match"] = if_none_match
+
+    if not isinstance(if_modified_since, Unset):
+        headers["If-Modified-Since"] = if_modified_since
+
     params: dict[str, Any] = {}
 
     params["task-id"] = task_id
@@ -40,17 +49,22 @@ def _get_kwargs(
         "params": params,
     }
 
+    _kwargs["headers"] = headers
     return _kwargs
 
 
 def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
-) -> HttpErrorResponse | HttpExecutionsResponse | None:
+) -> Any | HttpErrorResponse | HttpExecutionsResponse | None:
     if response.status_code == 200:
         response_200 = HttpExecutionsResponse.from_dict(response.json())
 
         return response_200
 
+    if response.status_code == 304:
+        response_304 = cast(Any, None)
+        return response_304
+
     if response.status_code == 400:
         response_400 = HttpErrorResponse.from_dict(response.json())
 
@@ -69,7 +83,7 @@ def _parse_response(
 
 def _build_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
-) -> Response[HttpErrorResponse | HttpExecutionsResponse]:
+) -> Response[Any | HttpErrorResponse | HttpExecutionsResponse]:
     return Response(
         status_code=HTTPStatus(response.status_code),
         content=response.content,
@@ -85,7 +99,9 @@ def sync_detailed(
     status: GetApiExecutionsStatus | Unset = UNSET,
     page: int | Unset = 1,
     limit: int | Unset = 20,
-) -> Response[HttpErrorResponse | HttpExecutionsResponse]:
+    if_none_match: str | Unset = UNSET,
+    if_modified_since: str | Unset = UNSET,
+) -> Response[Any | HttpErrorResponse | HttpExecutionsResponse]:
     """Query executions
 
      Query executions by task-id and status with pagination
@@ -95,13 +111,15 @@ def sync_detailed(
         status (GetApiExecutionsStatus | Unset):
         page (int | Unset):  Default: 1.
         limit (int | Unset):  Default: 20.
+        if_none_match (str | Unset):
+        if_modified_since (str | Unset):
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Response[HttpErrorResponse | HttpExecutionsResponse]
+        Response[Any | HttpErrorResponse | HttpExecutionsResponse]
     """
 
     kwargs = _get_kwargs(
@@ -109,6 +127,8 @@ def sync_detailed(
         status=status,
         page=page,
         limit=limit,
+        if_none_match=if_none_match,
+        if_modified_since=if_modified_since,
     )
 
     response = client.get_httpx_client().request(
@@ -125,7 +145,9 @@ def sync(
     status: GetApiExecutionsStatus | Unset = UNSET,
     page: int | Unset = 1,
     limit: int | Unset = 20,
-) -> HttpErrorResponse | HttpExecutionsResponse | None:
+    if_none_match: str | Unset = UNSET,
+    if_modified_since: str | Unset = UNSET,
+) -> Any | HttpErrorResponse | HttpExecutionsResponse | None:
     """Query executions
 
      Query executions by task-id and status with pagination
@@ -135,13 +157,15 @@ def sync(
         status (GetApiExecutionsStatus | Unset):
         page (int | Unset):  Default: 1.
         limit (int | Unset):  Default: 20.
+        if_none_match (str | Unset):
+        if_modified_since (str | Unset):
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        HttpErrorResponse | HttpExecutionsResponse
+        Any | HttpErrorResponse | HttpExecutionsResponse
     """
 
     return sync_detailed(
@@ -150,6 +174,8 @@ def sync(
         status=status,
         page=page,
         limit=limit,
+        if_none_match=if_none_match,
+        if_modified_since=if_modified_since,
     ).parsed
 
 
@@ -160,7 +186,9 @@ async def asyncio_detailed(
     status: GetApiExecutionsStatus | Unset = UNSET,
     page: int | Unset = 1,
     limit: int | Unset = 20,
-) -> Response[HttpErrorResponse | HttpExecutionsResponse]:
+    if_none_match: str | Unset = UNSET,
+    if_modified_since: str | Unset = UNSET,
+) -> Response[Any | HttpErrorResponse | HttpExecutionsResponse]:
     """Query executions
 
      Query executions by task-id and status with pagination
@@ -170,13 +198,15 @@ async def asyncio_detailed(
         status (GetApiExecutionsStatus | Unset):
         page (int | Unset):  Default: 1.
         limit (int | Unset):  Default: 20.
+        if_none_match (str | Unset):
+        if_modified_since (str | Unset):
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Response[HttpErrorResponse | HttpExecutionsResponse]
+        Response[Any | HttpErrorResponse | HttpExecutionsResponse]
     """
 
     kwargs = _get_kwargs(
@@ -184,6 +214,8 @@ async def asyncio_detailed(
         status=status,
         page=page,
         limit=limit,
+        if_none_match=if_none_match,
+        if_modified_since=if_modified_since,
     )
 
     response = await client.get_async_httpx_client().request(**kwargs)
@@ -198,7 +230,9 @@ async def asyncio(
     status: GetApiExecutionsStatus | Unset = UNSET,
     page: int | Unset = 1,
     limit: int | Unset = 20,
-) -> HttpErrorResponse | HttpExecutionsResponse | None:
+    if_none_match: str | Unset = UNSET,
+    if_modified_since: str | Unset = UNSET,
+) -> Any | HttpErrorResponse | HttpExecutionsResponse | None:
     """Query executions
 
      Query executions by task-id and status with pagination
@@ -208,13 +242,15 @@ async def asyncio(
         status (GetApiExecutionsStatus | Unset):
         page (int | Unset):  Default: 1.
         limit (int | Unset):  Default: 20.
+        if_none_match (str | Unset):
+        if_modified_since (str | Unset):
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        HttpErrorResponse | HttpExecutionsResponse
+        Any | HttpErrorResponse | HttpExecutionsResponse
     """
 
     return (
@@ -224,5 +260,7 @@ async def asyncio(
             status=status,
             page=page,
             limit=limit,
+            if_none_match=if_none_match,
+            if_modified_since=if_modified_since,
         )
     ).parsed
@@ -13,11 +13,14 @@ from ...types import UNSET, Response, Unset
 def _get_kwargs(
     *,
     lines: int | Unset = UNSET,
+    offset: int | Unset = UNSET,
 ) -> dict[str, Any]:
     params: dict[str, Any] = {}
 
     params["lines"] = lines
 
+    params["offset"] = offset
+
     params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
 
     _kwargs: dict[str, Any] = {
@@ -68,6 +71,7 @@ def sync_detailed(
     *,
     client: AuthenticatedClient | Client,
     lines: int | Unset = UNSET,
+    offset: int | Unset = UNSET,
 ) -> Response[HttpErrorResponse | HttpLogsResponse]:
     """Get task manager logs
 
@@ -75,6 +79,7 @@ def sync_detailed(
 
     Args:
         lines (int | Unset):
+        offset (int | Unset):
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -86,6 +91,7 @@ def sync_detailed(
 
     kwargs = _get_kwargs(
         lines=lines,
+        offset=offset,
     )
 
     response = client.get_httpx_client().request(
@@ -99,6 +105,7 @@ def sync(
     *,
     client: AuthenticatedClient | Client,
     lines: int | Unset = UNSET,
+    offset: int | Unset = UNSET,
 ) -> HttpErrorResponse | HttpLogsResponse | None:
     """Get task manager logs
 
@@ -106,6 +113,7 @@ def sync(
 
     Args:
         lines (int | Unset):
+        offset (int | Unset):
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -118,6 +126,7 @@ def sync(
     return sync_detailed(
         client=client,
         lines=lines,
+        offset=offset,
     ).parsed
 
 
@@ -125,6 +134,7 @@ async def asyncio_detailed(
     *,
     client: AuthenticatedClient | Client,
     lines: int | Unset = UNSET,
+    offset: int | Unset = UNSET,
 ) -> Response[HttpErrorResponse | HttpLogsResponse]:
     """Get task manager logs
 
@@ -132,6 +142,7 @@ async def asyncio_detailed(
 
     Args:
         lines (int | Unset):
+        offset (int | Unset):
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -143,6 +154,7 @@ async def asyncio_detailed(
 
     kwargs = _get_kwargs(
         lines=lines,
+        offset=offset,
     )
 
     response = await client.get_async_httpx_client().request(**kwargs)
@@ -154,6 +166,7 @@ async def asyncio(
     *,
     client: AuthenticatedClient | Client,
     lines: int | Unset = UNSET,
+    offset: int | Unset = UNSET,
 ) -> HttpErrorResponse | HttpLogsResponse | None:
     """Get task manager logs
 
@@ -161,6 +174,7 @@ async def asyncio(
 
     Args:
         lines (int | Unset):
+        offset (int | Unset):
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -174,5 +188,6 @@ async def asyncio(
         await asyncio_detailed(
             client=client,
             lines=lines,
+            offset=offset,
         )
     ).parsed
@@ -9,15 +9,18 @@ from ...client import AuthenticatedClient, Client
 from ...models.http_create_step_request import HttpCreateStepRequest
 from ...models.http_error_response import HttpErrorResponse
 from ...models.http_step_response import HttpStepResponse
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
     execution_id: str,
     *,
     body: HttpCreateStepRequest,
+    idempotency_key: str | Unset = UNSET,
 ) -> dict[str, Any]:
     headers: dict[str, Any] = {}
+    if not isinstance(idempotency_key, Unset):
+        headers["Idempotency-Key"] = idempotency_key
 
     _kwargs: dict[str, Any] = {
         "method": "post",
@@ -79,6 +82,7 @@ def sync_detailed(
     *,
     client: AuthenticatedClient | Client,
     body: HttpCreateStepRequest,
+    idempotency_key: str | Unset = UNSET,
 ) -> Response[HttpErrorResponse | HttpStepResponse]:
     """Create execution step
 
@@ -86,6 +90,7 @@ def sync_detailed(
 
     Args:
         execution_id (str):
+        idempotency_key (str | Unset):
         body (HttpCreateStepRequest):
 
     Raises:
@@ -99,6 +104,7 @@ def sync_detailed(
     kwargs = _get_kwargs(
         execution_id=execution_id,
         body=body,
+        idempotency_key=idempotency_key,
     )
 
     response = client.get_httpx_client().request(
@@ -113,6 +119,7 @@ def sync(
     *,
     client: AuthenticatedClient | Client,
     body: HttpCreateStepRequest,
+    idempotency_key: str | Unset = UNSET,
 ) -> HttpErrorResponse | HttpStepResponse | None:
     """Create execution step
 
@@ -120,6 +127,7 @@ def sync(
 
     Args:
         execution_id (str):
+        idempotency_key (str | Unset):
         body (HttpCreateStepRequest):
 
     Raises:
@@ -134,6 +142,7 @@ def sync(
         execution_id=execution_id,
         client=client,
         body=body,
+        idempotency_key=idempotency_key,
     ).parsed
 
 
@@ -142,6 +151,7 @@ async def asyncio_detailed(
     *,
     client: AuthenticatedClient | Client,
     body: HttpCreateStepRequest,
+    idempotency_key: str | Unset = UNSET,
 ) -> Response[HttpErrorResponse | HttpStepResponse]:
     """Create execution step
 
@@ -149,6 +159,7 @@ async def asyncio_detailed(
 
     Args:
         execution_id (str):
+        idempotency_key (str | Unset):
         body (HttpCreateStepRequest):
 
     Raises:
@@ -162,6 +173,7 @@ async def asyncio_detailed(
     kwargs = _get_kwargs(
         execution_id=execution_id,
         body=body,
+        idempotency_key=idempotency_key,
     )
 
     response = await client.get_async_httpx_client().request(**kwargs)
@@ -174,6 +186,7 @@ async def asyncio(
     *,
     client: AuthenticatedClient | Client,
     body: HttpCreateStepRequest,
+    idempotency_key: str | Unset = UNSET,
 ) -> HttpErrorResponse | HttpStepResponse | None:
     """Create execution step
 
@@ -181,6 +194,7 @@ async def asyncio(
 
     Args:
         execution_id (str):
+        idempotency_key (str | Unset):
         body (HttpCreateStepRequest):
 
     Raises:
@@ -196,5 +210,6 @@ async def asyncio(
             execution_id=execution_id,
             client=client,
             body=body,
+            idempotency_key=idempotency_key,
         )
     ).parsed
@@ -1,5 +1,5 @@
 from http import HTTPStatus
-from typing import Any
+from typing import Any, cast
 
 import httpx
 
@@ -14,7 +14,16 @@ from ...types import UNSET, Response, Unset
 def _get_kwargs(
     *,
     status: GetApiTasksStatus | Unset = UNSET,
+    if_none_match: str | Unset = UNSET,
+    if_modified_since: str | Unset = UNSET,
 ) -> dict[str, Any]:
+    headers: dict[str, Any] = {}
+    if not isinstance(if_none_match, Unset):
+        headers["If-None-Match"] = if_none_match
+
+    if not isinstance(if_modified_since, Unset):
+        headers["If-Modified-Since"] = if_modified_since
+
     params: dict[str, Any] = {}
 
     json_status: str | Unset = UNSET
@@ -31,17 +40,22 @@ def _get_kwargs(
         "params": params,
     }
 
+    _kwargs["headers"] = headers
     return _kwargs
 
 
 def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
-) -> HttpErrorResponse | HttpTasksResponse | None:
+) -> Any | HttpErrorResponse | HttpTasksResponse | None:
     if response.status_code == 200:
         response_200 = HttpTasksResponse.from_dict(response.json())
 
         return response_200
 
+    if response.status_code == 304:
+        response_304 = cast(Any, None)
+        return response_304
+
     if response.status_code == 400:
         response_400 = HttpErrorResponse.from_dict(response.json())
 
@@ -60,7 +74,7 @@ def _parse_response(
 
 def _build_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
-) -> Response[HttpErrorResponse | HttpTasksResponse]:
+) -> Response[Any | HttpErrorResponse | HttpTasksResponse]:
     return Response(
         status_code=HTTPStatus(response.status_code),
         content=response.content,
@@ -73,24 +87,30 @@ def sync_detailed(
     *,
     client: AuthenticatedClient | Client,
     status: GetApiTasksStatus | Unset = UNSET,
-) -> Response[HttpErrorResponse | HttpTasksResponse]:
+    if_none_match: str | Unset = UNSET,
+    if_modified_since: str | Unset = UNSET,
+) -> Response[Any | HttpErrorResponse | HttpTasksResponse]:
     """List all tasks
 
      Get a list of all tasks, optionally filtered by status
 
     Args:
         status (GetApiTasksStatus | Unset):
+        if_none_match (str | Unset):
+        if_modified_since (str | Unset):
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Response[HttpErrorResponse | HttpTasksResponse]
+        Response[Any | HttpErrorResponse | HttpTasksResponse]
     """
 
     kwargs = _get_kwargs(
         status=status,
+        if_none_match=if_none_match,
+        if_modified_since=if_modified_since,
     )
 
     response = client.get_httpx_client().request(
@@ -104,25 +124,31 @@ def sync(
     *,
     client: AuthenticatedClient | Client,
     status: GetApiTasksStatus | Unset = UNSET,
-) -> HttpErrorResponse | HttpTasksResponse | None:
+    if_none_match: str | Unset = UNSET,
+    if_modified_since: str | Unset = UNSET,
+) -> Any | HttpErrorResponse | HttpTasksResponse | None:
     """List all tasks
 
      Get a list of all tasks, optionally filtered by status
 
     Args:
         status (GetApiTasksStatus | Unset):
+        if_none_match (str | Unset):
+        if_modified_since (str | Unset):
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        HttpErrorResponse | HttpTasksResponse
+        Any | HttpErrorResponse | HttpTasksResponse
     """
 
     return sync_detailed(
         client=client,
         status=status,
+        if_none_match=if_none_match,
+        if_modified_since=if_modified_since,
     ).parsed
 
 
@@ -130,24 +156,30 @@ async def asyncio_detailed(
     *,
     client: AuthenticatedClient | Client,
     status: GetApiTasksStatus | Unset = UNSET,
-) -> Response[HttpErrorResponse | HttpTasksResponse]:
+    if_none_match: str | Unset = UNSET,
+    if_modified_since: str | Unset = UNSET,
+) -> Response[Any | HttpErrorResponse | HttpTasksResponse]:
     """List all tasks
 
      Get a list of all tasks, optionally filtered by status
 
     Args:
         status (GetApiTasksStatus | Unset):
+        if_none_match (str | Unset):
+        if_modified_since (str | Unset):
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Response[HttpErrorResponse | HttpTasksResponse]
+        Response[Any | HttpErrorResponse | HttpTasksResponse]
     """
 
     kwargs = _get_kwargs(
         status=status,
+        if_none_match=if_none_match,
+        if_modified_since=if_modified_since,
     )
 
     response = await client.get_async_httpx_client().request(**kwargs)
@@ -159,25 +191,31 @@ async def asyncio(
     *,
     client: AuthenticatedClient | Client,
     status: GetApiTasksStatus | Unset = UNSET,
-) -> HttpErrorResponse | HttpTasksResponse | None:
+    if_none_match: str | Unset = UNSET,
+    if_modified_since: str | Unset = UNSET,
+) -> Any | HttpErrorResponse | HttpTasksResponse | None:
     """List all tasks
 
      Get a list of all tasks, optionally filtered by status
 
     Args:
         status (GetApiTasksStatus | Unset):
+        if_none_match (str | Unset):
+        if_modified_since (str | Unset):
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        HttpErrorResponse | HttpTasksResponse
+        Any | HttpErrorResponse | HttpTasksResponse
     """
 
     return (
         await asyncio_detailed(
             client=client,
             status=status,
+            if_none_match=if_none_match,
+            if_modified_since=if_modified_since,
         )
     ).parsed
@@ -1,5 +1,5 @@
 from http import HTTPStatus
-from typing import Any
+from typing import Any, cast
 from urllib.parse import quote
 
 import httpx
@@ -8,12 +8,22 @@ from ... import errors
 from ...client import AuthenticatedClient, Client
 from ...models.http_error_response import HttpErrorResponse
 from ...models.http_task_status_response import HttpTaskStatusResponse
-from ...types import Response
+from ...types import UNSET, Response, Unset
 
 
 def _get_kwargs(
     task_id: str,
+    *,
+    if_none_match: str | Unset = UNSET,
+    if_modified_since: str | Unset = UNSET,
 ) -> dict[str, Any]:
+    headers: dict[str, Any] = {}
+    if not isinstance(if_none_match, Unset):
+        headers["If-None-Match"] = if_none_match
+
+    if not isinstance(if_modified_since, Unset):
+        headers["If-Modified-Since"] = if_modified_since
+
     _kwargs: dict[str, Any] = {
         "method": "get",
         "url": "/api/tasks/{task_id}".format(
@@ -21,17 +31,22 @@ def _get_kwargs(
         ),
     }
 
+    _kwargs["headers"] = headers
     return _kwargs
 
 
 def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
-) -> HttpErrorResponse | HttpTaskStatusResponse | None:
+) -> Any | HttpErrorResponse | HttpTaskStatusResponse | None:
     if response.status_code == 200:
         response_200 = HttpTaskStatusResponse.from_dict(response.json())
 
         return response_200
 
+    if response.status_code == 304:
+        response_304 = cast(Any, None)
+        return response_304
+
     if response.status_code == 400:
         response_400 = HttpErrorResponse.from_dict(response.json())
 
@@ -50,7 +65,7 @@ def _parse_response(
 
 def _build_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
-) -> Response[HttpErrorResponse | HttpTaskStatusResponse]:
+) -> Response[Any | HttpErrorResponse | HttpTaskStatusResponse]:
     return Response(
         status_code=HTTPStatus(response.status_code),
         content=response.content,
@@ -63,24 +78,30 @@ def sync_detailed(
     task_id: str,
     *,
     client: AuthenticatedClient | Client,
-) -> Response[HttpErrorResponse | HttpTaskStatusResponse]:
+    if_none_match: str | Unset = UNSET,
+    if_modified_since: str | Unset = UNSET,
+) -> Response[Any | HttpErrorResponse | HttpTaskStatusResponse]:
     """Get task by ID
 
      Get task information by task ID including JIRA ticket details
 
     Args:
         task_id (str):
+        if_none_match (str | Unset):
+        if_modified_since (str | Unset):
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Response[HttpErrorResponse | HttpTaskStatusResponse]
+        Response[Any | HttpErrorResponse | HttpTaskStatusResponse]
     """
 
     kwargs = _get_kwargs(
         task_id=task_id,
+        if_none_match=if_none_match,
+        if_modified_since=if_modified_since,
     )
 
     response = client.get_httpx_client().request(
@@ -94,25 +115,31 @@ def sync(
     task_id: str,
     *,
     client: AuthenticatedClient | Client,
-) -> HttpErrorResponse | HttpTaskStatusResponse | None:
+    if_none_match: str | Unset = UNSET,
+    if_modified_since: str | Unset = UNSET,
+) -> Any | HttpErrorResponse | HttpTaskStatusResponse | None:
     """Get task by ID
 
      Get task information by task ID including JIRA ticket details
 
     Args:
         task_id (str):
+        if_none_match (str | Unset):
+        if_modified_since (str | Unset):
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        HttpErrorResponse | HttpTaskStatusResponse
+        Any | HttpErrorResponse | HttpTaskStatusResponse
     """
 
     return sync_detailed(
         task_id=task_id,
         client=client,
+        if_none_match=if_none_match,
+        if_modified_since=if_modified_since,
     ).parsed
 
 
@@ -120,24 +147,30 @@ async def asyncio_detailed(
     task_id: str,
     *,
     client: AuthenticatedClient | Client,
-) -> Response[HttpErrorResponse | HttpTaskStatusResponse]:
+    if_none_match: str | Unset = UNSET,
+    if_modified_since: str | Unset = UNSET,
+) -> Response[Any | HttpErrorResponse | HttpTaskStatusResponse]:
     """Get task by ID
 
      Get task information by task ID including JIRA ticket details
 
     Args:
         task_id (str):
+        if_none_match (str | Unset):
+        if_modified_since (str | Unset):
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        Response[HttpErrorResponse | HttpTaskStatusResponse]
+        Response[Any | HttpErrorResponse | HttpTaskStatusResponse]
     """
 
     kwargs = _get_kwargs(
         task_id=task_id,
+        if_none_match=if_none_match,
+        if_modified_since=if_modified_since,
     )
 
     response = await client.get_async_httpx_client().request(**kwargs)
@@ -149,25 +182,31 @@ async def asyncio(
     task_id: str,
     *,
     client: AuthenticatedClient | Client,
-) -> HttpErrorResponse | HttpTaskStatusResponse | None:
+    if_none_match: str | Unset = UNSET,
+    if_modified_since: str | Unset = UNSET,
+) -> Any | HttpErrorResponse | HttpTaskStatusResponse | None:
     """Get task by ID
 
      Get task information by task ID including JIRA ticket details
 
     Args:
         task_id (str):
+        if_none_match (str | Unset):
+        if_modified_since (str | Unset):
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
         httpx.TimeoutException: If the request takes longer than Client.timeout.
 
     Returns:
-        HttpErrorResponse | HttpTaskStatusResponse
+        Any | HttpErrorResponse | HttpTaskStatusResponse
     """
 
     return (
         await asyncio_detailed(
             task_id=task_id,
             client=client,
+            if_none_match=if_none_match,
+            if_modified_since=if_modified_since,
         )
     ).parsed
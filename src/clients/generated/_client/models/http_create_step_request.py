@@ -18,11 +18,13 @@ class HttpCreateStepRequest:
         step_name (str):
         message (str | Unset):
         status (str | Unset): Optional, defaults to "running"
+        step_id (str | Unset): Optional client-allocated step ID (ULID). When omitted the server allocates one.
     """
 
     step_name: str
     message: str | Unset = UNSET
     status: str | Unset = UNSET
+    step_id: str | Unset = UNSET
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
@@ -32,6 +34,8 @@ class HttpCreateStepRequest:
 
         status = self.status
 
+        step_id = self.step_id
+
         field_dict: dict[str, Any] = {}
         field_dict.update(self.additional_properties)
         field_dict.update(
@@ -43,6 +47,8 @@ class HttpCreateStepRequest:
             field_dict["message"] = message
         if status is not UNSET:
             field_dict["status"] = status
+        if step_id is not UNSET:
+            field_dict["step_id"] = step_id
 
         return field_dict
 
@@ -55,10 +61,13 @@ class HttpCreateStepRequest:
 
         status = d.pop("status", UNSET)
 
+        step_id = d.pop("step_id", UNSET)
+
         http_create_step_request = cls(
             step_name=step_name,
             message=message,
             status=status,
+            step_id=step_id,
         )
 
         http_create_step_request.additional_properties = d
@@ -17,11 +17,13 @@ class HttpLogsData:
     Attributes:
         lines (int | Unset):
         logs (list[str] | Unset):
+        offset (int | Unset): Absolute line number (0-based) of the first returned line
         total_lines (int | Unset):
     """
 
     lines: int | Unset = UNSET
     logs: list[str] | Unset = UNSET
+    offset: int | Unset = UNSET
     total_lines: int | Unset = UNSET
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
@@ -32,6 +34,8 @@ class HttpLogsData:
         if not isinstance(self.logs, Unset):
             logs = self.logs
 
+        offset = self.offset
+
         total_lines = self.total_lines
 
         field_dict: dict[str, Any] = {}
@@ -41,6 +45,8 @@ class HttpLogsData:
             field_dict["lines"] = lines
         if logs is not UNSET:
             field_dict["logs"] = logs
+        if offset is not UNSET:
+            field_dict["offset"] = offset
         if total_lines is not UNSET:
             field_dict["total_lines"] = total_lines
 
@@ -53,11 +59,14 @@ class HttpLogsData:
 
         logs = cast(list[str], d.pop("logs", UNSET))
 
+        offset = d.pop("offset", UNSET)
+
         total_lines = d.pop("total_lines", UNSET)
 
         http_logs_data = cls(
             lines=lines,
             logs=logs,
+            offset=offset,
             total_lines=total_lines,
         )
 
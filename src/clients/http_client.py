@@ -3,123 +3,249 @@
 HTTP client implementation for Task Manager API
 """
 
-import os
-from typing import Dict, Any, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, Future, wait, as_completed
+from typing import Dict, Any, Optional, List
 import httpx
 
 from src.clients.base_client import TaskManagerClientBase
+from src.clients.http_common import HttpClientMixin, DASHBOARD_HEALTH_PATH, HEALTH_PATH, IDEMPOTENCY_HEADER, new_idempotency_key
+from src.clients.singleflight import SingleFlight
 
 
-class HttpTaskManagerClient(TaskManagerClientBase):
-    """HTTP implementation for Task Manager API"""
+class HttpTaskManagerClient(HttpClientMixin, TaskManagerClientBase):
+    """HTTP implementation for Task Manager API
     
-    def __init__(self):
-        self.host = os.getenv('TASK_MANAGER_HOST', 'localhost')
-        self.port = os.getenv('TASK_MANAGER_PORT', '8080')
-        self.base_url = f"http://{self.host}:{self.port}"
-        self.timeout = int(os.getenv('TASK_MANAGER_TIMEOUT', '30'))
+    A single pooled httpx.Client is kept for the lifetime of the instance so
+    consecutive calls reuse keep-alive connections instead of reconnecting.
+    """
+    
+    def __init__(self, transport: Optional[httpx.BaseTransport] = None):
+        self._load_config()
+        self._transport = transport
+        self._client: Optional[httpx.Client] = None
+        self._flight = SingleFlight()
+        self._client_lock = threading.Lock()
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+    
+    def _get_client(self) -> httpx.Client:
+        """Return the shared pooled client, creating it on first use"""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        base_url=self.base_url,
+                        timeout=self.timeout,
+                        limits=self._limits(),
+                        transport=self._transport
+                    )
+        return self._client
+    
+    def _get_hedge_executor(self) -> ThreadPoolExecutor:
+        """Return the thread pool hedged reads run on, creating it on first use"""
+        if self._hedge_executor is None:
+            with self._client_lock:
+                if self._hedge_executor is None:
+                    self._hedge_executor = ThreadPoolExecutor(
+                        max_workers=self.max_connections,
+                        thread_name_prefix="task-manager-hedge"
+                    )
+        return self._hedge_executor
+    
+    def close(self) -> None:
+        """Close pooled connections. The client reconnects if used again."""
+        with self._client_lock:
+            if self._hedge_executor is not None:
+                self._hedge_executor.shutdown(wait=True)
+                self._hedge_executor = None
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+    
+    def __enter__(self) -> "HttpTaskManagerClient":
+        return self
+    
+    def __exit__(self, *args: Any) -> None:
+        self.close()
     
     def _make_request(
         self, 
         method: str, 
         path: str, 
-        json_data: Optional[Dict] = None
+        json_data: Optional[Dict] = None,
+        headers: Optional[Dict[str, str]] = None,
+        idempotent: Optional[bool] = None,
+        endpoint: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        """Make HTTP request and handle response"""
-        try:
-            with httpx.Client(base_url=self.base_url, timeout=self.timeout) as client:
-                response = client.request(
-                    method=method,
-                    url=path,
-                    json=json_data
-                )
-                
-                if response.status_code >= 400:
-                    # Handle common HTTP error status codes
-                    if response.status_code == 404:
-                        return {
-                            "success": False,
-                            "error": f"API endpoint not found: {method} {path}. The backend service may not have implemented this API yet.",
-                            "status_code": 404,
-                            "hint": "Please check if the Task Manager backend service has this endpoint implemented."
-                        }
-                    elif response.status_code == 500:
-                        return {
-                            "success": False,
-                            "error": f"Backend server error (500). The Task Manager service encountered an internal error.",
-                            "status_code": 500,
-                            "hint": "Please check the Task Manager service logs for details."
-                        }
-                    
-                    # Try to parse JSON error response
+        """Make HTTP request and handle response
+        
+        ``endpoint`` names the route template (e.g. "PATCH
+        /api/executions/{execution_id}") whose observed latency sets the
+        timeout; it defaults to the method and literal path.
+        
+        Concurrent identical GETs (same path and params) share a single
+        in-flight request and its result.
+        """
+        endpoint = endpoint or f"{method} {path}"
+        if self.singleflight and method.upper() == "GET":
+            key = self._flight_key(method, path, params)
+            return self._copy_result(self._flight.do(
+                key,
+                lambda: self._request_with_retries(method, path, json_data, headers, idempotent, endpoint, params)
+            ))
+        return self._request_with_retries(method, path, json_data, headers, idempotent, endpoint, params)
+    
+    def _request_with_retries(
+        self, 
+        method: str, 
+        path: str, 
+        json_data: Optional[Dict],
+        headers: Optional[Dict[str, str]],
+        idempotent: Optional[bool],
+        endpoint: str,
+        params: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Send a request with retries and circuit breaking
+        
+        Idempotent requests (by method, Idempotency-Key header or the
+        idempotent flag) are retried on transient failures with
+        exponential backoff and full jitter. While the circuit breaker is
+        open, calls other than health checks fail fast.
+        """
+        retryable = self._is_retryable_request(method, headers, idempotent)
+        self.retry_budget.record_request()
+        attempt = 0
+        while True:
+            attempt += 1
+            if path != HEALTH_PATH and not self._breaker_allows():
+                return self._with_attempts(self._circuit_open_result(), attempt - 1)
+            timeout = self._request_timeout(endpoint)
+            started = time.monotonic()
+            try:
+                response = self._send(method, path, json_data, headers, timeout, endpoint, params)
+            except Exception as e:
+                self._record_outcome(path, endpoint, time.monotonic() - started, exc=e)
+                delay = self._retry_delay(attempt, exc=e) if retryable else None
+                if delay is None:
+                    return self._with_attempts(self._handle_exception(e, timeout), attempt)
+            else:
+                self._record_outcome(path, endpoint, time.monotonic() - started, status_code=response.status_code)
+                delay = self._retry_delay(attempt, status_code=response.status_code) if retryable else None
+                if delay is None:
+                    # Decoding errors are reported but not recorded as a second outcome
                     try:
-                        error_data = response.json()
-                        return {
-                            "success": False,
-                            "error": error_data.get("error", f"HTTP {response.status_code} error"),
-                            "error_code": error_data.get("error_code"),
-                            "status_code": response.status_code
-                        }
-                    except Exception:
-                        # If unable to parse JSON, return generic error message
-                        return {
-                            "success": False,
-                            "error": f"HTTP {response.status_code} error: {response.text[:200]}",
-                            "status_code": response.status_code
-                        }
-                
-                return response.json()
-                
-        except httpx.TimeoutException:
-            return {
-                "success": False, 
-                "error": f"Request timeout after {self.timeout} seconds",
-                "hint": "The Task Manager service may be slow or unresponsive. Try increasing TASK_MANAGER_TIMEOUT."
-            }
-        except httpx.ConnectError:
-            return {
-                "success": False, 
-                "error": f"Cannot connect to Task Manager service at {self.base_url}",
-                "hint": "Please verify that the Task Manager service is running and the host/port are correct."
-            }
-        except Exception as e:
-            return {
-                "success": False, 
-                "error": f"Request failed: {str(e)}",
-                "hint": "An unexpected error occurred. Please check the error message above."
-            }
+                        result = self._handle_response(method, path, response)
+                    except Exception as e:
+                        result = self._handle_exception(e, timeout)
+                    return self._with_attempts(result, attempt)
+            time.sleep(delay)
+    
+    def _send(
+        self, 
+        method: str, 
+        path: str, 
+        json_data: Optional[Dict],
+        headers: Optional[Dict[str, str]],
+        timeout: httpx.Timeout,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> httpx.Response:
+        """Send one attempt, hedging slow reads with a second request
+        
+        If a hedgeable read has not answered by its endpoint's p95 latency,
+        a second identical request is sent (budget permitting) and the first
+        successful response wins. The slower request finishes in the
+        background and is discarded.
+        """
+        client = self._get_client()
+        content, headers = self._encode_body(json_data, headers)
+        hedge_delay = self._hedge_delay(method, endpoint)
+        if hedge_delay is None:
+            return client.request(
+                method=method, url=path, content=content, headers=headers, params=params, timeout=timeout
+            )
+        
+        executor = self._get_hedge_executor()
+        def submit() -> Future:
+            return executor.submit(
+                client.request,
+                method=method, url=path, content=content, headers=headers, params=params, timeout=timeout
+            )
+        
+        futures: List[Future] = [submit()]
+        done, _ = wait(futures, timeout=hedge_delay)
+        if not done and self.hedge_budget.try_acquire():
+            futures.append(submit())
+        error: Optional[BaseException] = None
+        for future in as_completed(futures):
+            if future.exception() is None:
+                return future.result()
+            error = future.exception()
+        raise error
+    
+    def _breaker_allows(self) -> bool:
+        """Whether the breaker lets a call through, probing health when half-open"""
+        if self.breaker.allow_request():
+            return True
+        if self.breaker.try_start_probe():
+            # A single attempt: no singleflight, retries or retry budget
+            endpoint = f"GET {HEALTH_PATH}"
+            started = time.monotonic()
+            try:
+                response = self._send("GET", HEALTH_PATH, None, None, self._request_timeout(endpoint), endpoint)
+            except Exception as e:
+                self._record_outcome(HEALTH_PATH, endpoint, time.monotonic() - started, exc=e)
+            else:
+                self._record_outcome(HEALTH_PATH, endpoint, time.monotonic() - started, status_code=response.status_code)
+            finally:
+                self.breaker.end_probe()
+        return self.breaker.allow_request()
     
     def patch_execution(
         self, 
         execution_id: str, 
         session_id: str
     ) -> Dict[str, Any]:
-        """Update execution's session_id"""
-        return self._make_request(
+        """Update execution's session_id (skipped when it is already set)"""
+        body = {"session_id": session_id}
+        skipped = self._skipped_execution_patch(execution_id, body)
+        if skipped is not None:
+            return skipped
+        result = self._make_request(
             "PATCH",
             f"/api/executions/{execution_id}",
-            json_data={"session_id": session_id}
+            json_data=body,
+            idempotent=True,
+            endpoint="PATCH /api/executions/{execution_id}"
         )
+        return self._after_execution_patch(execution_id, body, result)
     
     def create_step(
         self, 
         execution_id: str, 
         step_name: str,
         message: Optional[str] = None,
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+        step_id: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Create a new step for an execution"""
-        body = {"step_name": step_name}
-        if message is not None:
-            body["message"] = message
-        if status is not None:
-            body["status"] = status
+        """Create a new step for an execution
         
-        return self._make_request(
+        The idempotency key is sent as a header so the backend can
+        deduplicate retries of the same logical step. A client-allocated
+        step_id doubles as the key when none is given.
+        """
+        body = self._create_step_body(step_name, message, status, step_id)
+        result = self._make_request(
             "POST",
             f"/api/executions/{execution_id}/steps",
-            json_data=body
+            json_data=body,
+            headers={IDEMPOTENCY_HEADER: idempotency_key or step_id or new_idempotency_key()},
+            endpoint="POST /api/executions/{execution_id}/steps"
         )
+        return self._after_step_write(execution_id, step_id, body, result)
     
     def patch_step(
         self, 
@@ -128,34 +254,82 @@ class HttpTaskManagerClient(TaskManagerClientBase):
         status: Optional[str] = None,
         message: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Partially update a step"""
-        body = {}
-        if status is not None:
-            body["status"] = status
-        if message is not None:
-            body["message"] = message
+        """Partially update a step
         
+        Nothing is sent when the step already has the requested status and
+        message as last acknowledged; the result then has "skipped".
+        """
+        body = self._patch_step_body(status, message)
         if not body:
             return {"success": False, "error": "No fields to update"}
+        skipped = self._skipped_step_patch(execution_id, step_id, body)
+        if skipped is not None:
+            return skipped
         
-        return self._make_request(
+        result = self._make_request(
             "PATCH",
             f"/api/executions/{execution_id}/steps/{step_id}",
-            json_data=body
+            json_data=body,
+            # Patches assign absolute field values, so repeating one is harmless
+            idempotent=True,
+            endpoint="PATCH /api/executions/{execution_id}/steps/{step_id}"
+        )
+        return self._after_step_write(execution_id, step_id, body, result)
+    
+    def get_task(self, task_id: str, use_cache: bool = True) -> Dict[str, Any]:
+        """Get task information, served from the task cache when fresh"""
+        cached = self._cached_task(task_id, use_cache)
+        if cached is not None:
+            return cached
+        result = self._make_request(
+            "GET",
+            f"/api/tasks/{task_id}",
+            endpoint="GET /api/tasks/{task_id}"
         )
+        return self._task_result(task_id, result)
+    
+    def get_active_execution(self, task_id: str, use_cache: bool = True) -> Dict[str, Any]:
+        """Get a task's running execution, served from the lookup cache when fresh"""
+        cached = self._cached_active_execution(task_id, use_cache)
+        if cached is not None:
+            return cached
+        result = self._make_request(
+            "GET",
+            f"/api/tasks/{task_id}/active-execution",
+            endpoint="GET /api/tasks/{task_id}/active-execution"
+        )
+        return self._active_execution_result(task_id, result)
+    
+    def tail_logs(self, cursor: Optional[str] = None, max_lines: int = 100) -> Dict[str, Any]:
+        """Service log lines added since the cursor (the last returned one by default)"""
+        try:
+            cursor, params = self._log_params(cursor, max_lines)
+        except ValueError as e:
+            return {"success": False, "error": str(e)}
+        result = self._make_request("GET", "/api/logs", endpoint="GET /api/logs", params=params)
+        return self._tail_result(cursor, result)
+    
+    def dashboard_health(self) -> Dict[str, Any]:
+        """Get a point sample of service CPU, memory and API latency"""
+        return self._dashboard_result(self._make_request("GET", DASHBOARD_HEALTH_PATH))
     
     def health_check(self) -> Dict[str, Any]:
-        """Health check"""
-        result = self._make_request("GET", "/api/health")
-        if result.get("success", True) and "error" not in result:
-            return {
-                "success": True,
-                "message": "Task Manager service is healthy",
-                "config": {
-                    "host": self.host,
-                    "port": self.port,
-                    "base_url": self.base_url
-                },
-                **result
-            }
-        return result
+        """Health check
+        
+        Results are cached for TASK_MANAGER_HEALTH_CACHE_TTL seconds. An
+        expired result is still returned immediately while a background
+        thread refreshes it.
+        """
+        state = self._health_cache_state()
+        if state == "miss":
+            self._store_health(self._make_request("GET", HEALTH_PATH))
+        elif state == "stale" and self._claim_health_refresh():
+            threading.Thread(target=self._refresh_health, name="task-manager-health", daemon=True).start()
+        return self._cached_health()
+    
+    def _refresh_health(self) -> None:
+        result = None
+        try:
+            result = self._make_request("GET", HEALTH_PATH)
+        finally:
+            self._finish_health_refresh(result)
@@ -0,0 +1,514 @@
+#!/usr/bin/env python3
+"""
+Shared configuration and response handling for the HTTP Task Manager clients
+"""
+
+import os
+import threading
+import time
+import uuid
+from typing import Dict, Any, Optional, Tuple
+import httpx
+
+from src.clients.active_execution import MISSING, ActiveExecutionCache
+from src.clients.circuit_breaker import CircuitBreaker
+from src.clients.codec import JsonCodec, get_codec
+from src.clients.latency import LatencyTracker
+from src.clients.log_tail import LogTail
+from src.clients.retry import RetryBudget, backoff_delay, get_retry_budget
+from src.clients.step_shadow import StepShadow
+from src.clients.task_cache import TaskCache
+from src.clients.generated._client.models import (
+    HttpActiveExecutionResponse,
+    HttpDashboardHealthResponse,
+    HttpTaskInfo
+)
+from src.clients.generated._client.types import Unset
+
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+# Methods that are safe to repeat without an idempotency key
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Gateway/availability errors worth retrying; other statuses are final
+RETRYABLE_STATUS_CODES = frozenset({502, 503, 504})
+
+HEALTH_PATH = "/api/health"
+DASHBOARD_HEALTH_PATH = "/api/dashboard/health"
+
+
+def new_idempotency_key() -> str:
+    """Generate a key identifying one logical write operation"""
+    return str(uuid.uuid4())
+
+
+class HttpClientMixin:
+    """Configuration and helpers shared by the sync and async HTTP clients"""
+    
+    def _load_config(self) -> None:
+        """Read connection settings from the environment"""
+        self.host = os.getenv('TASK_MANAGER_HOST', 'localhost')
+        self.port = os.getenv('TASK_MANAGER_PORT', '8080')
+        self.base_url = f"http://{self.host}:{self.port}"
+        self.timeout = int(os.getenv('TASK_MANAGER_TIMEOUT', '30'))
+        self.max_connections = int(os.getenv('TASK_MANAGER_MAX_CONNECTIONS', '10'))
+        self.max_keepalive_connections = int(os.getenv('TASK_MANAGER_MAX_KEEPALIVE', '5'))
+        self.warmup_connections = int(os.getenv('TASK_MANAGER_WARMUP_CONNECTIONS', '2'))
+        self.keepalive_expiry = float(os.getenv('TASK_MANAGER_KEEPALIVE_EXPIRY', '30'))
+        self.max_retries = int(os.getenv('TASK_MANAGER_MAX_RETRIES', '2'))
+        self.retry_base_delay = float(os.getenv('TASK_MANAGER_RETRY_BASE_DELAY', '0.1'))
+        self.retry_max_delay = float(os.getenv('TASK_MANAGER_RETRY_MAX_DELAY', '2'))
+        self.retry_budget: RetryBudget = get_retry_budget()
+        self.codec: JsonCodec = get_codec()
+        self.breaker = CircuitBreaker(
+            failure_rate_threshold=float(os.getenv('TASK_MANAGER_BREAKER_FAILURE_RATE', '0.5')),
+            slow_call_seconds=float(os.getenv('TASK_MANAGER_BREAKER_SLOW_CALL', '5')),
+            slow_call_rate_threshold=float(os.getenv('TASK_MANAGER_BREAKER_SLOW_CALL_RATE', '0.8')),
+            window_size=int(os.getenv('TASK_MANAGER_BREAKER_WINDOW', '20')),
+            minimum_calls=int(os.getenv('TASK_MANAGER_BREAKER_MIN_CALLS', '5')),
+            open_seconds=float(os.getenv('TASK_MANAGER_BREAKER_OPEN_SECONDS', '30'))
+        )
+        self.adaptive_timeout = os.getenv('TASK_MANAGER_ADAPTIVE_TIMEOUT', 'true').lower() == 'true'
+        self.latency = LatencyTracker(
+            default_timeout=self.timeout,
+            min_timeout=float(os.getenv('TASK_MANAGER_TIMEOUT_MIN', '1')),
+            max_timeout=self.timeout,
+            multiplier=float(os.getenv('TASK_MANAGER_TIMEOUT_MULTIPLIER', '3')),
+            connect_timeout=min(self.timeout, float(os.getenv('TASK_MANAGER_CONNECT_TIMEOUT', '5'))),
+            pool_timeout=min(self.timeout, float(os.getenv('TASK_MANAGER_POOL_TIMEOUT', '5')))
+        )
+        self.hedge_reads = os.getenv('TASK_MANAGER_HEDGE_READS', 'false').lower() == 'true'
+        self.hedge_budget = RetryBudget(
+            ratio=float(os.getenv('TASK_MANAGER_HEDGE_BUDGET_RATIO', '0.1')),
+            max_tokens=float(os.getenv('TASK_MANAGER_HEDGE_BUDGET_MAX', '5'))
+        )
+        self.singleflight = os.getenv('TASK_MANAGER_SINGLEFLIGHT', 'true').lower() == 'true'
+        self.health_cache_ttl = float(os.getenv('TASK_MANAGER_HEALTH_CACHE_TTL', '5'))
+        self.health_cache_max_stale = float(os.getenv('TASK_MANAGER_HEALTH_CACHE_MAX_STALE', '60'))
+        self._health_cached: Optional[Dict[str, Any]] = None
+        self._health_cached_at = 0.0
+        self._health_refreshing = False
+        self._health_lock = threading.Lock()
+        self.task_cache = TaskCache(
+            max_entries=int(os.getenv('TASK_MANAGER_TASK_CACHE_SIZE', '256')),
+            ttl=float(os.getenv('TASK_MANAGER_TASK_CACHE_TTL', '30'))
+        )
+        self.active_executions = ActiveExecutionCache(
+            max_entries=int(os.getenv('TASK_MANAGER_ACTIVE_EXECUTION_CACHE_SIZE', '256')),
+            ttl=float(os.getenv('TASK_MANAGER_ACTIVE_EXECUTION_TTL', '5')),
+            negative_ttl=float(os.getenv('TASK_MANAGER_ACTIVE_EXECUTION_NEGATIVE_TTL', '2'))
+        )
+        self.step_shadow = StepShadow(
+            max_executions=int(os.getenv('TASK_MANAGER_STEP_SHADOW_EXECUTIONS', '64')),
+            max_steps=int(os.getenv('TASK_MANAGER_STEP_SHADOW_STEPS', '256'))
+        )
+        self.log_tail = LogTail(buffer_size=int(os.getenv('TASK_MANAGER_LOG_BUFFER', '1000')))
+    
+    def _limits(self) -> httpx.Limits:
+        """Connection pool limits for the underlying httpx client"""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry
+        )
+    
+    def _encode_body(
+        self,
+        json_data: Optional[Dict],
+        headers: Optional[Dict[str, str]]
+    ) -> Tuple[Optional[bytes], Optional[Dict[str, str]]]:
+        """Encode a JSON request body with the configured codec"""
+        if json_data is None:
+            return None, headers
+        return self.codec.dumps(json_data), {"Content-Type": "application/json", **(headers or {})}
+    
+    def _is_retryable_request(
+        self,
+        method: str,
+        headers: Optional[Dict[str, str]],
+        idempotent: Optional[bool]
+    ) -> bool:
+        """Whether repeating this request cannot apply it twice"""
+        if idempotent is not None:
+            return idempotent
+        return method.upper() in IDEMPOTENT_METHODS or bool(headers and headers.get(IDEMPOTENCY_HEADER))
+    
+    def _retry_delay(
+        self,
+        attempt: int,
+        exc: Optional[Exception] = None,
+        status_code: Optional[int] = None
+    ) -> Optional[float]:
+        """Backoff before the next attempt, or None if the call should not be retried
+        
+        Only transient failures (timeouts, connect errors, 502/503/504) are
+        retried, up to max_retries and while the shared budget allows it.
+        """
+        if exc is not None and not isinstance(exc, (httpx.TimeoutException, httpx.ConnectError)):
+            return None
+        if exc is None and status_code not in RETRYABLE_STATUS_CODES:
+            return None
+        if attempt > self.max_retries or not self.retry_budget.try_acquire():
+            return None
+        return backoff_delay(attempt, self.retry_base_delay, self.retry_max_delay)
+    
+    def _request_timeout(self, endpoint: str) -> httpx.Timeout:
+        """Timeout for the next call to an endpoint, adapted to its observed latency"""
+        if self.adaptive_timeout:
+            return self.latency.timeout_for(endpoint)
+        return httpx.Timeout(self.timeout)
+    
+    @staticmethod
+    def _flight_key(method: str, path: str, params: Optional[Dict[str, Any]]) -> Tuple:
+        """Singleflight key identifying identical reads"""
+        return (method.upper(), path, tuple(sorted((params or {}).items())))
+    
+    @staticmethod
+    def _copy_result(result: Any) -> Any:
+        """Give each singleflight caller its own top-level result dict"""
+        return dict(result) if isinstance(result, dict) else result
+    
+    def _hedge_delay(self, method: str, endpoint: str) -> Optional[float]:
+        """How long to wait before hedging a read, or None to send it once
+        
+        Only GETs are hedged, and only once their endpoint has enough
+        latency samples for a p95.
+        """
+        if not self.hedge_reads or method.upper() != "GET":
+            return None
+        self.hedge_budget.record_request()
+        return self.latency.percentile(endpoint, 95)
+    
+    def _record_outcome(
+        self,
+        path: str,
+        endpoint: str,
+        duration: float,
+        exc: Optional[Exception] = None,
+        status_code: Optional[int] = None
+    ) -> None:
+        """Feed one attempt into the latency tracker and the circuit breaker
+        
+        Timeouts are recorded as latency samples too, so timeouts grow back
+        during slow periods. Health requests act as breaker probes; the
+        optional dashboard endpoint never affects the breaker; other calls
+        count as failures on transport errors and 5xx responses.
+        """
+        if exc is None or isinstance(exc, httpx.TimeoutException):
+            self.latency.record(endpoint, duration)
+        if path == HEALTH_PATH:
+            self.breaker.record_probe(exc is None and status_code < 400)
+        elif path != DASHBOARD_HEALTH_PATH:
+            self.breaker.record(exc is None and status_code < 500, duration)
+    
+    def _circuit_open_result(self) -> Dict[str, Any]:
+        """Fail-fast result returned while the circuit breaker is open"""
+        return {
+            "success": False,
+            "error": f"Circuit breaker is open for Task Manager service at {self.base_url}",
+            "error_type": "circuit_open",
+            "circuit_breaker": self.breaker.snapshot(),
+            "hint": "Recent requests failed or were too slow; calls resume once a health probe succeeds."
+        }
+    
+    @staticmethod
+    def _with_attempts(result: Any, attempts: int) -> Any:
+        """Record how many attempts a call took in its result"""
+        if isinstance(result, dict):
+            result["attempts"] = attempts
+        return result
+    
+    def _handle_response(
+        self,
+        method: str,
+        path: str,
+        response: httpx.Response
+    ) -> Dict[str, Any]:
+        """Convert an HTTP response into a result dict"""
+        if response.status_code >= 400:
+            # Handle common HTTP error status codes
+            if response.status_code == 404:
+                return {
+                    "success": False,
+                    "error": f"API endpoint not found: {method} {path}. The backend service may not have implemented this API yet.",
+                    "status_code": 404,
+                    "hint": "Please check if the Task Manager backend service has this endpoint implemented."
+                }
+            elif response.status_code == 500:
+                return {
+                    "success": False,
+                    "error": f"Backend server error (500). The Task Manager service encountered an internal error.",
+                    "status_code": 500,
+                    "hint": "Please check the Task Manager service logs for details."
+                }
+            
+            # Try to parse JSON error response
+            try:
+                error_data = self.codec.loads(response.content)
+                return {
+                    "success": False,
+                    "error": error_data.get("error", f"HTTP {response.status_code} error"),
+                    "error_code": error_data.get("error_code"),
+                    "status_code": response.status_code
+                }
+            except Exception:
+                # If unable to parse JSON, return generic error message
+                return {
+                    "success": False,
+                    "error": f"HTTP {response.status_code} error: {response.text[:200]}",
+                    "status_code": response.status_code
+                }
+        
+        return self.codec.loads(response.content)
+    
+    @staticmethod
+    def _timeout_seconds(exc: httpx.TimeoutException, timeout: httpx.Timeout) -> Optional[float]:
+        """The limit of the httpx timeout phase that raised ``exc``"""
+        if isinstance(exc, httpx.ConnectTimeout):
+            return timeout.connect
+        if isinstance(exc, httpx.PoolTimeout):
+            return timeout.pool
+        if isinstance(exc, httpx.WriteTimeout):
+            return timeout.write
+        return timeout.read
+    
+    def _handle_exception(self, exc: Exception, timeout: Optional[httpx.Timeout] = None) -> Dict[str, Any]:
+        """Convert a transport exception into a result dict"""
+        if isinstance(exc, httpx.TimeoutException):
+            seconds = self._timeout_seconds(exc, timeout) if timeout is not None else None
+            return {
+                "success": False,
+                "error": f"Request timeout after {seconds or self.timeout} seconds",
+                "error_type": "timeout",
+                "hint": "The Task Manager service may be slow or unresponsive. Try increasing TASK_MANAGER_TIMEOUT."
+            }
+        if isinstance(exc, httpx.ConnectError):
+            return {
+                "success": False,
+                "error": f"Cannot connect to Task Manager service at {self.base_url}",
+                "error_type": "connection",
+                "hint": "Please verify that the Task Manager service is running and the host/port are correct."
+            }
+        return {
+            "success": False,
+            "error": f"Request failed: {str(exc)}",
+            "hint": "An unexpected error occurred. Please check the error message above."
+        }
+    
+    @staticmethod
+    def _create_step_body(
+        step_name: str,
+        message: Optional[str] = None,
+        status: Optional[str] = None,
+        step_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build the request body for creating a step"""
+        body = {"step_name": step_name}
+        if step_id is not None:
+            body["step_id"] = step_id
+        if message is not None:
+            body["message"] = message
+        if status is not None:
+            body["status"] = status
+        return body
+    
+    @staticmethod
+    def _patch_step_body(
+        status: Optional[str] = None,
+        message: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build the request body for patching a step"""
+        body = {}
+        if status is not None:
+            body["status"] = status
+        if message is not None:
+            body["message"] = message
+        return body
+    
+    def _cached_task(self, task_id: str, use_cache: bool) -> Optional[Dict[str, Any]]:
+        """Result for a cached task, or None if it has to be fetched"""
+        if not use_cache or self.task_cache.ttl <= 0:
+            return None
+        info = self.task_cache.get(task_id)
+        if info is None:
+            return None
+        return {"success": True, "cached": True, "data": info.to_dict()}
+    
+    def _task_result(self, task_id: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse a /api/tasks/{task_id} result and cache the task it carries"""
+        if not result.get("success") or not isinstance(result.get("data"), dict):
+            return result
+        info = self.task_cache.put(task_id, HttpTaskInfo.from_dict(result["data"]))
+        return {**result, "cached": False, "data": info.to_dict()}
+    
+    def _cached_active_execution(self, task_id: str, use_cache: bool) -> Optional[Dict[str, Any]]:
+        """Result for a cached active-execution lookup, or None if it has to be fetched"""
+        if not use_cache:
+            return None
+        execution = self.active_executions.get(task_id)
+        if execution is MISSING:
+            return None
+        return {
+            "success": True,
+            "cached": True,
+            "active": execution is not None,
+            "data": execution.to_dict() if execution is not None else None
+        }
+    
+    def _active_execution_result(self, task_id: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse a /api/tasks/{task_id}/active-execution result and cache it
+        
+        A 404 or a null/absent data field means the task has no active
+        execution; it is cached as such.
+        """
+        if result.get("status_code") == 404 or (result.get("success") and result.get("data") is None):
+            execution = None
+        elif not result.get("success"):
+            return result
+        else:
+            data = HttpActiveExecutionResponse.from_dict(result).data
+            execution = None if isinstance(data, Unset) else data
+        self.active_executions.put(task_id, execution)
+        return {
+            "success": True,
+            "cached": False,
+            "active": execution is not None,
+            "data": execution.to_dict() if execution is not None else None,
+            "attempts": result.get("attempts")
+        }
+    
+    def _after_execution_write(self, execution_id: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Invalidate active-execution lookups a write to this execution may affect"""
+        self.active_executions.invalidate_execution(execution_id)
+        return result
+    
+    def _skipped_step_patch(self, execution_id: str, step_id: str, body: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Result for a step PATCH that would not change the acknowledged state, else None"""
+        data = self.step_shadow.unchanged_step(execution_id, step_id, body)
+        if data is None:
+            return None
+        return {"success": True, "skipped": True, "data": data, "attempts": 0}
+    
+    def _skipped_execution_patch(self, execution_id: str, body: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Result for an execution PATCH that would not change the acknowledged state, else None"""
+        data = self.step_shadow.unchanged_execution(execution_id, body)
+        if data is None:
+            return None
+        return {"success": True, "skipped": True, "data": data, "attempts": 0}
+    
+    def _after_step_write(
+        self,
+        execution_id: str,
+        step_id: Optional[str],
+        body: Dict[str, Any],
+        result: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Update the step shadow from a create/patch result"""
+        data = result.get("data") if isinstance(result.get("data"), dict) else None
+        step_id = step_id or (data or {}).get("step_id")
+        if step_id:
+            if result.get("success"):
+                self.step_shadow.record_step(execution_id, step_id, body, data)
+            else:
+                self.step_shadow.forget_step(execution_id, step_id)
+        return self._after_execution_write(execution_id, result)
+    
+    def _after_execution_patch(self, execution_id: str, body: Dict[str, Any], result: Dict[str, Any]) -> Dict[str, Any]:
+        """Update the execution shadow from a patch result"""
+        if result.get("success"):
+            data = result.get("data") if isinstance(result.get("data"), dict) else None
+            self.step_shadow.record_execution(execution_id, body, data)
+        else:
+            self.step_shadow.forget_execution(execution_id)
+        return self._after_execution_write(execution_id, result)
+    
+    def _log_params(self, cursor: Optional[str], max_lines: int) -> Tuple[Optional[str], Dict[str, Any]]:
+        """Cursor to continue from (the last one by default) and its /api/logs query
+        
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        cursor = cursor if cursor is not None else self.log_tail.cursor
+        return cursor, LogTail.params(cursor, max_lines)
+    
+    def _tail_result(self, cursor: Optional[str], result: Dict[str, Any]) -> Dict[str, Any]:
+        """Reduce a /api/logs result to the lines after the cursor"""
+        if not result.get("success") or not isinstance(result.get("data"), dict):
+            return result
+        return {**result, "data": self.log_tail.advance(cursor, result["data"])}
+    
+    @staticmethod
+    def _dashboard_result(result: Dict[str, Any]) -> Dict[str, Any]:
+        """Wrap a raw /api/dashboard/health sample in a result dict"""
+        if result.get("success") is False or "error" in result:
+            return result
+        sample = HttpDashboardHealthResponse.from_dict(result)
+        data = sample.to_dict()
+        for key in sample.additional_keys:
+            data.pop(key, None)
+        return {"success": True, "attempts": result.get("attempts"), "data": data}
+    
+    def _health_cache_state(self) -> str:
+        """"fresh", "stale" (serve and refresh in background) or "miss" (fetch now)
+        
+        Only healthy results are served from cache, so an outage and the
+        recovery from it are seen by the next call.
+        """
+        if self._health_cached is None or self.health_cache_ttl <= 0:
+            return "miss"
+        if self._health_cached.get("success") is False or "error" in self._health_cached:
+            return "miss"
+        age = time.monotonic() - self._health_cached_at
+        if age < self.health_cache_ttl:
+            return "fresh"
+        if age < self.health_cache_ttl + self.health_cache_max_stale:
+            return "stale"
+        return "miss"
+    
+    def _claim_health_refresh(self) -> bool:
+        """Let exactly one caller start the background health refresh"""
+        with self._health_lock:
+            if self._health_refreshing:
+                return False
+            self._health_refreshing = True
+            return True
+    
+    def _store_health(self, result: Dict[str, Any]) -> None:
+        """Cache a raw /api/health result"""
+        self._health_cached = result
+        self._health_cached_at = time.monotonic()
+    
+    def _finish_health_refresh(self, result: Optional[Dict[str, Any]]) -> None:
+        if result is not None:
+            self._store_health(result)
+        with self._health_lock:
+            self._health_refreshing = False
+    
+    def _cached_health(self) -> Dict[str, Any]:
+        """The cached health result, decorated with its age"""
+        result = self._health_result(dict(self._health_cached))
+        result["config"] = {
+            "host": self.host,
+            "port": self.port,
+            "base_url": self.base_url,
+            **result.get("config", {}),
+            "cache_age_seconds": round(time.monotonic() - self._health_cached_at, 3)
+        }
+        return result
+    
+    def _health_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Decorate a raw /api/health result with client configuration and breaker state"""
+        if result.get("success", True) and "error" not in result:
+            return {
+                "success": True,
+                "message": "Task Manager service is healthy",
+                "config": {
+                    "host": self.host,
+                    "port": self.port,
+                    "base_url": self.base_url
+                },
+                **result,
+                "circuit_breaker": self.breaker.snapshot()
+            }
+        return {**result, "circuit_breaker": self.breaker.snapshot()}
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Per-endpoint latency tracking and adaptive timeouts
+"""
+
+import math
+import threading
+from collections import deque
+from typing import Dict, Optional
+
+import httpx
+
+
+class LatencyTracker:
+    """Rolling latency samples per endpoint with derived timeouts
+    
+    The last ``window`` durations of each endpoint (e.g. "PATCH
+    /api/executions/{execution_id}/steps/{step_id}") are kept. Once an
+    endpoint has ``min_samples`` samples its read and write timeouts are
+    its p99 times ``multiplier``, clamped to [min_timeout, max_timeout];
+    before that the ``default_timeout`` is used. Connect and pool timeouts
+    do not depend on the endpoint (they cover TCP/TLS setup and waiting
+    for a pooled connection) and keep their own fixed values.
+    
+    Args:
+        default_timeout: Timeout used until enough samples are collected
+        min_timeout: Lower bound for derived timeouts (seconds)
+        max_timeout: Upper bound for derived timeouts (seconds)
+        multiplier: Factor applied to the p99 latency
+        window: Samples kept per endpoint
+        min_samples: Samples required before timeouts adapt
+        connect_timeout: Connect timeout (default: default_timeout)
+        pool_timeout: Timeout waiting for a pooled connection (default: default_timeout)
+    """
+    
+    def __init__(
+        self,
+        default_timeout: float,
+        min_timeout: float = 1.0,
+        max_timeout: Optional[float] = None,
+        multiplier: float = 3.0,
+        window: int = 200,
+        min_samples: int = 20,
+        connect_timeout: Optional[float] = None,
+        pool_timeout: Optional[float] = None
+    ):
+        self.default_timeout = default_timeout
+        self.connect_timeout = connect_timeout if connect_timeout is not None else default_timeout
+        self.pool_timeout = pool_timeout if pool_timeout is not None else default_timeout
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout if max_timeout is not None else default_timeout
+        self.multiplier = multiplier
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+    
+    def record(self, endpoint: str, duration: float) -> None:
+        """Add a latency sample for an endpoint"""
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None:
+                samples = self._samples[endpoint] = deque(maxlen=self.window)
+            samples.append(duration)
+    
+    def percentile(self, endpoint: str, q: float) -> Optional[float]:
+        """Latency percentile (0-100) for an endpoint, or None without enough samples"""
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if not samples or len(samples) < self.min_samples:
+                return None
+            ordered = sorted(samples)
+        index = min(len(ordered) - 1, max(0, math.ceil(q / 100 * len(ordered)) - 1))
+        return ordered[index]
+    
+    def timeout_seconds(self, endpoint: str) -> float:
+        """Read/write timeout (seconds) for the next call to an endpoint"""
+        p99 = self.percentile(endpoint, 99)
+        if p99 is None:
+            return self.default_timeout
+        return min(self.max_timeout, max(self.min_timeout, p99 * self.multiplier))
+    
+    def timeout_for(self, endpoint: str) -> httpx.Timeout:
+        """httpx timeouts for the next call to an endpoint: adaptive read/write, fixed connect/pool"""
+        return httpx.Timeout(self.timeout_seconds(endpoint), connect=self.connect_timeout, pool=self.pool_timeout)
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Incremental tailing of the Task Manager service log (/api/logs)
+"""
+
+import hashlib
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+
+def _line_hash(line: str) -> str:
+    return hashlib.sha1(line.encode("utf-8", "replace")).hexdigest()[:12]
+
+
+def parse_cursor(cursor: str) -> Tuple[int, str]:
+    """Split a cursor into (absolute line position, hash of the last seen line)
+    
+    Raises:
+        ValueError: If the cursor was not produced by LogTail
+    """
+    position, sep, last_hash = cursor.partition(":")
+    if not sep or not position.isdigit():
+        raise ValueError(f"Invalid log cursor '{cursor}'; pass the cursor returned by the previous call")
+    return int(position), last_hash
+
+
+def format_cursor(position: int, last_hash: str) -> str:
+    return f"{position}:{last_hash}"
+
+
+def _overlap(recent: Deque[str], logs: List[str]) -> int:
+    """Length of the longest prefix of ``logs`` that ends the ``recent`` lines"""
+    recent_list = list(recent)
+    for size in range(min(len(recent_list), len(logs)), 0, -1):
+        if recent_list[-size:] == logs[:size]:
+            return size
+    return 0
+
+
+class LogTail:
+    """Cursor over the service log that yields only lines not seen before
+    
+    A cursor is ``"<position>:<hash>"``: the absolute number of lines
+    consumed so far and a hash of the last of them. It is sent as the
+    ``offset`` query parameter of GET /api/logs. Servers that ignore
+    ``offset`` return the tail instead; the new lines are then located
+    from ``total_lines``, and when that is missing or the log was rotated
+    (fewer lines than the cursor, or a different line at its position) by
+    matching the tail against a bounded ring buffer of recently returned
+    lines.
+    
+    Args:
+        buffer_size: Number of recently returned lines kept for matching
+    """
+    
+    def __init__(self, buffer_size: int = 1000):
+        self.cursor: Optional[str] = None
+        self._recent: Deque[str] = deque(maxlen=max(1, buffer_size))
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def params(cursor: Optional[str], max_lines: int) -> Dict[str, Any]:
+        """Query parameters for GET /api/logs
+        
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        params: Dict[str, Any] = {"lines": max_lines}
+        if cursor is not None:
+            params["offset"] = parse_cursor(cursor)[0]
+        return params
+    
+    def advance(self, cursor: Optional[str], data: Dict[str, Any]) -> Dict[str, Any]:
+        """Reduce one /api/logs response to the lines after ``cursor``
+        
+        Returns:
+            Dict with the new 'lines', the 'cursor' to pass next time,
+            'truncated' (lines between the cursor and the first returned
+            line were lost) and 'more' (further lines are already available)
+        """
+        logs: List[str] = list(data.get("logs") or [])
+        total = data.get("total_lines")
+        offset = data.get("offset")
+        if offset is None and isinstance(total, int):
+            start: Optional[int] = max(0, total - len(logs))
+        else:
+            start = offset
+        
+        with self._lock:
+            # The ring buffer only describes the stream this instance follows
+            use_recent = cursor is not None and cursor == self.cursor
+            truncated = False
+            if cursor is None:
+                new = logs
+            else:
+                position, last_hash = parse_cursor(cursor)
+                rotated = isinstance(total, int) and total < position
+                if start is not None and not rotated:
+                    index = position - 1 - start
+                    if offset is None and 0 <= index < len(logs) and _line_hash(logs[index]) != last_hash:
+                        rotated = True
+                if start is not None and not rotated:
+                    truncated = start > position
+                    new = logs[max(0, position - start):]
+                elif use_recent and not rotated:
+                    size = _overlap(self._recent, logs)
+                    truncated = size == 0 and bool(logs) and bool(self._recent)
+                    new = logs[size:]
+                else:
+                    # Log rotated: everything returned is new
+                    truncated = bool(start)
+                    new = logs
+                    self._recent.clear()
+            
+            if start is not None:
+                next_position = start + len(logs)
+            else:
+                next_position = (parse_cursor(cursor)[0] if cursor is not None else 0) + len(new)
+            if logs:
+                next_hash = _line_hash(logs[-1])
+            elif cursor is not None:
+                next_hash = parse_cursor(cursor)[1]
+            else:
+                next_hash = ""
+            self._recent.extend(new)
+            self.cursor = format_cursor(next_position, next_hash)
+            return {
+                "lines": new,
+                "cursor": self.cursor,
+                "truncated": truncated,
+                "more": isinstance(total, int) and total > next_position
+            }
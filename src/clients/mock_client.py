@@ -3,11 +3,13 @@
 Mock client implementation for testing
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 from datetime import datetime, timezone
+import random
 import uuid
 
-from src.clients.base_client import TaskManagerClientBase
+from src.clients.base_client import TaskManagerClientBase, AsyncTaskManagerClientBase
+from src.clients.log_tail import LogTail
 
 
 class MockTaskManagerClient(TaskManagerClientBase):
@@ -16,6 +18,23 @@ class MockTaskManagerClient(TaskManagerClientBase):
     def __init__(self):
         self._executions: Dict[str, Dict] = {}
         self._steps: Dict[str, Dict] = {}
+        self._idempotency_keys: Dict[str, str] = {}
+        self._tasks: Dict[str, Dict] = {}
+        self._logs: List[str] = []
+        self._log_tail = LogTail()
+    
+    def _log(self, message: str) -> None:
+        self._logs.append(f"{datetime.now(timezone.utc).isoformat()} INFO {message}")
+    
+    def add_execution(self, execution_id: str, task_id: str, status: str = "running") -> Dict[str, Any]:
+        """Seed an execution of a task (the real service creates these, not the agent)"""
+        execution = self._executions.setdefault(execution_id, {
+            "execution_id": execution_id,
+            "started_at": datetime.now(timezone.utc).isoformat()
+        })
+        execution.update(task_id=task_id, status=status)
+        self._log(f"execution {execution_id} of task {task_id} is {status}")
+        return execution
     
     def patch_execution(
         self, 
@@ -31,6 +50,7 @@ class MockTaskManagerClient(TaskManagerClientBase):
             }
         
         self._executions[execution_id]["session_id"] = session_id
+        self._log(f"execution {execution_id} session set to {session_id}")
         
         return {
             "success": True,
@@ -42,10 +62,25 @@ class MockTaskManagerClient(TaskManagerClientBase):
         execution_id: str, 
         step_name: str,
         message: Optional[str] = None,
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+        step_id: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Create a new step for an execution"""
-        step_id = str(uuid.uuid4())[:8]
+        """Create a new step for an execution
+        
+        Repeating an idempotency key for the same execution returns the
+        step created by the first request. A client-allocated step_id is
+        used as-is (and as the idempotency key when none is given).
+        """
+        idempotency_key = idempotency_key or step_id
+        key = f"{execution_id}:{idempotency_key}" if idempotency_key else None
+        if key in self._idempotency_keys:
+            return {
+                "success": True,
+                "data": self._steps[self._idempotency_keys[key]]
+            }
+        
+        step_id = step_id or str(uuid.uuid4())[:8]
         
         step = {
             "step_id": step_id,
@@ -57,6 +92,9 @@ class MockTaskManagerClient(TaskManagerClientBase):
         }
         
         self._steps[step_id] = step
+        self._log(f"step {step_id} '{step_name}' created in execution {execution_id}")
+        if key:
+            self._idempotency_keys[key] = step_id
         
         return {
             "success": True,
@@ -84,12 +122,67 @@ class MockTaskManagerClient(TaskManagerClientBase):
                 step["completed_at"] = datetime.now(timezone.utc).isoformat()
         if message:
             step["message"] = message
+        self._log(f"step {step_id} updated (status={step['status']})")
         
         return {
             "success": True,
             "data": step
         }
     
+    def get_task(self, task_id: str, use_cache: bool = True) -> Dict[str, Any]:
+        """Get task information"""
+        if task_id not in self._tasks:
+            now = datetime.now(timezone.utc).isoformat()
+            self._tasks[task_id] = {
+                "task_id": task_id,
+                "status": "running",
+                "retry_count": 0,
+                "created_at": now,
+                "updated_at": now
+            }
+        
+        return {
+            "success": True,
+            "data": self._tasks[task_id]
+        }
+    
+    def get_active_execution(self, task_id: str, use_cache: bool = True) -> Dict[str, Any]:
+        """Get the running execution of a task, if any"""
+        for execution in self._executions.values():
+            if execution.get("task_id") == task_id and execution.get("status") == "running":
+                return {"success": True, "active": True, "data": execution}
+        return {"success": True, "active": False, "data": None}
+    
+    def tail_logs(self, cursor: Optional[str] = None, max_lines: int = 100) -> Dict[str, Any]:
+        """Get log lines recorded since the cursor (honours offset like the real service)"""
+        cursor = cursor if cursor is not None else self._log_tail.cursor
+        try:
+            offset = LogTail.params(cursor, max_lines).get("offset")
+        except ValueError as e:
+            return {"success": False, "error": str(e)}
+        start = max(0, len(self._logs) - max_lines) if offset is None else offset
+        data = {
+            "logs": self._logs[start:start + max_lines],
+            "lines": max_lines,
+            "offset": start,
+            "total_lines": len(self._logs)
+        }
+        return {"success": True, "data": self._log_tail.advance(cursor, data)}
+    
+    def dashboard_health(self) -> Dict[str, Any]:
+        """Synthetic system metrics"""
+        return {
+            "success": True,
+            "data": {
+                "status": "healthy",
+                "cpu_percent": round(random.uniform(5, 40), 1),
+                "memory_percent": round(random.uniform(20, 60), 1),
+                "memory_used_mb": round(random.uniform(200, 800), 1),
+                "avg_latency_ms": round(random.uniform(2, 20), 1),
+                "timestamp": datetime.now(timezone.utc).isoformat()
+            }
+        }
+    
     def health_check(self) -> Dict[str, Any]:
         """Health check"""
         return {
@@ -98,3 +191,64 @@ class MockTaskManagerClient(TaskManagerClientBase):
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "version": "mock-1.0.0"
         }
+
+
+class AsyncMockTaskManagerClient(AsyncTaskManagerClientBase):
+    """Async mock implementation backed by an in-memory MockTaskManagerClient"""
+    
+    def __init__(self, sync_client: Optional[MockTaskManagerClient] = None):
+        self._sync = sync_client or MockTaskManagerClient()
+    
+    def add_execution(self, execution_id: str, task_id: str, status: str = "running") -> Dict[str, Any]:
+        """Seed an execution of a task"""
+        return self._sync.add_execution(execution_id, task_id, status)
+    
+    async def patch_execution(
+        self, 
+        execution_id: str, 
+        session_id: str
+    ) -> Dict[str, Any]:
+        """Update execution's session_id"""
+        return self._sync.patch_execution(execution_id, session_id)
+    
+    async def create_step(
+        self, 
+        execution_id: str, 
+        step_name: str,
+        message: Optional[str] = None,
+        status: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+        step_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Create a new step for an execution"""
+        return self._sync.create_step(execution_id, step_name, message, status, idempotency_key, step_id)
+    
+    async def patch_step(
+        self, 
+        execution_id: str, 
+        step_id: str,
+        status: Optional[str] = None,
+        message: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Partially update a step"""
+        return self._sync.patch_step(execution_id, step_id, status, message)
+    
+    async def get_task(self, task_id: str, use_cache: bool = True) -> Dict[str, Any]:
+        """Get task information"""
+        return self._sync.get_task(task_id, use_cache)
+    
+    async def get_active_execution(self, task_id: str, use_cache: bool = True) -> Dict[str, Any]:
+        """Get the running execution of a task, if any"""
+        return self._sync.get_active_execution(task_id, use_cache)
+    
+    async def tail_logs(self, cursor: Optional[str] = None, max_lines: int = 100) -> Dict[str, Any]:
+        """Get log lines recorded since the cursor"""
+        return self._sync.tail_logs(cursor, max_lines)
+    
+    async def dashboard_health(self) -> Dict[str, Any]:
+        """Synthetic system metrics"""
+        return self._sync.dashboard_health()
+    
+    async def health_check(self) -> Dict[str, Any]:
+        """Health check"""
+        return self._sync.health_check()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Streaming iteration over paginated /api/executions results
+"""
+
+import asyncio
+import math
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import AsyncIterator, Deque, Iterator, List, Optional, Union
+
+from src.clients import generated_calls
+from src.clients.generated._client.api.executions import get_api_executions
+from src.clients.generated._client.client import AuthenticatedClient, Client
+from src.clients.generated._client.models import (
+    GetApiExecutionsStatus,
+    HttpExecutionInfo,
+    HttpExecutionsData,
+    HttpExecutionsResponse
+)
+from src.clients.generated._client.types import UNSET, Response, Unset
+
+
+class PageFetchError(Exception):
+    """A page of results could not be fetched"""
+    
+    def __init__(self, page: int, status_code: int, content: bytes):
+        self.page = page
+        self.status_code = status_code
+        self.content = content
+        super().__init__(f"Failed to fetch page {page}: HTTP {status_code} {content[:200]!r}")
+
+
+def _page_data(page: int, response: Response) -> HttpExecutionsData:
+    if response.status_code != 200 or not isinstance(response.parsed, HttpExecutionsResponse):
+        raise PageFetchError(page, int(response.status_code), response.content)
+    data = response.parsed.data
+    return data if not isinstance(data, Unset) else HttpExecutionsData(executions=[])
+
+
+def _items(data: HttpExecutionsData) -> List[HttpExecutionInfo]:
+    return [] if isinstance(data.executions, Unset) else data.executions
+
+
+def _last_page(data: HttpExecutionsData, limit: int) -> Optional[int]:
+    """Last page number according to total_count, if the server reported it"""
+    if isinstance(data.total_count, Unset):
+        return None
+    return max(1, math.ceil(data.total_count / limit))
+
+
+def _is_final(page: int, data: HttpExecutionsData, limit: int, last_page: Optional[int]) -> bool:
+    if last_page is not None and page >= last_page:
+        return True
+    return len(_items(data)) < limit
+
+
+def iter_executions(
+    client: Union[AuthenticatedClient, Client],
+    *,
+    task_id: Union[str, Unset] = UNSET,
+    status: Union[GetApiExecutionsStatus, Unset] = UNSET,
+    limit: int = 100,
+    prefetch: int = 1
+) -> Iterator[HttpExecutionInfo]:
+    """Yield matching executions across all pages
+    
+    While a page is being consumed, up to ``prefetch`` following pages are
+    fetched concurrently. Pages past the last one implied by total_count
+    are never requested, so at most ``prefetch + 1`` pages are held in
+    memory at any time regardless of how many executions match. Pages are
+    decoded with the configured JSON codec (see codec.get_codec).
+    
+    Raises:
+        PageFetchError: If the service answers a page with an error
+    """
+    def fetch(page: int) -> HttpExecutionsData:
+        response = generated_calls.sync_detailed(
+            get_api_executions, client=client, task_id=task_id, status=status, page=page, limit=limit
+        )
+        return _page_data(page, response)
+    
+    data = fetch(1)
+    last_page = _last_page(data, limit)
+    pool = ThreadPoolExecutor(max_workers=max(1, prefetch), thread_name_prefix="task-manager-pages")
+    pending: Deque[Future] = deque()
+    next_page = 2
+    
+    def fill() -> None:
+        nonlocal next_page
+        while len(pending) < max(1, prefetch) and (last_page is None or next_page <= last_page):
+            pending.append(pool.submit(fetch, next_page))
+            next_page += 1
+    
+    try:
+        final = _is_final(1, data, limit, last_page)
+        if not final:
+            fill()
+        yield from _items(data)
+        page = 1
+        while pending and not final:
+            data = pending.popleft().result()
+            page += 1
+            final = _is_final(page, data, limit, last_page)
+            if not final:
+                fill()
+            yield from _items(data)
+    finally:
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=False)
+
+
+async def aiter_executions(
+    client: Union[AuthenticatedClient, Client],
+    *,
+    task_id: Union[str, Unset] = UNSET,
+    status: Union[GetApiExecutionsStatus, Unset] = UNSET,
+    limit: int = 100,
+    prefetch: int = 1
+) -> AsyncIterator[HttpExecutionInfo]:
+    """Async version of iter_executions; prefetched pages are asyncio tasks"""
+    async def fetch(page: int) -> HttpExecutionsData:
+        response = await generated_calls.asyncio_detailed(
+            get_api_executions, client=client, task_id=task_id, status=status, page=page, limit=limit
+        )
+        return _page_data(page, response)
+    
+    data = await fetch(1)
+    last_page = _last_page(data, limit)
+    pending: Deque[asyncio.Task] = deque()
+    next_page = 2
+    
+    def fill() -> None:
+        nonlocal next_page
+        while len(pending) < max(1, prefetch) and (last_page is None or next_page <= last_page):
+            pending.append(asyncio.ensure_future(fetch(next_page)))
+            next_page += 1
+    
+    try:
+        final = _is_final(1, data, limit, last_page)
+        if not final:
+            fill()
+        for item in _items(data):
+            yield item
+        page = 1
+        while pending and not final:
+            data = await pending.popleft()
+            page += 1
+            final = _is_final(page, data, limit, last_page)
+            if not final:
+                fill()
+            for item in _items(data):
+                yield item
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Retry policy helpers: exponential backoff with full jitter and a retry budget
+"""
+
+import os
+import random
+import threading
+from typing import Optional
+
+
+class RetryBudget:
+    """Token bucket that caps retries to a fraction of regular requests
+    
+    Every first attempt deposits ``ratio`` tokens (up to ``max_tokens``) and
+    every retry withdraws one, so retries can never exceed roughly
+    ``ratio`` times the request rate. A struggling backend therefore sees
+    at most a bounded amount of extra load instead of a retry storm.
+    """
+    
+    def __init__(self, ratio: float = 0.2, max_tokens: float = 10.0, initial_tokens: Optional[float] = None):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens if initial_tokens is None else initial_tokens
+        self._lock = threading.Lock()
+    
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+    
+    def record_request(self) -> None:
+        """Credit the budget for a first attempt"""
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+    
+    def try_acquire(self) -> bool:
+        """Withdraw one retry from the budget if available"""
+        with self._lock:
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return True
+            return False
+
+
+_shared_budget: Optional[RetryBudget] = None
+_shared_budget_lock = threading.Lock()
+
+
+def get_retry_budget() -> RetryBudget:
+    """Process-wide retry budget shared by every client instance"""
+    global _shared_budget
+    if _shared_budget is None:
+        with _shared_budget_lock:
+            if _shared_budget is None:
+                _shared_budget = RetryBudget(
+                    ratio=float(os.getenv('TASK_MANAGER_RETRY_BUDGET_RATIO', '0.2')),
+                    max_tokens=float(os.getenv('TASK_MANAGER_RETRY_BUDGET_MAX', '10'))
+                )
+    return _shared_budget
+
+
+def backoff_delay(attempt: int, base_delay: float, max_delay: float) -> float:
+    """Full-jitter exponential backoff delay before retry number ``attempt``"""
+    return random.uniform(0, min(max_delay, base_delay * (2 ** (attempt - 1))))
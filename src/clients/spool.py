@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Durable on-disk spool for write operations the backend could not accept
+"""
+
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, List
+
+from src.clients.base_client import AsyncTaskManagerClientBase
+from src.clients.http_common import new_idempotency_key
+from src.clients.step_ids import new_step_id
+
+
+# Operations that are recorded in the spool when the backend is unreachable
+SPOOLED_OPERATIONS = ("patch_execution", "create_step", "patch_step")
+
+FSYNC_POLICIES = ("always", "interval", "never")
+
+
+def is_undeliverable(result: Dict[str, Any]) -> bool:
+    """Whether a result means the request never reached a working backend"""
+    return not result.get("success") and result.get("error_type") in ("connection", "timeout", "circuit_open")
+
+
+class SpoolFile:
+    """Append-only JSON-lines write-ahead log with an fsync policy and size cap
+    
+    Args:
+        path: Spool file location (parent directories are created)
+        fsync_policy: "always" fsyncs every append, "interval" at most once
+            per fsync_interval seconds, "never" leaves it to the OS
+        max_bytes: Appends that would grow the file past this size are refused
+    """
+    
+    def __init__(
+        self,
+        path: str,
+        fsync_policy: str = "always",
+        max_bytes: int = 10 * 1024 * 1024,
+        fsync_interval: float = 1.0
+    ):
+        if fsync_policy not in FSYNC_POLICIES:
+            raise ValueError(f"Invalid fsync policy '{fsync_policy}'. Must be one of: {', '.join(FSYNC_POLICIES)}")
+        self.path = path
+        self.fsync_policy = fsync_policy
+        self.max_bytes = max_bytes
+        self.fsync_interval = fsync_interval
+        self._last_fsync = 0.0
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._truncate_torn_tail()
+    
+    def _truncate_torn_tail(self) -> None:
+        """Cut a partial last record left by a crash, so appends start on a new line"""
+        try:
+            with open(self.path, "r+b") as f:
+                end = f.seek(0, os.SEEK_END)
+                if not end:
+                    return
+                f.seek(end - 1)
+                if f.read(1) == b"\n":
+                    return
+                # Scan back in blocks for the last complete record
+                position = end
+                while position > 0:
+                    start = max(0, position - 65536)
+                    f.seek(start)
+                    newline = f.read(position - start).rfind(b"\n")
+                    if newline != -1:
+                        position = start + newline + 1
+                        break
+                    position = start
+                f.truncate(position)
+                f.flush()
+                if self.fsync_policy != "never":
+                    os.fsync(f.fileno())
+        except FileNotFoundError:
+            pass
+    
+    def size(self) -> int:
+        """Current spool size in bytes"""
+        try:
+            return os.path.getsize(self.path)
+        except FileNotFoundError:
+            return 0
+    
+    def append(self, record: Dict[str, Any]) -> bool:
+        """Append a record; returns False if the size cap would be exceeded"""
+        line = (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+        if self.size() + len(line) > self.max_bytes:
+            return False
+        with open(self.path, "ab") as f:
+            f.write(line)
+            f.flush()
+            self._maybe_fsync(f.fileno())
+        return True
+    
+    def _maybe_fsync(self, fd: int) -> None:
+        if self.fsync_policy == "never":
+            return
+        now = time.monotonic()
+        if self.fsync_policy == "always" or now - self._last_fsync >= self.fsync_interval:
+            os.fsync(fd)
+            self._last_fsync = now
+    
+    def read_all(self) -> List[Dict[str, Any]]:
+        """Read every record, skipping a torn trailing line"""
+        records = []
+        try:
+            with open(self.path, "rb") as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        continue
+        except FileNotFoundError:
+            pass
+        return records
+    
+    def discard(self, count: int) -> None:
+        """Atomically drop the first ``count`` records"""
+        remaining = self.read_all()[count:]
+        if not remaining:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+            return
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "wb") as f:
+            for record in remaining:
+                f.write((json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8"))
+            f.flush()
+            if self.fsync_policy != "never":
+                os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+
+class SpoolingTaskManagerClient(AsyncTaskManagerClientBase):
+    """Async client wrapper that spools undeliverable writes to disk
+    
+    When a write fails because the backend cannot be reached, the operation
+    is appended to the spool and acknowledged with ``"spooled": True``.
+    While the spool holds entries, new writes are appended behind them so
+    order is kept. A background replayer probes /api/health and, once the
+    backend is healthy again, sends spooled operations in order. A spooled
+    create_step without a step ID is given one, so the caller can address
+    the step before it is delivered.
+    """
+    
+    def __init__(
+        self,
+        inner: AsyncTaskManagerClientBase,
+        spool: SpoolFile,
+        replay_interval: Optional[float] = None
+    ):
+        self._inner = inner
+        self._spool = spool
+        self.replay_interval = replay_interval or float(os.getenv('TASK_MANAGER_SPOOL_REPLAY_INTERVAL', '5'))
+        self._pending = len(spool.read_all())
+        self._file_lock = asyncio.Lock()
+        self._replay_lock = asyncio.Lock()
+        self._replayer: Optional[asyncio.Task] = None
+        self._failures: deque = deque(maxlen=100)
+    
+    @property
+    def pending(self) -> int:
+        """Number of operations waiting in the spool"""
+        return self._pending
+    
+    def _ensure_replayer(self) -> None:
+        if self._pending and (self._replayer is None or self._replayer.done()):
+            self._replayer = asyncio.get_running_loop().create_task(self._replay_loop())
+    
+    async def _write(self, op: str, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a write operation, spooling it if the backend is unreachable"""
+        self._ensure_replayer()
+        failure = None
+        if not self._pending:
+            failure = await getattr(self._inner, op)(**args)
+            if not is_undeliverable(failure):
+                return failure
+        if op == "create_step" and not args.get("step_id"):
+            args = {**args, "step_id": new_step_id()}
+        return await self._append(op, args, failure)
+    
+    async def _append(
+        self,
+        op: str,
+        args: Dict[str, Any],
+        failure: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        record = {
+            "op": op,
+            "args": args,
+            "spooled_at": datetime.now(timezone.utc).isoformat()
+        }
+        async with self._file_lock:
+            if not await asyncio.to_thread(self._spool.append, record):
+                return {
+                    **(failure or {"success": False, "error": "Task Manager service is unreachable"}),
+                    "hint": f"The local spool is full ({self._spool.max_bytes} bytes); this update was not recorded."
+                }
+            self._pending += 1
+        self._ensure_replayer()
+        return {
+            "success": True,
+            "spooled": True,
+            "data": dict(args)
+        }
+    
+    async def _replay_loop(self) -> None:
+        """Wait for the backend to recover and replay the spool in order"""
+        while self._pending:
+            await asyncio.sleep(self.replay_interval)
+            health = await self._inner.health_check()
+            if health.get("success"):
+                await self.replay()
+    
+    async def replay(self) -> int:
+        """Send spooled operations in order; returns how many were consumed"""
+        async with self._replay_lock:
+            async with self._file_lock:
+                records = await asyncio.to_thread(self._spool.read_all)
+            consumed = 0
+            for record in records:
+                if record.get("op") not in SPOOLED_OPERATIONS:
+                    consumed += 1
+                    continue
+                try:
+                    result = await getattr(self._inner, record["op"])(**record["args"])
+                except Exception as e:
+                    result = {"success": False, "error": str(e)}
+                if is_undeliverable(result):
+                    break
+                if not result.get("success"):
+                    self._failures.append({
+                        "operation": record["op"],
+                        **record["args"],
+                        "error": result.get("error", "Unknown error"),
+                        "failed_at": datetime.now(timezone.utc).isoformat()
+                    })
+                consumed += 1
+            async with self._file_lock:
+                if consumed:
+                    await asyncio.to_thread(self._spool.discard, consumed)
+                self._pending -= consumed
+            return consumed
+    
+    def drain_delivery_failures(self) -> List[Dict[str, Any]]:
+        """Return and clear replay failures recorded since the last call"""
+        failures = list(self._failures) + self._inner.drain_delivery_failures()
+        self._failures.clear()
+        return failures
+    
+    async def warm_up(self) -> Dict[str, Any]:
+        """Warm up the wrapped client's connections"""
+        return await self._inner.warm_up()
+    
+    async def aclose(self) -> None:
+        """Stop the replayer and close the wrapped client; the spool is kept"""
+        if self._replayer is not None:
+            self._replayer.cancel()
+            try:
+                await self._replayer
+            except asyncio.CancelledError:
+                pass
+            self._replayer = None
+        await self._inner.aclose()
+    
+    async def patch_execution(
+        self,
+        execution_id: str,
+        session_id: str
+    ) -> Dict[str, Any]:
+        """Update execution's session_id"""
+        return await self._write("patch_execution", {
+            "execution_id": execution_id,
+            "session_id": session_id
+        })
+    
+    async def create_step(
+        self,
+        execution_id: str,
+        step_name: str,
+        message: Optional[str] = None,
+        status: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+        step_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Create a new step for an execution
+        
+        The idempotency key is fixed before the first attempt so a spooled
+        replay of a create that did reach the backend is deduplicated.
+        """
+        return await self._write("create_step", {
+            "execution_id": execution_id,
+            "step_name": step_name,
+            "message": message,
+            "status": status,
+            "idempotency_key": idempotency_key or step_id or new_idempotency_key(),
+            "step_id": step_id
+        })
+    
+    async def patch_step(
+        self,
+        execution_id: str,
+        step_id: str,
+        status: Optional[str] = None,
+        message: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Partially update a step"""
+        if status is None and message is None:
+            return {"success": False, "error": "No fields to update"}
+        return await self._write("patch_step", {
+            "execution_id": execution_id,
+            "step_id": step_id,
+            "status": status,
+            "message": message
+        })
+    
+    async def get_task(self, task_id: str, use_cache: bool = True) -> Dict[str, Any]:
+        """Get task information"""
+        return await self._inner.get_task(task_id, use_cache)
+    
+    async def get_active_execution(self, task_id: str, use_cache: bool = True) -> Dict[str, Any]:
+        """Get the running execution of a task"""
+        return await self._inner.get_active_execution(task_id, use_cache)
+    
+    async def tail_logs(self, cursor: Optional[str] = None, max_lines: int = 100) -> Dict[str, Any]:
+        """Get service log lines added since the cursor"""
+        return await self._inner.tail_logs(cursor, max_lines)
+    
+    async def dashboard_health(self) -> Dict[str, Any]:
+        """Get a point sample of service metrics"""
+        return await self._inner.dashboard_health()
+    
+    async def health_check(self) -> Dict[str, Any]:
+        """Health check"""
+        result = await self._inner.health_check()
+        return {
+            **result,
+            "spool": {
+                "path": self._spool.path,
+                "pending": self._pending,
+                "bytes": self._spool.size()
+            }
+        }
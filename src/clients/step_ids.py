@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Client-side step ID allocation (ULID format)
+"""
+
+import secrets
+import threading
+import time
+
+
+# Crockford base32 alphabet used by ULIDs
+_ENCODING = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_RANDOM_BITS = 80
+
+_lock = threading.Lock()
+_last_ms = 0
+_last_random = 0
+
+
+def new_step_id() -> str:
+    """Allocate a time-ordered, collision-free step ID
+    
+    IDs are 26-character ULIDs: a 48-bit millisecond timestamp followed by
+    80 random bits. Within one millisecond the random part is incremented,
+    so IDs from this process sort in allocation order.
+    """
+    global _last_ms, _last_random
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms <= _last_ms:
+            now_ms = _last_ms
+            random_part = _last_random + 1
+            if random_part >> _RANDOM_BITS:
+                now_ms += 1
+                random_part = secrets.randbits(_RANDOM_BITS)
+        else:
+            random_part = secrets.randbits(_RANDOM_BITS)
+        _last_ms, _last_random = now_ms, random_part
+    
+    value = (now_ms << _RANDOM_BITS) | random_part
+    return "".join(_ENCODING[(value >> shift) & 0x1F] for shift in range(125, -1, -5))
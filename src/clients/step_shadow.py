@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Local shadow of the last acknowledged execution and step state
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+
+class _ExecutionShadow:
+    __slots__ = ("fields", "steps")
+    
+    def __init__(self):
+        self.fields: Optional[Dict[str, Any]] = None
+        self.steps: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+
+class StepShadow:
+    """Bounded copy of what the backend last acknowledged per execution and step
+    
+    Used to recognise PATCHes that would not change anything. At most
+    ``max_executions`` executions (least recently used evicted first) and
+    ``max_steps`` steps per execution are remembered. A step whose write
+    failed is forgotten, since the backend state is then unknown.
+    """
+    
+    def __init__(self, max_executions: int = 64, max_steps: int = 256):
+        self.max_executions = max_executions
+        self.max_steps = max_steps
+        self.skipped = 0
+        self._executions: "OrderedDict[str, _ExecutionShadow]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._executions)
+    
+    def _execution(self, execution_id: str, create: bool) -> Optional[_ExecutionShadow]:
+        shadow = self._executions.get(execution_id)
+        if shadow is None and create and self.max_executions > 0:
+            shadow = self._executions[execution_id] = _ExecutionShadow()
+            while len(self._executions) > self.max_executions:
+                self._executions.popitem(last=False)
+        if shadow is not None:
+            self._executions.move_to_end(execution_id)
+        return shadow
+    
+    def _unchanged(self, known: Optional[Dict[str, Any]], fields: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        if known is None or any(known.get(k) != v for k, v in fields.items()):
+            return None
+        self.skipped += 1
+        return dict(known)
+    
+    def unchanged_step(self, execution_id: str, step_id: str, fields: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Acknowledged step data if it already has all ``fields``, else None"""
+        with self._lock:
+            shadow = self._execution(execution_id, create=False)
+            return self._unchanged(shadow.steps.get(step_id) if shadow else None, fields)
+    
+    def unchanged_execution(self, execution_id: str, fields: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Acknowledged execution data if it already has all ``fields``, else None"""
+        with self._lock:
+            shadow = self._execution(execution_id, create=False)
+            return self._unchanged(shadow.fields if shadow else None, fields)
+    
+    def record_step(
+        self,
+        execution_id: str,
+        step_id: str,
+        fields: Dict[str, Any],
+        data: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Remember an acknowledged step write; the response data wins over the sent fields"""
+        with self._lock:
+            shadow = self._execution(execution_id, create=True)
+            if shadow is None:
+                return
+            shadow.steps[step_id] = {**shadow.steps.get(step_id, {}), **fields, **(data or {})}
+            shadow.steps.move_to_end(step_id)
+            while len(shadow.steps) > self.max_steps:
+                shadow.steps.popitem(last=False)
+    
+    def record_execution(
+        self,
+        execution_id: str,
+        fields: Dict[str, Any],
+        data: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Remember an acknowledged execution write"""
+        with self._lock:
+            shadow = self._execution(execution_id, create=True)
+            if shadow is not None:
+                shadow.fields = {**(shadow.fields or {}), **fields, **(data or {})}
+    
+    def forget_step(self, execution_id: str, step_id: str) -> None:
+        with self._lock:
+            shadow = self._executions.get(execution_id)
+            if shadow is not None:
+                shadow.steps.pop(step_id, None)
+    
+    def forget_execution(self, execution_id: str) -> None:
+        """Forget an execution's own fields (its steps are kept)"""
+        with self._lock:
+            shadow = self._executions.get(execution_id)
+            if shadow is not None:
+                shadow.fields = None
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Bounded LRU + TTL cache of task information
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from src.clients.generated._client.models import HttpTaskInfo
+from src.clients.generated._client.types import Unset
+
+
+def _updated_at(info: HttpTaskInfo) -> Optional[str]:
+    return None if isinstance(info.updated_at, Unset) else info.updated_at
+
+
+class TaskCache:
+    """LRU cache of HttpTaskInfo entries that expire after ``ttl`` seconds
+    
+    At most ``max_entries`` tasks are kept; the least recently used entry
+    is evicted first. An entry is only replaced by information with the
+    same or a newer ``updated_at``, so a late response carrying an older
+    version of a task never overwrites a newer one.
+    """
+    
+    def __init__(self, max_entries: int = 256, ttl: float = 30.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[HttpTaskInfo, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, task_id: str) -> Optional[HttpTaskInfo]:
+        """Cached task, or None if absent or expired"""
+        with self._lock:
+            entry = self._entries.get(task_id)
+            if entry is None or time.monotonic() - entry[1] >= self.ttl:
+                if entry is not None:
+                    del self._entries[task_id]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(task_id)
+            self.hits += 1
+            return entry[0]
+    
+    def put(self, task_id: str, info: HttpTaskInfo) -> HttpTaskInfo:
+        """Cache task information unless a newer version is already cached
+        
+        Returns the version that is cached afterwards.
+        """
+        with self._lock:
+            entry = self._entries.get(task_id)
+            if entry is not None:
+                cached_at = _updated_at(entry[0])
+                incoming_at = _updated_at(info)
+                if cached_at and incoming_at and incoming_at < cached_at:
+                    return entry[0]
+            self._entries[task_id] = (info, time.monotonic())
+            self._entries.move_to_end(task_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return info
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Write-behind wrapper that delivers step updates in the background
+"""
+
+import asyncio
+import os
+from collections import deque
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, List
+
+from src.clients.base_client import AsyncTaskManagerClientBase
+from src.clients.coalescer import CoalescingPatchQueue
+
+
+class WriteBehindTaskManagerClient(AsyncTaskManagerClientBase):
+    """Async client wrapper that acknowledges patch_step immediately
+    
+    create_step calls that carry a client-allocated step_id are queued and
+    acknowledged the same way, since the caller already knows the ID.
+    
+    Step patches are placed on a bounded queue and delivered in order by a
+    background worker using the wrapped client. Patches for the same step
+    that arrive within the coalescing window are merged and sent as one
+    PATCH. Delivery failures are kept and handed out by
+    drain_delivery_failures() so the next tool call can report them.
+    Producers wait when the queue is full.
+    """
+    
+    def __init__(
+        self,
+        inner: AsyncTaskManagerClientBase,
+        max_queue_size: Optional[int] = None,
+        flush_timeout: Optional[float] = None,
+        coalesce_window: Optional[float] = None
+    ):
+        self._inner = inner
+        self.max_queue_size = max_queue_size or int(os.getenv('TASK_MANAGER_WRITE_BEHIND_QUEUE_SIZE', '1000'))
+        self.flush_timeout = flush_timeout or float(os.getenv('TASK_MANAGER_WRITE_BEHIND_FLUSH_TIMEOUT', '10'))
+        self.coalesce_window = (
+            coalesce_window if coalesce_window is not None
+            else float(os.getenv('TASK_MANAGER_COALESCE_WINDOW', '0'))
+        )
+        self._queue: Optional[CoalescingPatchQueue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._failures: deque = deque(maxlen=100)
+    
+    def _ensure_worker(self) -> CoalescingPatchQueue:
+        """Create the queue and start the delivery worker on first use"""
+        if self._queue is None:
+            self._queue = CoalescingPatchQueue(self.max_queue_size, self.coalesce_window)
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+        return self._queue
+    
+    async def _run(self) -> None:
+        """Deliver queued (merged) operations one at a time, in enqueue order"""
+        while True:
+            item = await self._queue.get()
+            args = {k: v for k, v in item.items() if k != "operation"}
+            try:
+                result = await getattr(self._inner, item["operation"])(**args)
+                if not result.get("success"):
+                    self._record_failure(item, result.get("error", "Unknown error"))
+            except Exception as e:
+                self._record_failure(item, str(e))
+            finally:
+                self._queue.task_done()
+    
+    def _record_failure(self, item: Dict[str, Any], error: str) -> None:
+        self._failures.append({
+            **item,
+            "error": error,
+            "failed_at": datetime.now(timezone.utc).isoformat()
+        })
+    
+    def drain_delivery_failures(self) -> List[Dict[str, Any]]:
+        """Return and clear failures recorded since the last call"""
+        failures = list(self._failures) + self._inner.drain_delivery_failures()
+        self._failures.clear()
+        return failures
+    
+    @property
+    def pending(self) -> int:
+        """Number of merged patches waiting to be delivered"""
+        return self._queue.qsize() if self._queue is not None else 0
+    
+    async def flush(self) -> None:
+        """Wait until every queued patch has been delivered"""
+        if self._queue is not None:
+            await self._queue.join()
+    
+    async def warm_up(self) -> Dict[str, Any]:
+        """Warm up the wrapped client's connections"""
+        return await self._inner.warm_up()
+    
+    async def aclose(self) -> None:
+        """Flush pending patches, stop the worker and close the wrapped client"""
+        try:
+            await asyncio.wait_for(self.flush(), timeout=self.flush_timeout)
+        except asyncio.TimeoutError:
+            pass
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        await self._inner.aclose()
+    
+    async def patch_execution(
+        self,
+        execution_id: str,
+        session_id: str
+    ) -> Dict[str, Any]:
+        """Update execution's session_id"""
+        return await self._inner.patch_execution(execution_id, session_id)
+    
+    async def create_step(
+        self,
+        execution_id: str,
+        step_name: str,
+        message: Optional[str] = None,
+        status: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+        step_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Create a new step, queueing it when the step_id is client-allocated"""
+        if step_id is None:
+            return await self._inner.create_step(execution_id, step_name, message, status, idempotency_key)
+        
+        create = {
+            "execution_id": execution_id,
+            "step_id": step_id,
+            "step_name": step_name,
+            "message": message,
+            "status": status,
+            "idempotency_key": idempotency_key
+        }
+        await self._ensure_worker().put({"operation": "create_step", **create})
+        
+        return {
+            "success": True,
+            "queued": True,
+            "data": create
+        }
+    
+    async def patch_step(
+        self,
+        execution_id: str,
+        step_id: str,
+        status: Optional[str] = None,
+        message: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Queue a step patch and return a provisional acknowledgement"""
+        if status is None and message is None:
+            return {"success": False, "error": "No fields to update"}
+        
+        patch = {"execution_id": execution_id, "step_id": step_id}
+        if status is not None:
+            patch["status"] = status
+        if message is not None:
+            patch["message"] = message
+        
+        await self._ensure_worker().put({"operation": "patch_step", **patch})
+        
+        return {
+            "success": True,
+            "queued": True,
+            "data": dict(patch)
+        }
+    
+    async def get_task(self, task_id: str, use_cache: bool = True) -> Dict[str, Any]:
+        """Get task information"""
+        return await self._inner.get_task(task_id, use_cache)
+    
+    async def get_active_execution(self, task_id: str, use_cache: bool = True) -> Dict[str, Any]:
+        """Get the running execution of a task"""
+        return await self._inner.get_active_execution(task_id, use_cache)
+    
+    async def tail_logs(self, cursor: Optional[str] = None, max_lines: int = 100) -> Dict[str, Any]:
+        """Get service log lines added since the cursor"""
+        return await self._inner.tail_logs(cursor, max_lines)
+    
+    async def dashboard_health(self) -> Dict[str, Any]:
+        """Get a point sample of service metrics"""
+        return await self._inner.dashboard_health()
+    
+    async def health_check(self) -> Dict[str, Any]:
+        """Health check"""
+        result = await self._inner.health_check()
+        return {
+            **result,
+            "write_behind": {
+                "pending": self.pending,
+                "coalesced": self._queue.coalesced if self._queue is not None else 0
+            }
+        }
@@ -3,6 +3,6 @@
 Models package
 """
 
-from src.models.models import StepStatus, ExecutionPatch, StepCreate, StepPatch
+from src.models.models import StepStatus, ExecutionPatch, StepCreate, StepPatch, StepOperation
 
-__all__ = ['StepStatus', 'ExecutionPatch', 'StepCreate', 'StepPatch']
+__all__ = ['StepStatus', 'ExecutionPatch', 'StepCreate', 'StepPatch', 'StepOperation']
@@ -36,3 +36,17 @@ class StepPatch:
     """Step patch data structure"""
     status: Optional[StepStatus] = None
     message: Optional[str] = None
+
+
+@dataclass
+class StepOperation:
+    """Batch step operation data structure
+    
+    action is "create" (uses step_name) or "update" (uses step_id).
+    """
+    action: str
+    step_id: Optional[str] = None
+    step_name: Optional[str] = None
+    message: Optional[str] = None
+    status: Optional[str] = None
+    idempotency_key: Optional[str] = None
@@ -6,21 +6,114 @@ Tools:
 - update_execution_session: Update execution's session_id
 - create_step: Create a new step in an execution
 - update_step: Update an existing step's status/message
+- report_steps: Apply a batch of step creates/updates in one call
+- get_task: Get task information (cached)
+- get_active_execution: Find the running execution of a task (cached)
+- tail_logs: Get Task Manager service log lines added since the last call
+- dashboard_stats: Trends of service CPU, memory and latency samples
 - health_check: Check Task Manager service health
 """
 
-from typing import Dict, Any, Optional
+import asyncio
+import functools
+import os
+import threading
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, AsyncIterator, Awaitable, Callable
 import fastmcp
 
-from src.clients import create_task_manager_client
+from src.clients.step_ids import new_step_id
+from src.models import StepOperation
 
+if TYPE_CHECKING:
+    from src.clients import AsyncTaskManagerClientBase, DashboardSampler
 
-task_client = create_task_manager_client()
-mcp = fastmcp.FastMCP("Nova Task Manager")
+
+# The backend client (and httpx with it) is only imported and built on first
+# tool use, so spawning the server does not pay for it
+_task_client: Optional["AsyncTaskManagerClientBase"] = None
+_dashboard_sampler: Optional["DashboardSampler"] = None
+_client_lock = threading.Lock()
+
+
+def get_task_client() -> "AsyncTaskManagerClientBase":
+    """The shared backend client, created on first use"""
+    global _task_client
+    if _task_client is None:
+        with _client_lock:
+            if _task_client is None:
+                from src.clients.client_factory import create_async_task_manager_client
+                _task_client = create_async_task_manager_client()
+    return _task_client
+
+
+def get_dashboard_sampler() -> "DashboardSampler":
+    """The shared dashboard sampler, created on first use"""
+    global _dashboard_sampler
+    client = get_task_client()
+    if _dashboard_sampler is None:
+        with _client_lock:
+            if _dashboard_sampler is None:
+                from src.clients.dashboard import DashboardSampler
+                _dashboard_sampler = DashboardSampler(client)
+    return _dashboard_sampler
+
+
+async def _warm_up() -> None:
+    """Build the client off the event loop, then warm up its connections"""
+    try:
+        client = await asyncio.to_thread(get_task_client)
+        await client.warm_up()
+    except Exception:
+        # Best effort: the first tool call connects as usual
+        pass
+
+
+@asynccontextmanager
+async def _lifespan(server: fastmcp.FastMCP) -> AsyncIterator[Dict[str, Any]]:
+    """Optionally warm up backend connections; close them when the server shuts down
+    
+    With TASK_MANAGER_WARMUP=true the warm-up runs in the background, so
+    the MCP handshake is not delayed by it.
+    """
+    warm_up = None
+    if os.getenv('TASK_MANAGER_WARMUP', 'false').lower() == 'true':
+        warm_up = asyncio.get_running_loop().create_task(_warm_up())
+    try:
+        yield {}
+    finally:
+        if warm_up is not None:
+            warm_up.cancel()
+            try:
+                await warm_up
+            except asyncio.CancelledError:
+                pass
+        if _dashboard_sampler is not None:
+            await _dashboard_sampler.stop()
+        if _task_client is not None:
+            await _task_client.aclose()
+
+
+mcp = fastmcp.FastMCP("Nova Task Manager", lifespan=_lifespan)
+
+
+def _report_delivery_failures(
+    func: Callable[..., Awaitable[Dict[str, Any]]]
+) -> Callable[..., Awaitable[Dict[str, Any]]]:
+    """Attach background delivery failures recorded since the last tool call"""
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+        result = await func(*args, **kwargs)
+        failures = get_task_client().drain_delivery_failures()
+        if failures:
+            result = {**result, "delivery_failures": failures}
+        return result
+    return wrapper
 
 
 @mcp.tool()
-def update_execution_session(
+@_report_delivery_failures
+async def update_execution_session(
     execution_id: str,
     session_id: str
 ) -> Dict[str, Any]:
@@ -35,15 +128,23 @@ def update_execution_session(
         Updated execution information
     """
     try:
-        result = task_client.patch_execution(
+        result = await get_task_client().patch_execution(
             execution_id=execution_id,
             session_id=session_id
         )
         
+        if result.get("spooled"):
+            return {
+                "success": True,
+                "spooled": True,
+                "message": f"Task Manager unreachable; execution {execution_id} update spooled for delivery",
+                "data": result.get("data")
+            }
         if result.get("success"):
             return {
                 "success": True,
                 "message": f"Execution {execution_id} updated with session {session_id}",
+                **({"skipped": True} if result.get("skipped") else {}),
                 "data": result.get("data")
             }
         return result
@@ -52,44 +153,48 @@ def update_execution_session(
         return {"success": False, "error": f"Failed to update execution: {str(e)}"}
 
 
-@mcp.tool()
-def create_step(
+async def _create_step(
     execution_id: str,
     step_name: str,
     message: Optional[str] = None,
-    status: Optional[str] = None
+    status: Optional[str] = None,
+    idempotency_key: Optional[str] = None
 ) -> Dict[str, Any]:
-    """
-    Create a new step in an execution. The step starts with 'running' status by default.
-    
-    Args:
-        execution_id: The execution ID to create the step in (get from NOVA_EXECUTION_ID env var)
-        step_name: Name of the step (e.g., "analyzing", "coding", "testing")
-        message: Optional description of what this step will do
-        status: Optional initial status - "running", "completed", "failed", or "skipped" (default: "running")
-    
-    Returns:
-        Created step information including step_id (save this for updates)
-    """
+    """Create a step; shared by the create_step and report_steps tools"""
     if status and status not in {"running", "completed", "failed", "skipped"}:
         return {
             "success": False,
             "error": f"Invalid status '{status}'. Must be one of: running, completed, failed, skipped"
         }
     
+    # Allocate the step ID locally so the create can be delivered asynchronously
+    step_id = None
+    if os.getenv('TASK_MANAGER_CLIENT_STEP_IDS', 'false').lower() == 'true':
+        step_id = new_step_id()
+    
     try:
-        result = task_client.create_step(
+        result = await get_task_client().create_step(
             execution_id=execution_id,
             step_name=step_name,
             message=message,
-            status=status
+            status=status,
+            idempotency_key=idempotency_key,
+            step_id=step_id
         )
         
+        if result.get("spooled"):
+            return {
+                "success": True,
+                "spooled": True,
+                "message": f"Task Manager unreachable; step '{step_name}' spooled for delivery",
+                "step_id": result["data"]["step_id"],
+                "data": result.get("data")
+            }
         if result.get("success"):
             step_data = result.get("data", {})
             return {
                 "success": True,
-                "message": f"Step '{step_name}' created",
+                "message": f"Step '{step_name}' queued for creation" if result.get("queued") else f"Step '{step_name}' created",
                 "step_id": step_data.get("step_id"),
                 "data": step_data
             }
@@ -100,24 +205,37 @@ def create_step(
 
 
 @mcp.tool()
-def update_step(
+@_report_delivery_failures
+async def create_step(
     execution_id: str,
-    step_id: str,
+    step_name: str,
+    message: Optional[str] = None,
     status: Optional[str] = None,
-    message: Optional[str] = None
+    idempotency_key: Optional[str] = None
 ) -> Dict[str, Any]:
     """
-    Update an existing step's status and/or message.
+    Create a new step in an execution. The step starts with 'running' status by default.
     
     Args:
-        execution_id: The execution ID containing the step (get from NOVA_EXECUTION_ID env var)
-        step_id: The step ID to update (from create_step response)
-        status: New status - "running", "completed", "failed", or "skipped"
-        message: Updated message describing the outcome
+        execution_id: The execution ID to create the step in (get from NOVA_EXECUTION_ID env var)
+        step_name: Name of the step (e.g., "analyzing", "coding", "testing")
+        message: Optional description of what this step will do
+        status: Optional initial status - "running", "completed", "failed", or "skipped" (default: "running")
+        idempotency_key: Optional unique key for this step; reuse it when retrying so no duplicate step is created
     
     Returns:
-        Updated step information
+        Created step information including step_id (save this for updates)
     """
+    return await _create_step(execution_id, step_name, message, status, idempotency_key)
+
+
+async def _update_step(
+    execution_id: str,
+    step_id: str,
+    status: Optional[str] = None,
+    message: Optional[str] = None
+) -> Dict[str, Any]:
+    """Update a step; shared by the update_step and report_steps tools"""
     if not status and not message:
         return {"success": False, "error": "Provide at least status or message to update"}
     
@@ -129,17 +247,25 @@ def update_step(
         }
     
     try:
-        result = task_client.patch_step(
+        result = await get_task_client().patch_step(
             execution_id=execution_id,
             step_id=step_id,
             status=status,
             message=message
         )
         
+        if result.get("spooled"):
+            return {
+                "success": True,
+                "spooled": True,
+                "message": f"Task Manager unreachable; step {step_id} update spooled for delivery",
+                "data": result.get("data")
+            }
         if result.get("success"):
             return {
                 "success": True,
-                "message": f"Step {step_id} updated",
+                "message": f"Step {step_id} update queued" if result.get("queued") else f"Step {step_id} updated",
+                **({"skipped": True} if result.get("skipped") else {}),
                 "data": result.get("data")
             }
         return result
@@ -149,11 +275,197 @@ def update_step(
 
 
 @mcp.tool()
-def health_check() -> Dict[str, Any]:
+@_report_delivery_failures
+async def update_step(
+    execution_id: str,
+    step_id: str,
+    status: Optional[str] = None,
+    message: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Update an existing step's status and/or message.
+    
+    Args:
+        execution_id: The execution ID containing the step (get from NOVA_EXECUTION_ID env var)
+        step_id: The step ID to update (from create_step response)
+        status: New status - "running", "completed", "failed", or "skipped"
+        message: Updated message describing the outcome
+    
+    Returns:
+        Updated step information
+    """
+    return await _update_step(execution_id, step_id, status, message)
+
+
+@mcp.tool()
+@_report_delivery_failures
+async def report_steps(
+    execution_id: str,
+    operations: List[StepOperation]
+) -> Dict[str, Any]:
+    """
+    Create and/or update several steps of one execution in a single call.
+    
+    Operations on the same step_id run in the given order; independent operations run concurrently.
+    
+    Args:
+        execution_id: The execution ID containing the steps (get from NOVA_EXECUTION_ID env var)
+        operations: List of operations. Each has "action" set to "create" (with step_name and optional
+            message/status/idempotency_key) or "update" (with step_id and status and/or message)
+    
+    Returns:
+        Per-operation results in the same order as the operations
+    """
+    if not operations:
+        return {"success": False, "error": "Provide at least one operation"}
+    
+    semaphore = asyncio.Semaphore(int(os.getenv('TASK_MANAGER_BATCH_CONCURRENCY', '8')))
+    results: List[Optional[Dict[str, Any]]] = [None] * len(operations)
+    
+    async def run_one(index: int, op: StepOperation) -> None:
+        async with semaphore:
+            if op.action == "create":
+                if not op.step_name:
+                    result = {"success": False, "error": "step_name is required for create"}
+                else:
+                    result = await _create_step(
+                        execution_id, op.step_name, op.message, op.status, op.idempotency_key
+                    )
+            elif op.action == "update":
+                if not op.step_id:
+                    result = {"success": False, "error": "step_id is required for update"}
+                else:
+                    result = await _update_step(execution_id, op.step_id, op.status, op.message)
+            else:
+                result = {
+                    "success": False,
+                    "error": f"Invalid action '{op.action}'. Must be one of: create, update"
+                }
+        results[index] = {"index": index, "action": op.action, **result}
+    
+    # Chain operations per step so updates to one step keep their order
+    chains: Dict[Any, List[int]] = {}
+    for index, op in enumerate(operations):
+        key = op.step_id if op.action == "update" and op.step_id else ("op", index)
+        chains.setdefault(key, []).append(index)
+    
+    async def run_chain(indexes: List[int]) -> None:
+        for index in indexes:
+            await run_one(index, operations[index])
+    
+    await asyncio.gather(*(run_chain(indexes) for indexes in chains.values()))
+    
+    succeeded = sum(1 for r in results if r.get("success"))
+    return {
+        "success": succeeded == len(results),
+        "message": f"{succeeded}/{len(results)} step operations succeeded",
+        "results": results
+    }
+
+
+@mcp.tool()
+@_report_delivery_failures
+async def get_task(
+    task_id: str,
+    bypass_cache: bool = False
+) -> Dict[str, Any]:
+    """
+    Get task information, including status and JIRA ticket details.
+    
+    Recently fetched tasks are served from a local cache.
+    
+    Args:
+        task_id: The task ID to look up
+        bypass_cache: Set to true to always fetch the latest task information from the service
+    
+    Returns:
+        Task information; "cached" tells whether it came from the local cache
+    """
+    try:
+        return await get_task_client().get_task(task_id, use_cache=not bypass_cache)
+    except Exception as e:
+        return {"success": False, "error": f"Failed to get task: {str(e)}"}
+
+
+@mcp.tool()
+@_report_delivery_failures
+async def get_active_execution(
+    task_id: str,
+    bypass_cache: bool = False
+) -> Dict[str, Any]:
+    """
+    Find the currently running execution of a task, e.g. to know where to report progress.
+    
+    Recent lookups, including "no active execution", are served from a short-lived local cache.
+    
+    Args:
+        task_id: The task ID to look up
+        bypass_cache: Set to true to always ask the service
+    
+    Returns:
+        "active" (whether an execution is running) and the execution information in "data"
+    """
+    try:
+        return await get_task_client().get_active_execution(task_id, use_cache=not bypass_cache)
+    except Exception as e:
+        return {"success": False, "error": f"Failed to get active execution: {str(e)}"}
+
+
+@mcp.tool()
+@_report_delivery_failures
+async def tail_logs(
+    max_lines: int = 100,
+    cursor: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Get Task Manager service log lines written since the previous call.
+    
+    The first call returns the most recent lines; later calls return only new lines.
+    
+    Args:
+        max_lines: Maximum number of lines to return (default: 100)
+        cursor: Optional cursor from an earlier response to continue from that point instead of the last call
+    
+    Returns:
+        New log lines, the cursor for the next call, and "truncated" if lines were missed
+    """
+    if max_lines < 1:
+        return {"success": False, "error": "max_lines must be at least 1"}
+    try:
+        return await get_task_client().tail_logs(cursor=cursor, max_lines=max_lines)
+    except Exception as e:
+        return {"success": False, "error": f"Failed to get logs: {str(e)}"}
+
+
+@mcp.tool()
+@_report_delivery_failures
+async def dashboard_stats() -> Dict[str, Any]:
+    """
+    Get recent trends of Task Manager service CPU, memory and API latency.
+    
+    Samples are collected in the background; the first call starts sampling.
+    
+    Returns:
+        min/mean/p50/p95/max of each metric over the last 1m, 5m and 1h
+    """
+    try:
+        sampler = get_dashboard_sampler()
+        await sampler.ensure_started()
+        stats = sampler.stats()
+    except Exception as e:
+        return {"success": False, "error": f"Failed to get dashboard stats: {str(e)}"}
+    if not stats["samples"]:
+        return {"success": False, "error": f"No dashboard samples yet: {stats['last_error']}", **stats}
+    return {"success": True, **stats}
+
+
+@mcp.tool()
+@_report_delivery_failures
+async def health_check() -> Dict[str, Any]:
     """
     Check Task Manager service health status.
     
     Returns:
         Health check result and configuration information
     """
-    return task_client.health_check()
+    return await get_task_client().health_check()
@@ -6,6 +6,7 @@ MCP server for tracking Claude agent execution status
 This is the main entry point that imports and runs the MCP server.
 """
 
+import os
 import sys
 from pathlib import Path
 
@@ -16,4 +17,7 @@ sys.path.insert(0, str(src_path))
 from server import mcp
 
 if __name__ == "__main__":
+    # --warmup: open backend connections in the background at start-up
+    if "--warmup" in sys.argv[1:]:
+        os.environ['TASK_MANAGER_WARMUP'] = 'true'
     mcp.run()
\ No newline at end of file
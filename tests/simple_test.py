@@ -10,6 +10,7 @@ os.environ['USE_MOCK_CLIENT'] = 'true'
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.clients import create_task_manager_client
+from src.clients.step_ids import new_step_id
 
 client = create_task_manager_client()
 
@@ -53,6 +54,28 @@ def test_create_and_update_step():
     print("✓ patch_step")
 
 
+def test_create_step_idempotency_key():
+    first = client.create_step("exec-idem", "analyzing", idempotency_key="key-1")
+    retry = client.create_step("exec-idem", "analyzing", idempotency_key="key-1")
+    other = client.create_step("exec-idem", "analyzing", idempotency_key="key-2")
+    assert retry["data"]["step_id"] == first["data"]["step_id"]
+    assert other["data"]["step_id"] != first["data"]["step_id"]
+    print("✓ create_step idempotency")
+
+
+def test_client_allocated_step_ids():
+    ids = [new_step_id() for _ in range(1000)]
+    assert len(set(ids)) == len(ids)
+    assert ids == sorted(ids), "IDs should be time-ordered"
+    assert all(len(i) == 26 for i in ids)
+    
+    result = client.create_step("exec-ids", "analyzing", step_id=ids[0])
+    assert result["data"]["step_id"] == ids[0]
+    retry = client.create_step("exec-ids", "analyzing", step_id=ids[0])
+    assert retry["data"] is result["data"], "Retrying a client-allocated ID should not duplicate"
+    print("✓ client-allocated step IDs")
+
+
 def test_workflow():
     print("\n--- Workflow ---")
     
@@ -79,5 +102,7 @@ if __name__ == "__main__":
     test_health_check()
     test_patch_execution()
     test_create_and_update_step()
+    test_create_step_idempotency_key()
+    test_client_allocated_step_ids()
     test_workflow()
     print("✅ All passed!")
@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+Tests for the async Task Manager clients
+"""
+
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import httpx
+
+from src.clients import (
+    AsyncHttpTaskManagerClient,
+    AsyncMockTaskManagerClient,
+    DashboardSampler,
+    SpoolFile,
+    SpoolingTaskManagerClient,
+    WriteBehindTaskManagerClient,
+    aiter_executions,
+    create_async_task_manager_client
+)
+from src.clients.dashboard import SampleRing
+from src.clients.generated._client import Client
+from src.clients.retry import RetryBudget
+
+
+def test_async_mock_client():
+    """Test the async mock client workflow"""
+    print("Testing Async Mock Client...")
+    
+    async def run():
+        client = AsyncMockTaskManagerClient()
+        
+        result = await client.health_check()
+        assert result["success"] is True
+        
+        result = await client.patch_execution("exec-1", "session-1")
+        assert result["data"]["session_id"] == "session-1"
+        
+        result = await client.create_step("exec-1", "analyzing")
+        step_id = result["data"]["step_id"]
+        
+        result = await client.patch_step("exec-1", step_id, status="completed")
+        assert result["data"]["status"] == "completed"
+    
+    asyncio.run(run())
+    print("✅ Async mock client test completed!")
+
+
+def test_async_factory_selection():
+    """Test that the async factory selects the right client"""
+    print("\nTesting Async Factory Client Selection...")
+    
+    os.environ.pop('USE_MOCK_CLIENT', None)
+    assert isinstance(create_async_task_manager_client(), AsyncHttpTaskManagerClient)
+    
+    os.environ['USE_MOCK_CLIENT'] = 'true'
+    assert isinstance(create_async_task_manager_client(), AsyncMockTaskManagerClient)
+    
+    os.environ.pop('USE_MOCK_CLIENT', None)
+    print("✅ Async factory selection test completed!")
+
+
+def test_async_http_requests_overlap():
+    """Test that concurrent async HTTP calls run concurrently"""
+    print("\nTesting Async HTTP Request Overlap...")
+    
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.2)
+        return httpx.Response(200, json={"success": True, "data": {"step_id": "s-1"}})
+    
+    async def run():
+        client = AsyncHttpTaskManagerClient(transport=httpx.MockTransport(handler))
+        start = time.monotonic()
+        results = await asyncio.gather(*[
+            client.patch_step("exec-1", "s-1", message=f"update {i}") for i in range(5)
+        ])
+        elapsed = time.monotonic() - start
+        await client.aclose()
+        return results, elapsed
+    
+    results, elapsed = asyncio.run(run())
+    assert all(r.get("success") for r in results)
+    assert elapsed < 0.6, f"Calls should overlap, took {elapsed:.2f}s"
+    print("✅ Async HTTP overlap test completed!")
+
+
+def test_async_http_warm_up():
+    """Test warm-up opens pooled connections and seeds the health cache"""
+    print("\nTesting Connection Warm-up...")
+    
+    paths = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        return httpx.Response(200, json={"status": "healthy"})
+    
+    async def run():
+        client = AsyncHttpTaskManagerClient(transport=httpx.MockTransport(handler))
+        client.warmup_connections = 3
+        result = await client.warm_up()
+        health = await client.health_check()
+        await client.aclose()
+        return result, health
+    
+    result, health = asyncio.run(run())
+    assert result["success"] is True and result["connections"] == 3
+    assert paths == ["/api/health"] * 3, "health_check should be served from the warmed-up cache"
+    assert health["status"] == "healthy"
+    assert asyncio.run(AsyncMockTaskManagerClient().warm_up())["success"] is True
+    print("✅ Warm-up test completed!")
+
+
+def test_async_http_hedges_slow_reads():
+    """Test that a read slower than its p95 is hedged and the faster reply wins"""
+    print("\nTesting Hedged Reads...")
+    
+    calls = {"count": 0}
+    
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls["count"] += 1
+        if calls["count"] == 1:
+            await asyncio.sleep(0.5)
+        return httpx.Response(200, json={"status": "ok"})
+    
+    async def run():
+        client = AsyncHttpTaskManagerClient(transport=httpx.MockTransport(handler))
+        client.hedge_reads = True
+        client.health_cache_ttl = 0
+        for _ in range(client.latency.min_samples):
+            client.latency.record("GET /api/health", 0.01)
+        start = time.monotonic()
+        result = await client.health_check()
+        elapsed = time.monotonic() - start
+        
+        # Without budget the slow first attempt is simply awaited
+        calls["count"] = 0
+        client.hedge_budget = RetryBudget(ratio=0.0, max_tokens=5, initial_tokens=0)
+        await client.health_check()
+        hedged_calls = calls["count"]
+        await client.aclose()
+        return result, elapsed, hedged_calls
+    
+    result, elapsed, unhedged_calls = asyncio.run(run())
+    assert result["success"] is True
+    assert elapsed < 0.3, f"Hedge should answer before the slow attempt, took {elapsed:.2f}s"
+    assert unhedged_calls == 1, "No hedge without budget"
+    print("✅ Hedged read test completed!")
+
+
+def test_async_http_singleflight_reads():
+    """Test that concurrent identical GETs share one request"""
+    print("\nTesting Singleflight Reads...")
+    
+    calls = {"count": 0}
+    
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls["count"] += 1
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, json={"status": "ok"})
+    
+    async def run():
+        client = AsyncHttpTaskManagerClient(transport=httpx.MockTransport(handler))
+        results = await asyncio.gather(*[client.health_check() for _ in range(10)])
+        await client.aclose()
+        return results
+    
+    results = asyncio.run(run())
+    assert all(r["success"] for r in results)
+    assert len({id(r) for r in results}) == 10, "Each caller gets its own result dict"
+    assert calls["count"] == 1, f"Expected one shared request, got {calls['count']}"
+    print("✅ Singleflight test completed!")
+
+
+def test_dashboard_sampler():
+    """Test dashboard sampling into the ring buffer and windowed stats"""
+    print("\nTesting Dashboard Sampler...")
+    
+    samples = iter(range(1, 1000))
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/api/dashboard/health"
+        value = next(samples)
+        return httpx.Response(200, json={"status": "ok", "cpu_percent": value, "avg_latency_ms": value * 10})
+    
+    async def run():
+        client = AsyncHttpTaskManagerClient(transport=httpx.MockTransport(handler))
+        sampler = DashboardSampler(client, interval=0.01)
+        await asyncio.gather(sampler.ensure_started(), sampler.ensure_started())
+        assert len(sampler.ring) == 1, "The first sample is taken immediately, once"
+        await asyncio.sleep(0.1)
+        await sampler.stop()
+        polling = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        assert polling == [], f"Polling tasks left after stop(): {polling}"
+        await client.aclose()
+        return sampler
+    
+    sampler = asyncio.run(run())
+    taken = len(sampler.ring)
+    assert taken > 1
+    stats = sampler.stats()
+    cpu = stats["windows"]["1m"]["cpu_percent"]
+    assert cpu["count"] == taken and cpu["min"] == 1 and cpu["max"] == taken
+    assert stats["windows"]["1m"]["avg_latency_ms"]["max"] == taken * 10
+    assert stats["windows"]["1m"]["memory_percent"] == {"count": 0}, "Missing metrics are skipped"
+    
+    # Once full, the oldest samples are overwritten; windows only see recent ones
+    ring = SampleRing(3)
+    for t in range(5):
+        ring.append(float(t * 100), {"cpu_percent": t})
+    assert len(ring) == 3
+    assert ring.window(150, now=400.0)["cpu_percent"] == [4, 3]
+    print("✅ Dashboard sampler test completed!")
+
+
+def test_aiter_executions():
+    """Test async streaming over paginated executions"""
+    print("\nTesting Async Paginated Executions Iterator...")
+    
+    requested = []
+    
+    async def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        requested.append(page)
+        start = (page - 1) * 3
+        executions = [{"execution_id": f"e-{i}"} for i in range(start, min(start + 3, 7))]
+        return httpx.Response(200, json={"success": True, "data": {"executions": executions, "total_count": 7}})
+    
+    async def run():
+        client = Client(base_url="http://task-manager", httpx_args={"transport": httpx.MockTransport(handler)})
+        return [e.execution_id async for e in aiter_executions(client, limit=3, prefetch=2)]
+    
+    assert asyncio.run(run()) == [f"e-{i}" for i in range(7)]
+    assert sorted(requested) == [1, 2, 3]
+    print("✅ Async paginated iterator test completed!")
+
+
+def test_write_behind_step_updates():
+    """Test that write-behind acks immediately and delivers in order"""
+    print("\nTesting Write-Behind Step Updates...")
+    
+    delivered = []
+    
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.05)
+        if request.url.path.endswith("/missing"):
+            return httpx.Response(400, json={"success": False, "error": "Step not found"})
+        delivered.append(request.content)
+        return httpx.Response(200, json={"success": True, "data": {}})
+    
+    async def run():
+        inner = AsyncHttpTaskManagerClient(transport=httpx.MockTransport(handler))
+        client = WriteBehindTaskManagerClient(inner, max_queue_size=10)
+        
+        start = time.monotonic()
+        for i in range(3):
+            result = await client.patch_step("exec-1", "s-1", message=f"update {i}")
+            assert result["success"] is True and result["queued"] is True
+        await client.patch_step("exec-1", "missing", status="completed")
+        assert time.monotonic() - start < 0.05, "patch_step should not wait for delivery"
+        
+        await client.aclose()
+        return client.drain_delivery_failures()
+    
+    failures = asyncio.run(run())
+    assert b'"update 2"' in delivered[-1], "Last patch should win"
+    assert len(failures) == 1 and failures[0]["step_id"] == "missing"
+    print("✅ Write-behind test completed!")
+
+
+def test_write_behind_coalesces_patches():
+    """Test that patches for one step within the window go out as one PATCH"""
+    print("\nTesting Step Patch Coalescing...")
+    
+    bodies = []
+    
+    async def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append((request.url.path, json.loads(request.content)))
+        return httpx.Response(200, json={"success": True, "data": {}})
+    
+    async def run():
+        inner = AsyncHttpTaskManagerClient(transport=httpx.MockTransport(handler))
+        client = WriteBehindTaskManagerClient(inner, coalesce_window=0.1)
+        await client.patch_step("exec-1", "s-1", message="halfway")
+        await client.patch_step("exec-1", "s-2", status="running")
+        await asyncio.sleep(0.02)
+        await client.patch_step("exec-1", "s-1", status="completed", message="done")
+        await asyncio.sleep(0.2)
+        await client.patch_step("exec-1", "s-1", message="follow-up")
+        await client.aclose()
+    
+    asyncio.run(run())
+    assert bodies == [
+        ("/api/executions/exec-1/steps/s-1", {"status": "completed", "message": "done"}),
+        ("/api/executions/exec-1/steps/s-2", {"status": "running"}),
+        ("/api/executions/exec-1/steps/s-1", {"message": "follow-up"}),
+    ]
+    print("✅ Coalescing test completed!")
+
+
+def test_spool_replays_after_outage():
+    """Test that writes made during an outage are spooled and replayed in order"""
+    print("\nTesting Spool Replay After Outage...")
+    
+    backend = {"up": False}
+    received = []
+    created_ids = []
+    
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if not backend["up"]:
+            raise httpx.ConnectError("connection refused", request=request)
+        if request.url.path != "/api/health":
+            received.append((request.method, request.url.path))
+        if request.method == "POST":
+            created_ids.append(json.loads(request.content).get("step_id"))
+            return httpx.Response(201, json={"success": True, "data": json.loads(request.content)})
+        return httpx.Response(200, json={"success": True, "data": {}})
+    
+    async def run(spool_path: str):
+        inner = AsyncHttpTaskManagerClient(transport=httpx.MockTransport(handler))
+        client = SpoolingTaskManagerClient(inner, SpoolFile(spool_path), replay_interval=0.05)
+        
+        result = await client.patch_execution("exec-1", "session-1")
+        assert result["success"] is True and result["spooled"] is True
+        await client.patch_step("exec-1", "s-1", status="completed")
+        
+        # A spooled create is given a step ID the caller can update right away
+        created = await client.create_step("exec-1", "testing")
+        step_id = created["data"]["step_id"]
+        assert created["spooled"] is True and len(step_id) == 26
+        await client.patch_step("exec-1", step_id, status="completed")
+        assert client.pending == 4
+        await client.aclose()
+        
+        # A fresh client picks up the spool left on disk
+        client = SpoolingTaskManagerClient(inner, SpoolFile(spool_path), replay_interval=0.05)
+        assert client.pending == 4
+        backend["up"] = True
+        await client.patch_step("exec-1", "s-1", message="after recovery")
+        for _ in range(40):
+            if not client.pending:
+                break
+            await asyncio.sleep(0.05)
+        await client.aclose()
+        return client.pending, step_id
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        spool_path = os.path.join(tmp, "spool.jsonl")
+        pending, step_id = asyncio.run(run(spool_path))
+        assert pending == 0
+        assert not os.path.exists(spool_path), "Replayed spool should be removed"
+    assert received == [
+        ("PATCH", "/api/executions/exec-1"),
+        ("PATCH", "/api/executions/exec-1/steps/s-1"),
+        ("POST", "/api/executions/exec-1/steps"),
+        ("PATCH", f"/api/executions/exec-1/steps/{step_id}"),
+        ("PATCH", "/api/executions/exec-1/steps/s-1"),
+    ]
+    assert created_ids == [step_id], "The replayed create carries the allocated step ID"
+    
+    # A record torn by a crash is cut off so the next append stays readable
+    with tempfile.TemporaryDirectory() as tmp:
+        spool_path = os.path.join(tmp, "spool.jsonl")
+        with open(spool_path, "wb") as f:
+            f.write(b'{"op":"patch_step","args":{}}\n{"op":"create_st')
+        spool = SpoolFile(spool_path)
+        assert spool.append({"op": "create_step", "args": {"step_name": "testing"}})
+        assert spool.read_all() == [
+            {"op": "patch_step", "args": {}},
+            {"op": "create_step", "args": {"step_name": "testing"}}
+        ]
+    print("✅ Spool replay test completed!")
+
+
+def test_write_behind_defers_client_id_creates():
+    """Test that creates with client-allocated IDs are queued ahead of their patches"""
+    print("\nTesting Deferred Create With Client Step ID...")
+    
+    requests = []
+    
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append((request.method, request.url.path, json.loads(request.content)))
+        return httpx.Response(201, json={"success": True, "data": {}})
+    
+    async def run():
+        inner = AsyncHttpTaskManagerClient(transport=httpx.MockTransport(handler))
+        client = WriteBehindTaskManagerClient(inner, coalesce_window=0.1)
+        created = await client.create_step("exec-1", "coding", step_id="01STEP")
+        assert created["queued"] is True and created["data"]["step_id"] == "01STEP"
+        await client.patch_step("exec-1", "01STEP", status="completed", message="done")
+        await client.aclose()
+    
+    asyncio.run(run())
+    assert requests == [(
+        "POST",
+        "/api/executions/exec-1/steps",
+        {"step_name": "coding", "step_id": "01STEP", "status": "completed", "message": "done"}
+    )], "A patch to a pending create should be folded into the create"
+    print("✅ Deferred create test completed!")
+
+
+if __name__ == "__main__":
+    test_async_mock_client()
+    test_async_factory_selection()
+    test_async_http_requests_overlap()
+    test_async_http_warm_up()
+    test_async_http_hedges_slow_reads()
+    test_async_http_singleflight_reads()
+    test_dashboard_sampler()
+    test_aiter_executions()
+    test_write_behind_step_updates()
+    test_write_behind_coalesces_patches()
+    test_write_behind_defers_client_id_creates()
+    test_spool_replays_after_outage()
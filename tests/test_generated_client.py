@@ -3,7 +3,10 @@
 Test generated HTTP client
 """
 
+import json
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 import sys
 from pathlib import Path
 
@@ -11,7 +14,19 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.clients import create_task_manager_client
+import httpx
+
+from src.clients import create_task_manager_client, HttpTaskManagerClient, iter_executions
+from src.clients import codec
+from src.clients.circuit_breaker import CircuitBreaker
+from src.clients.codec import JsonCodec, select_codec
+from src.clients.conditional import ConditionalCache
+from src.clients.generated._client import Client
+from src.clients.generated._client.api.tasks import get_api_tasks
+from src.clients.generated._client.models import GetApiTasksStatus
+from src.clients.latency import LatencyTracker
+from src.clients.retry import RetryBudget
+from src.clients.task_cache import TaskCache
 
 
 def test_generated_client():
@@ -90,7 +105,583 @@ def test_factory_selection():
     print("✅ Factory selection test completed!")
 
 
+def test_json_codec():
+    """Test codec selection and that requests go through the configured codec"""
+    print("\nTesting JSON Codec...")
+    
+    payload = {"step_name": "café", "count": 3, "nested": {"ok": True, "none": None}}
+    for name in ("auto", "json", "orjson", "msgspec"):
+        try:
+            codec = select_codec(name)
+        except ImportError:
+            continue
+        assert codec.loads(codec.dumps(payload)) == payload, codec
+    assert select_codec("json").dumps(payload) == json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+    try:
+        select_codec("yaml")
+        assert False, "Unknown codecs should be rejected"
+    except ValueError:
+        pass
+    
+    used = []
+    stdlib = select_codec("json")
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["Content-Type"] == "application/json"
+        return httpx.Response(200, content=stdlib.dumps({"success": True, "data": json.loads(request.content)}))
+    
+    client = HttpTaskManagerClient(transport=httpx.MockTransport(handler))
+    client.codec = JsonCodec(
+        "counting",
+        lambda obj: used.append("dumps") or stdlib.dumps(obj),
+        lambda data: used.append("loads") or stdlib.loads(data)
+    )
+    result = client.patch_execution("e-1", "session-1")
+    assert result["data"] == {"session_id": "session-1"} and used == ["dumps", "loads"]
+    client.close()
+    
+    print("✅ JSON codec test completed!")
+
+
+def test_http_client_connection_pool():
+    """Test that the HTTP client reuses one pooled httpx.Client"""
+    print("\nTesting HTTP Client Connection Pool...")
+    
+    requests = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"success": True, "data": {"step_id": "s-1"}})
+    
+    client = HttpTaskManagerClient(transport=httpx.MockTransport(handler))
+    client.create_step("exec-1", "analyzing")
+    pooled = client._client
+    client.patch_step("exec-1", "s-1", status="completed")
+    assert client._client is pooled, "Pooled client should be reused between calls"
+    assert len(requests) == 2
+    
+    client.close()
+    assert client._client is None, "close() should release the pooled client"
+    
+    # The client transparently reconnects after close()
+    result = client.patch_step("exec-1", "s-1", message="again")
+    assert result.get("success") == True
+    client.close()
+    
+    print("✅ Connection pool test completed!")
+
+
+def test_http_client_idempotency_header():
+    """Test that create_step sends an Idempotency-Key header"""
+    print("\nTesting Idempotency-Key Header...")
+    
+    keys = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        keys.append(request.headers.get("Idempotency-Key"))
+        return httpx.Response(201, json={"success": True, "data": {"step_id": "s-1"}})
+    
+    client = HttpTaskManagerClient(transport=httpx.MockTransport(handler))
+    client.create_step("exec-1", "analyzing")
+    client.create_step("exec-1", "analyzing")
+    client.create_step("exec-1", "analyzing", idempotency_key="fixed-key")
+    client.close()
+    
+    assert keys[0] and keys[1] and keys[0] != keys[1], "Each logical step gets its own key"
+    assert keys[2] == "fixed-key", "A caller-provided key is sent unchanged"
+    print("✅ Idempotency-Key header test completed!")
+
+
+def test_http_client_retries_transient_failures():
+    """Test retries with backoff and the retry budget"""
+    print("\nTesting Retry With Backoff...")
+    
+    calls = {"count": 0}
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["count"] += 1
+        if calls["count"] == 1:
+            raise httpx.ConnectError("connection reset", request=request)
+        if calls["count"] == 2:
+            return httpx.Response(503, json={"success": False, "error": "unavailable"})
+        return httpx.Response(200, json={"success": True, "data": {}})
+    
+    client = HttpTaskManagerClient(transport=httpx.MockTransport(handler))
+    client.retry_base_delay = 0.001
+    client.retry_budget = RetryBudget(ratio=0.2, max_tokens=10)
+    result = client.patch_step("exec-1", "s-1", status="completed")
+    assert result["success"] is True
+    assert result["attempts"] == 3, "Should succeed on the third attempt"
+    
+    # An exhausted budget turns the first transient failure into a final one
+    calls["count"] = 0
+    client.retry_budget = RetryBudget(ratio=0.0, max_tokens=10, initial_tokens=0)
+    result = client.patch_step("exec-1", "s-1", status="failed")
+    assert result["success"] is False and result["attempts"] == 1
+    client.close()
+    
+    print("✅ Retry test completed!")
+
+
+def test_skips_noop_patches():
+    """Test PATCHes matching the last acknowledged state are not sent"""
+    print("\nTesting No-op PATCH Skipping...")
+    
+    sent = []
+    fail = {"value": False}
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        sent.append((request.method, request.url.path, body))
+        if fail["value"]:
+            return httpx.Response(400, json={"success": False, "error": "bad request"})
+        if request.method == "POST":
+            return httpx.Response(200, json={"success": True, "data": {"step_id": "s-1", "status": "running", **body}})
+        return httpx.Response(200, json={"success": True, "data": body})
+    
+    client = HttpTaskManagerClient(transport=httpx.MockTransport(handler))
+    client.create_step("e-1", "coding", message="start")
+    skipped = client.patch_step("e-1", "s-1", status="running", message="start")
+    assert skipped["skipped"] is True and skipped["data"]["step_name"] == "coding" and len(sent) == 1
+    
+    client.patch_step("e-1", "s-1", status="completed")
+    assert client.patch_step("e-1", "s-1", status="completed", message="start").get("skipped") is True
+    assert client.patch_step("e-1", "s-1", message="done").get("skipped") is None
+    assert len(sent) == 3
+    
+    client.patch_execution("e-1", "session-1")
+    assert client.patch_execution("e-1", "session-1")["skipped"] is True
+    assert client.patch_execution("e-1", "session-2").get("skipped") is None and len(sent) == 5
+    
+    # After a failed write the backend state is unknown, so the next PATCH is sent
+    fail["value"] = True
+    client.patch_step("e-1", "s-1", status="failed")
+    fail["value"] = False
+    client.patch_step("e-1", "s-1", message="done")
+    assert len(sent) == 7
+    client.close()
+    
+    print("✅ No-op PATCH skipping test completed!")
+
+
+def test_http_client_circuit_breaker():
+    """Test the breaker opens on errors, fails fast and closes after a health probe"""
+    print("\nTesting Circuit Breaker...")
+    
+    state = {"healthy": False, "step_calls": 0, "probes": 0}
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/health":
+            state["probes"] += 1
+            status = 200 if state["healthy"] else 503
+            return httpx.Response(status, json={"status": "ok" if state["healthy"] else "down"})
+        state["step_calls"] += 1
+        return httpx.Response(500, json={"success": False, "error": "boom"})
+    
+    client = HttpTaskManagerClient(transport=httpx.MockTransport(handler))
+    client.max_retries = 0
+    client.breaker = CircuitBreaker(failure_rate_threshold=0.5, minimum_calls=3, open_seconds=0.05)
+    for _ in range(3):
+        client.patch_step("exec-1", "s-1", status="failed")
+    assert client.breaker.state == "open"
+    
+    result = client.patch_step("exec-1", "s-1", status="failed")
+    assert result["error_type"] == "circuit_open" and result["attempts"] == 0
+    assert state["step_calls"] == 3, "Open breaker should not reach the backend"
+    assert client.health_check()["circuit_breaker"]["state"] == "open"
+    
+    # A failed half-open probe re-opens the breaker; the probe is not retried
+    client.max_retries = 3
+    probes = state["probes"]
+    time.sleep(0.06)
+    result = client.patch_step("exec-1", "s-1", status="failed")
+    assert result["error_type"] == "circuit_open" and state["step_calls"] == 3
+    assert state["probes"] == probes + 1, "The half-open probe is a single attempt"
+    client.max_retries = 0
+    
+    # A healthy probe closes it and the call goes through
+    state["healthy"] = True
+    time.sleep(0.06)
+    client.patch_step("exec-1", "s-1", status="failed")
+    assert state["step_calls"] == 4
+    assert client.health_check()["circuit_breaker"]["state"] == "closed"
+    client.close()
+    
+    # Failures of the optional dashboard endpoint never open the breaker
+    client = HttpTaskManagerClient(transport=httpx.MockTransport(handler))
+    client.max_retries = 0
+    client.breaker = CircuitBreaker(failure_rate_threshold=0.5, minimum_calls=3, open_seconds=0.05)
+    for _ in range(5):
+        assert client.dashboard_health()["success"] is False
+    assert client.breaker.state == "closed"
+    client.close()
+    
+    # A response whose body cannot be decoded is one outcome, not two
+    client = HttpTaskManagerClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, text="<html>")))
+    result = client.patch_step("exec-1", "s-1", status="failed")
+    assert result["success"] is False and len(client.breaker._outcomes) == 1
+    client.close()
+    
+    print("✅ Circuit breaker test completed!")
+
+
+def test_adaptive_timeouts():
+    """Test that per-endpoint timeouts follow observed latency within bounds"""
+    print("\nTesting Adaptive Timeouts...")
+    
+    tracker = LatencyTracker(
+        default_timeout=30, min_timeout=1, max_timeout=30, multiplier=3, min_samples=5, connect_timeout=4, pool_timeout=2
+    )
+    assert tracker.timeout_seconds("GET /api/health") == 30, "Default until enough samples"
+    for _ in range(5):
+        tracker.record("GET /api/health", 0.01)
+        tracker.record("PATCH /api/executions/{execution_id}", 2.0)
+    assert tracker.timeout_seconds("GET /api/health") == 1, "Clamped to the lower bound"
+    assert tracker.timeout_seconds("PATCH /api/executions/{execution_id}") == 6.0
+    
+    timeout = tracker.timeout_for("PATCH /api/executions/{execution_id}")
+    assert (timeout.connect, timeout.read, timeout.write, timeout.pool) == (4, 6.0, 6.0, 2), "Connect/pool stay fixed"
+    
+    seen = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.extensions["timeout"]["read"])
+        return httpx.Response(200, json={"success": True, "data": {}})
+    
+    client = HttpTaskManagerClient(transport=httpx.MockTransport(handler))
+    client.latency = tracker
+    client.patch_execution("exec-1", "session-1")
+    client.patch_step("exec-1", "s-1", status="completed")
+    assert seen == [6.0, 30], f"Unexpected timeouts: {seen}"
+    client.close()
+    
+    # Timeout errors report the limit of the phase that timed out
+    def connect_timeout(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectTimeout("timed out", request=request)
+    
+    client = HttpTaskManagerClient(transport=httpx.MockTransport(connect_timeout))
+    client.latency = tracker
+    client.max_retries = 0
+    result = client.patch_execution("exec-1", "session-2")
+    assert result["error_type"] == "timeout" and result["error"] == "Request timeout after 4 seconds", result
+    client.close()
+    
+    print("✅ Adaptive timeout test completed!")
+
+
+def test_http_client_hedges_slow_reads():
+    """Test that a sync read slower than its p95 is hedged"""
+    print("\nTesting Sync Hedged Reads...")
+    
+    calls = {"count": 0}
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["count"] += 1
+        if calls["count"] == 1:
+            time.sleep(0.5)
+        return httpx.Response(200, json={"status": "ok"})
+    
+    client = HttpTaskManagerClient(transport=httpx.MockTransport(handler))
+    client.hedge_reads = True
+    for _ in range(client.latency.min_samples):
+        client.latency.record("GET /api/health", 0.01)
+    start = time.monotonic()
+    result = client.health_check()
+    elapsed = time.monotonic() - start
+    assert result["success"] is True and calls["count"] == 2
+    assert elapsed < 0.3, f"Hedge should answer before the slow attempt, took {elapsed:.2f}s"
+    client.close()
+    
+    print("✅ Sync hedged read test completed!")
+
+
+def test_http_client_singleflight_reads():
+    """Test that concurrent identical sync GETs share one request"""
+    print("\nTesting Sync Singleflight Reads...")
+    
+    calls = {"count": 0}
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["count"] += 1
+        time.sleep(0.2)
+        return httpx.Response(200, json={"status": "ok"})
+    
+    client = HttpTaskManagerClient(transport=httpx.MockTransport(handler))
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        results = list(pool.map(lambda _: client.health_check(), range(5)))
+    assert all(r["success"] for r in results)
+    assert calls["count"] == 1 and client._flight.shared == 4
+    client.close()
+    
+    print("✅ Sync singleflight test completed!")
+
+
+def test_health_check_cache():
+    """Test that health results are cached and refreshed in the background"""
+    print("\nTesting Health Check Cache...")
+    
+    calls = {"count": 0}
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["count"] += 1
+        if calls["count"] > 1:
+            time.sleep(0.1)
+        return httpx.Response(200, json={"status": "ok", "probe": calls["count"]})
+    
+    client = HttpTaskManagerClient(transport=httpx.MockTransport(handler))
+    client.health_cache_ttl = 0.05
+    assert client.health_check()["probe"] == 1
+    cached = client.health_check()
+    assert calls["count"] == 1 and cached["probe"] == 1, "Fresh result should come from cache"
+    assert "cache_age_seconds" in cached["config"]
+    
+    # An expired result is served at once while it is refreshed
+    time.sleep(0.06)
+    assert client.health_check()["probe"] == 1
+    for _ in range(50):
+        if not client._health_refreshing:
+            break
+        time.sleep(0.01)
+    assert client.health_check()["probe"] == 2
+    client.close()
+    
+    print("✅ Health check cache test completed!")
+
+
+def test_get_task_cache():
+    """Test the LRU/TTL task cache behind get_task"""
+    print("\nTesting Task Cache...")
+    
+    versions = {"t-1": "2024-01-01T00:00:02Z"}
+    calls = {"count": 0}
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["count"] += 1
+        task_id = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(200, json={
+            "success": True,
+            "data": {"task_id": task_id, "status": "running", "updated_at": versions.get(task_id, "2024")}
+        })
+    
+    client = HttpTaskManagerClient(transport=httpx.MockTransport(handler))
+    client.task_cache = TaskCache(max_entries=2, ttl=30)
+    assert client.get_task("t-1")["cached"] is False
+    cached = client.get_task("t-1")
+    assert cached["cached"] is True and cached["data"]["status"] == "running" and calls["count"] == 1
+    assert client.get_task("t-1", use_cache=False)["cached"] is False and calls["count"] == 2
+    
+    # A response carrying an older version does not replace the cached one
+    versions["t-1"] = "2024-01-01T00:00:01Z"
+    stale = client.get_task("t-1", use_cache=False)
+    assert stale["data"]["updated_at"] == "2024-01-01T00:00:02Z"
+    
+    # The least recently used task is evicted
+    client.get_task("t-2")
+    client.get_task("t-3")
+    assert len(client.task_cache) == 2 and client.task_cache.get("t-1") is None
+    client.close()
+    
+    print("✅ Task cache test completed!")
+
+
+def test_active_execution_cache():
+    """Test active-execution lookups are cached, negatively cached and invalidated by writes"""
+    print("\nTesting Active Execution Cache...")
+    
+    lookups = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            task_id = request.url.path.split("/")[3]
+            lookups.append(task_id)
+            if task_id == "t-idle":
+                return httpx.Response(404, json={"success": False, "error": "no active execution"})
+            if task_id == "t-null":
+                return httpx.Response(200, json={"success": True, "data": None})
+            return httpx.Response(200, json={
+                "success": True,
+                "data": {"execution_id": "e-1", "task_id": task_id, "status": "running"}
+            })
+        return httpx.Response(200, json={"success": True, "data": {}})
+    
+    client = HttpTaskManagerClient(transport=httpx.MockTransport(handler))
+    first = client.get_active_execution("t-1")
+    assert first["active"] is True and first["cached"] is False and first["data"]["execution_id"] == "e-1"
+    assert client.get_active_execution("t-1")["cached"] is True and lookups == ["t-1"]
+    
+    idle = client.get_active_execution("t-idle")
+    assert idle["success"] is True and idle["active"] is False and idle["data"] is None
+    assert client.get_active_execution("t-idle")["cached"] is True and lookups == ["t-1", "t-idle"]
+    
+    # A null data field also means no active execution
+    null = client.get_active_execution("t-null")
+    assert null["success"] is True and null["active"] is False and null["data"] is None
+    assert client.get_active_execution("t-null")["cached"] is True
+    lookups.remove("t-null")
+    
+    # A write to the cached execution invalidates its task only
+    client.patch_step("e-1", "s-1", status="completed")
+    assert client.get_active_execution("t-1")["cached"] is False
+    assert client.get_active_execution("t-idle")["cached"] is True
+    
+    # A write to an unknown execution may have started work on an "idle" task
+    client.create_step("e-new", "coding")
+    assert client.get_active_execution("t-idle")["cached"] is False
+    assert client.get_active_execution("t-1", use_cache=False)["cached"] is False
+    assert lookups == ["t-1", "t-idle", "t-1", "t-idle", "t-1"]
+    client.close()
+    
+    print("✅ Active execution cache test completed!")
+
+
+def test_conditional_get():
+    """Test ETag revalidation through the generated client"""
+    print("\nTesting Conditional GET...")
+    
+    seen = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(
+            200,
+            headers={"ETag": '"v1"'},
+            json={"success": True, "data": {"tasks": [{"task_id": "t-1", "status": "running"}]}}
+        )
+    
+    client = Client(base_url="http://task-manager", httpx_args={"transport": httpx.MockTransport(handler)})
+    cache = ConditionalCache()
+    first = cache.sync(get_api_tasks, client=client)
+    second = cache.sync(get_api_tasks, client=client)
+    assert seen == [None, '"v1"'], f"Unexpected validators sent: {seen}"
+    assert second is first, "304 should serve the cached parsed model"
+    assert cache.not_modified == 1
+    
+    # Different arguments are cached separately
+    cache.sync(get_api_tasks, client=client, status=GetApiTasksStatus.RUNNING)
+    assert seen[-1] is None and len(cache) == 2
+    
+    print("✅ Conditional GET test completed!")
+
+
+def executions_handler(total: int, requested: list):
+    """Mock /api/executions handler serving ``total`` executions page by page"""
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        limit = int(request.url.params["limit"])
+        requested.append(page)
+        start = (page - 1) * limit
+        executions = [{"execution_id": f"e-{i}"} for i in range(start, min(start + limit, total))]
+        return httpx.Response(200, json={
+            "success": True,
+            "data": {"executions": executions, "page": page, "limit": limit, "total_count": total}
+        })
+    return handler
+
+
+def test_iter_executions():
+    """Test streaming executions across pages with prefetch"""
+    print("\nTesting Paginated Executions Iterator...")
+    
+    requested = []
+    client = Client(
+        base_url="http://task-manager",
+        httpx_args={"transport": httpx.MockTransport(executions_handler(9, requested))}
+    )
+    ids = [e.execution_id for e in iter_executions(client, limit=2, prefetch=2)]
+    assert ids == [f"e-{i}" for i in range(9)]
+    assert sorted(requested) == [1, 2, 3, 4, 5], f"Should stop at the last page: {requested}"
+    
+    # Breaking out early stops fetching further pages
+    requested.clear()
+    for execution in iter_executions(client, limit=2, prefetch=1):
+        if execution.execution_id == "e-2":
+            break
+    assert max(requested) <= 3
+    
+    # Pages are decoded with the configured JSON codec
+    used = []
+    stdlib = select_codec("json")
+    previous = codec._default
+    codec._default = JsonCodec("counting", stdlib.dumps, lambda data: used.append(len(data)) or stdlib.loads(data))
+    try:
+        assert len(list(iter_executions(client, limit=5))) == 9
+    finally:
+        codec._default = previous
+    assert len(used) == 2, f"Expected both pages decoded by the codec, got {used}"
+    
+    print("✅ Paginated iterator test completed!")
+
+
+def test_tail_logs():
+    """Test incremental log tailing with and without server-side offsets"""
+    print("\nTesting Log Tailing...")
+    
+    log = [f"line {i}" for i in range(5)]
+    honour_offset = {"value": False}
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        lines = int(request.url.params["lines"])
+        offset = request.url.params.get("offset")
+        data = {"total_lines": len(log)}
+        if honour_offset["value"] and offset is not None:
+            data.update(logs=log[int(offset):int(offset) + lines], offset=int(offset))
+        else:
+            data.update(logs=log[-lines:])
+        return httpx.Response(200, json={"success": True, "data": data})
+    
+    client = HttpTaskManagerClient(transport=httpx.MockTransport(handler))
+    first = client.tail_logs(max_lines=3)["data"]
+    assert first["lines"] == ["line 2", "line 3", "line 4"] and first["truncated"] is False
+    
+    # The server ignores offset and returns the tail; only unseen lines come back
+    log.extend(["line 5", "line 6"])
+    second = client.tail_logs(max_lines=3)["data"]
+    assert second["lines"] == ["line 5", "line 6"], second
+    assert client.tail_logs(max_lines=3)["data"]["lines"] == []
+    
+    # Lines that scrolled out of the tail are reported as truncated
+    log.extend(f"line {i}" for i in range(7, 12))
+    gap = client.tail_logs(max_lines=3)["data"]
+    assert gap["lines"] == ["line 9", "line 10", "line 11"] and gap["truncated"] is True
+    
+    # A server honouring offset pages forward from the cursor
+    honour_offset["value"] = True
+    log.extend(f"line {i}" for i in range(12, 17))
+    page = client.tail_logs(max_lines=3)["data"]
+    assert page["lines"] == ["line 12", "line 13", "line 14"] and page["more"] is True
+    assert client.tail_logs(max_lines=3)["data"]["lines"] == ["line 15", "line 16"]
+    
+    # An explicit cursor replays from that point; a malformed one is rejected
+    assert client.tail_logs(cursor=second["cursor"], max_lines=2)["data"]["lines"] == ["line 7", "line 8"]
+    assert client.tail_logs(cursor="bogus")["success"] is False
+    
+    # A rotated log starts over from its beginning
+    honour_offset["value"] = False
+    log[:] = ["fresh 0", "fresh 1"]
+    rotated = client.tail_logs(max_lines=3)["data"]
+    assert rotated["lines"] == ["fresh 0", "fresh 1"] and rotated["truncated"] is False
+    client.close()
+    
+    print("✅ Log tailing test completed!")
+
+
 if __name__ == "__main__":
     test_factory_selection()
     test_generated_client()
-
+    test_json_codec()
+    test_http_client_connection_pool()
+    test_http_client_idempotency_header()
+    test_http_client_retries_transient_failures()
+    test_skips_noop_patches()
+    test_http_client_circuit_breaker()
+    test_adaptive_timeouts()
+    test_http_client_hedges_slow_reads()
+    test_http_client_singleflight_reads()
+    test_health_check_cache()
+    test_get_task_cache()
+    test_active_execution_cache()
+    test_conditional_get()
+    test_iter_executions()
+    test_tail_logs()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Tests for the MCP tool layer
+"""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+os.environ['USE_MOCK_CLIENT'] = 'true'
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.server.mcp_tools import get_task_client, mcp
+
+# The client is built lazily; build the mock one now, since other test
+# modules change USE_MOCK_CLIENT before these tests run under pytest
+get_task_client()
+
+
+def call_tool(name, arguments):
+    """Call an MCP tool in-process and return its structured result"""
+    result = asyncio.run(mcp.call_tool(name, arguments))
+    return result.structured_content
+
+
+def test_report_steps():
+    """Test batch step reporting with per-step ordering and per-operation results"""
+    print("Testing report_steps...")
+    
+    step_id = call_tool("create_step", {"execution_id": "exec-batch", "step_name": "analyzing"})["step_id"]
+    
+    result = call_tool("report_steps", {
+        "execution_id": "exec-batch",
+        "operations": [
+            {"action": "create", "step_name": "coding"},
+            {"action": "update", "step_id": step_id, "message": "halfway"},
+            {"action": "update", "step_id": step_id, "status": "completed", "message": "done"},
+            {"action": "update", "step_id": step_id},
+            {"action": "delete", "step_id": step_id},
+        ]
+    })
+    
+    results = result["results"]
+    assert result["success"] is False
+    assert [r["index"] for r in results] == [0, 1, 2, 3, 4]
+    assert [r["success"] for r in results] == [True, True, True, False, False]
+    assert results[0]["step_id"]
+    assert results[2]["data"]["status"] == "completed"
+    assert results[2]["data"]["message"] == "done", "Updates to one step should apply in order"
+    
+    # Background delivery failures are attached once, to the batch result
+    client = get_task_client()
+    pending = [{"operation": "patch_step", "error": "boom"}]
+    client.drain_delivery_failures = lambda: [pending.pop()] if pending else []
+    try:
+        result = call_tool("report_steps", {
+            "execution_id": "exec-batch",
+            "operations": [{"action": "create", "step_name": "testing"}, {"action": "create", "step_name": "review"}]
+        })
+    finally:
+        del client.drain_delivery_failures
+    assert result["delivery_failures"] == [{"operation": "patch_step", "error": "boom"}]
+    assert all("delivery_failures" not in r for r in result["results"])
+    print("✅ report_steps test completed!")
+
+
+def test_get_task():
+    """Test the get_task tool"""
+    print("\nTesting get_task...")
+    
+    result = call_tool("get_task", {"task_id": "task-42"})
+    assert result["success"] is True
+    assert result["data"]["task_id"] == "task-42"
+    assert call_tool("get_task", {"task_id": "task-42", "bypass_cache": True})["success"] is True
+    print("✅ get_task test completed!")
+
+
+def test_get_active_execution():
+    """Test the get_active_execution tool"""
+    print("\nTesting get_active_execution...")
+    
+    result = call_tool("get_active_execution", {"task_id": "task-idle"})
+    assert result["success"] is True and result["active"] is False and result["data"] is None
+    assert call_tool("get_active_execution", {"task_id": "task-idle", "bypass_cache": True})["success"] is True
+    
+    get_task_client().add_execution("exec-active", "task-busy")
+    result = call_tool("get_active_execution", {"task_id": "task-busy"})
+    assert result["success"] is True and result["active"] is True
+    assert result["data"]["execution_id"] == "exec-active" and result["data"]["status"] == "running"
+    
+    get_task_client().add_execution("exec-active", "task-busy", status="completed")
+    assert call_tool("get_active_execution", {"task_id": "task-busy"})["active"] is False
+    print("✅ get_active_execution test completed!")
+
+
+def test_tail_logs():
+    """Test the tail_logs tool only returns lines written since the last call"""
+    print("\nTesting tail_logs...")
+    
+    start = call_tool("tail_logs", {})["data"]["cursor"]
+    call_tool("update_execution_session", {"execution_id": "exec-logs", "session_id": "s-1"})
+    result = call_tool("tail_logs", {"max_lines": 10})
+    assert result["success"] is True
+    assert len(result["data"]["lines"]) == 1 and "exec-logs" in result["data"]["lines"][0]
+    assert call_tool("tail_logs", {})["data"]["lines"] == []
+    replay = call_tool("tail_logs", {"cursor": start})
+    assert replay["data"]["lines"] == result["data"]["lines"]
+    assert call_tool("tail_logs", {"max_lines": 0})["success"] is False
+    print("✅ tail_logs test completed!")
+
+
+def test_dashboard_stats():
+    """Test dashboard_stats summarises background samples"""
+    print("\nTesting dashboard_stats...")
+    
+    result = call_tool("dashboard_stats", {})
+    assert result["success"] is True and result["samples"] >= 1
+    cpu = result["windows"]["1m"]["cpu_percent"]
+    assert cpu["count"] >= 1 and cpu["min"] <= cpu["p50"] <= cpu["p95"] <= cpu["max"]
+    assert set(result["windows"]) == {"1m", "5m", "1h"}
+    print("✅ dashboard_stats test completed!")
+
+
+if __name__ == "__main__":
+    test_report_steps()
+    test_get_task()
+    test_get_active_execution()
+    test_tail_logs()
+    test_dashboard_stats()
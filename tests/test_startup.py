@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Tests for MCP server start-up cost
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+
+# Seconds `import server` may take on top of fastmcp's own import
+IMPORT_BUDGET = float(os.getenv('TASK_MANAGER_IMPORT_BUDGET', '0.5'))
+
+
+def run_fresh(code: str) -> dict:
+    """Run code in a new interpreter set up like task_manager_mcp.py and return its JSON output"""
+    script = f"""
+import json, sys, time
+sys.path.insert(0, {str(project_root)!r})
+sys.path.insert(0, {str(project_root / 'src')!r})
+{code}
+"""
+    env = {**os.environ, "USE_MOCK_CLIENT": "true"}
+    output = subprocess.run(
+        [sys.executable, "-c", script], cwd=project_root, env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def test_import_defers_client():
+    """Test importing the server builds no client and loads no HTTP stack"""
+    print("Testing Lazy Imports...")
+    
+    result = run_fresh("""
+import server
+from server import mcp_tools
+print(json.dumps({
+    "client_built": mcp_tools._task_client is not None,
+    "loaded": sorted(m for m in ("httpx", "src.clients.generated", "src.clients.http_client",
+                                 "src.clients.async_http_client", "src.clients.mock_client") if m in sys.modules)
+}))
+""")
+    assert result["client_built"] is False, "The client should be built on first tool use"
+    assert result["loaded"] == [], f"Imported eagerly: {result['loaded']}"
+    print("✅ Lazy import test completed!")
+
+
+def test_import_budget():
+    """Test `import server` stays within its time budget"""
+    print("\nTesting Import Budget...")
+    
+    result = run_fresh("""
+started = time.perf_counter()
+import fastmcp
+fastmcp.FastMCP
+fastmcp_seconds = time.perf_counter() - started
+started = time.perf_counter()
+import server
+print(json.dumps({"fastmcp": fastmcp_seconds, "server": time.perf_counter() - started}))
+""")
+    print(f"   fastmcp: {result['fastmcp']:.3f}s, server on top: {result['server']:.3f}s (budget {IMPORT_BUDGET}s)")
+    assert result["server"] <= IMPORT_BUDGET, f"import server took {result['server']:.3f}s"
+    print("✅ Import budget test completed!")
+
+
+def test_client_singleton():
+    """Test concurrent first calls share one lazily built client"""
+    print("\nTesting Client Singleton...")
+    
+    result = run_fresh("""
+from concurrent.futures import ThreadPoolExecutor
+from server import mcp_tools
+with ThreadPoolExecutor(max_workers=8) as pool:
+    clients = list(pool.map(lambda _: mcp_tools.get_task_client(), range(32)))
+print(json.dumps({"distinct": len({id(c) for c in clients}), "type": type(clients[0]).__name__}))
+""")
+    assert result == {"distinct": 1, "type": "AsyncMockTaskManagerClient"}, result
+    print("✅ Client singleton test completed!")
+
+
+def test_warm_up_in_background():
+    """Test the start-up warm-up does not hold up the server lifespan"""
+    print("\nTesting Background Warm-up...")
+    
+    result = run_fresh("""
+import asyncio, os
+os.environ['TASK_MANAGER_WARMUP'] = 'true'
+from server import mcp_tools
+async def main():
+    async with mcp_tools._lifespan(mcp_tools.mcp):
+        built_at_start = mcp_tools._task_client is not None
+        for _ in range(100):
+            if mcp_tools._task_client is not None:
+                break
+            await asyncio.sleep(0.05)
+        return {"built_at_start": built_at_start, "built_later": mcp_tools._task_client is not None}
+print(json.dumps(asyncio.run(main())))
+""")
+    assert result == {"built_at_start": False, "built_later": True}, result
+    print("✅ Background warm-up test completed!")
+
+
+if __name__ == "__main__":
+    test_import_defers_client()
+    test_import_budget()
+    test_client_singleton()
+    test_warm_up_in_background()